@@ -0,0 +1,14 @@
+# เล่นนอก Maya (ใช้ LocalBackend แทนฉาก Maya): python run_standalone.py
+import os
+import sys
+
+from PySide6 import QtWidgets
+
+# ต้องมี QApplication ก่อน import หน้า UI (โหลดฟอนต์ตอน import)
+app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import wellDoneGameUi as wdui
+
+wdui.run()
+sys.exit(app.exec())
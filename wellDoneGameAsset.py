@@ -0,0 +1,359 @@
+import os
+import json
+from collections import OrderedDict
+from PySide6 import QtCore, QtGui
+
+try:
+    from . import wellDoneGameLog as wdlog
+except Exception:
+    import wellDoneGameLog as wdlog
+
+log = wdlog.get_logger('asset')
+
+IMAGE_PATH = os.path.join(os.path.dirname(__file__), 'source_image', 'image')
+ATLAS_PATH = os.path.join(os.path.dirname(__file__), 'source_image', 'atlas')
+ATLAS_INDEX = os.path.join(ATLAS_PATH, 'sprites.json')
+
+# จำนวน pixmap สูงสุดที่เก็บไว้ในหน่วยความจำ (นับแยกตามขนาดที่ขอ)
+CACHE_LIMIT = 128
+
+# วัตถุดิบที่มีในเกม (ใช้สร้างชื่อไฟล์ icon / chopped)
+INGREDIENTS = ('tomato', 'lettuce', 'cucamber')
+
+# ไฟล์ภาพที่โค้ดอ้างถึงโดยตรง → ตรวจตอนเริ่มเกมว่ามีครบไหม
+REFERENCED_ASSETS = (
+    'background.png', 'Bg_base.png', 'Howtoplay1.png', 'Howtoplay2.png', 'Howtoplay3.png',
+    'bg_kitchen.png', 'bg_order.png', 'pause_bg.png',
+    'back_icon.png', 'home_icon.png', 'next_icon.png', 'pause_icon.png',
+    'continue_icon.png', 'quit_icon.png', 'restart_icon.png',
+    'chef.png', 'pot.png', 'chopping_board.png', 'serve_station.png',
+    'plate_station.png', 'trash_bin.png', 'table.png',
+    'tomato.png', 'lettuce.png', 'cucamber.png',
+    'plate.png', 'plate_icon.png', 'tomato_soup.png', 'plate_tomato_soup_icon.png',
+) + tuple(f'{n}_icon.png' for n in INGREDIENTS) + tuple(f'{n}_chopped_icon.png' for n in INGREDIENTS)
+
+
+class AssetManifest(object):
+    """
+    รายชื่อไฟล์ภาพทั้งหมด สร้างครั้งเดียวตอน import
+    ใช้แทน os.path.exists / os.listdir ที่เคยเรียกทุกครั้งที่กดปุ่ม
+    """
+
+    def __init__(self, image_dir=IMAGE_PATH, extra_names=()):
+        try:
+            names = os.listdir(image_dir)
+        except OSError:
+            names = []
+        self.names = frozenset(names) | frozenset(extra_names)
+        # order_<menu>.png → รายการเมนูที่สั่งได้
+        self.orders = tuple(sorted(
+            n[len('order_'):-4] for n in self.names
+            if n.startswith('order_') and n.lower().endswith('.png')
+        ))
+        # plate_<menu>.png → ภาพจานที่ทำเมนูสำเร็จ
+        self.plates = frozenset(
+            n[len('plate_'):-4] for n in self.names
+            if n.startswith('plate_') and n.lower().endswith('.png')
+        )
+
+    def __contains__(self, name):
+        return name in self.names
+
+    def icon_name(self, item_name):
+        name = f'{item_name}_icon.png'
+        return name if name in self.names else None
+
+    def chopped_icon_name(self, item_name):
+        return self.icon_name(f'{item_name}_chopped')
+
+    def plate_image(self, combo_name):
+        """ภาพจานของเมนู ถ้าไม่มีใช้ plate.png"""
+        if combo_name in self.plates:
+            return f'plate_{combo_name}.png'
+        return 'plate.png'
+
+    def missing(self, names=REFERENCED_ASSETS):
+        return [n for n in names if n not in self.names]
+
+
+class SpriteAtlas(object):
+    """
+    อ่าน sprites.json ที่สร้างจาก wellDoneGameAtlas แล้วตัด sub-rect ออกมาจากหน้า atlas
+    แต่ละหน้า decode แค่ครั้งเดียว
+    """
+
+    def __init__(self, index_path=ATLAS_INDEX):
+        self.index_path = index_path
+        self.sprites = {}
+        self.page_names = []
+        self._pages = {}
+        if os.path.exists(index_path):
+            try:
+                with open(index_path, 'r', encoding='utf-8') as fh:
+                    index = json.load(fh)
+                self.sprites = index.get('sprites', {})
+                self.page_names = index.get('pages', [])
+            except Exception as e:
+                log.warning('⚠️ อ่าน atlas index ไม่ได้: %s', e)
+                self.sprites = {}
+                self.page_names = []
+
+    def __contains__(self, name):
+        return name in self.sprites
+
+    def _page(self, page):
+        pix = self._pages.get(page)
+        if pix is None:
+            path = os.path.join(os.path.dirname(self.index_path), self.page_names[page])
+            pix = QtGui.QPixmap(path)
+            self._pages[page] = pix
+        return pix
+
+    def pixmap(self, name):
+        rect = self.sprites[name]
+        page = self._page(rect['page'])
+        if page.isNull():
+            return page
+        return page.copy(rect['x'], rect['y'], rect['w'], rect['h'])
+
+    def preload(self):
+        for i in range(len(self.page_names)):
+            self._page(i)
+        return len(self._pages)
+
+
+class PixmapCache(object):
+    """
+    cache ของ QPixmap ที่ decode แล้ว แบบ LRU
+    key = (ชื่อไฟล์, ขนาดเป้าหมาย, keep_aspect) → ไม่ต้อง decode PNG ซ้ำทุกครั้งที่หยิบ/วาง
+    """
+
+    def __init__(self, limit=CACHE_LIMIT, atlas=None):
+        self.limit = limit
+        self.atlas = atlas
+        self._items = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.atlas_loads = 0
+
+    def get(self, name, size=None, keep_aspect=False):
+        if size is not None and not isinstance(size, tuple):
+            size = (size.width(), size.height())
+        key = (name, size, keep_aspect)
+
+        pix = self._items.get(key)
+        if pix is not None:
+            self._items.move_to_end(key)
+            self.hits += 1
+            return pix
+
+        self.misses += 1
+        if size is None:
+            pix = self._load(name)
+        else:
+            # ใช้ภาพเต็มขนาดจาก cache เป็นต้นฉบับ แล้วค่อย scale
+            source = self._source(name)
+            mode = QtCore.Qt.KeepAspectRatio if keep_aspect else QtCore.Qt.IgnoreAspectRatio
+            if source.isNull():
+                pix = source
+            else:
+                pix = source.scaled(size[0], size[1], mode, QtCore.Qt.SmoothTransformation)
+
+        self._insert(key, pix)
+        return pix
+
+    def _load(self, name):
+        """decode ภาพเต็มขนาด (จาก atlas ถ้ามี)"""
+        if self.atlas is not None and name in self.atlas:
+            self.atlas_loads += 1
+            return self.atlas.pixmap(name)
+        return QtGui.QPixmap(os.path.join(IMAGE_PATH, name))
+
+    def _source(self, name):
+        """ภาพเต็มขนาดที่ใช้ scale: หาใน LRU/ใส่ LRU เหมือน get() แต่ไม่นับ hits/misses"""
+        key = (name, None, False)
+        pix = self._items.get(key)
+        if pix is not None:
+            self._items.move_to_end(key)
+            return pix
+        pix = self._load(name)
+        self._insert(key, pix)
+        return pix
+
+    def _insert(self, key, pix):
+        self._items[key] = pix
+        self._items.move_to_end(key)
+        while len(self._items) > self.limit:
+            self._items.popitem(last=False)
+            self.evictions += 1
+
+    def peek(self, name, size=None, keep_aspect=False):
+        """ดูว่ามีใน cache แล้วหรือยัง (ไม่ decode ถ้ายังไม่มี)"""
+        return self._items.get((name, size, keep_aspect))
+
+    def put(self, name, pix, size=None, keep_aspect=False):
+        self._insert((name, size, keep_aspect), pix)
+
+    def clear(self):
+        self._items.clear()
+
+    def stats(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'atlas_loads': self.atlas_loads,
+            'size': len(self._items),
+            'limit': self.limit,
+        }
+
+
+_atlas = SpriteAtlas()
+_cache = PixmapCache(atlas=_atlas)
+manifest = AssetManifest(extra_names=_atlas.sprites.keys())
+
+
+def has_asset(name):
+    return name in manifest
+
+
+def order_catalog():
+    """รายชื่อเมนูจากไฟล์ order_*.png (list ใหม่ทุกครั้ง)"""
+    return list(manifest.orders)
+
+
+def validate_manifest(names=REFERENCED_ASSETS):
+    """ตรวจว่าไฟล์ภาพที่โค้ดใช้มีอยู่จริง → คืนรายชื่อที่หายไป"""
+    missing = manifest.missing(names)
+    for name in missing:
+        log.warning('⚠️ ไม่พบไฟล์ภาพที่เกมอ้างถึง: %s', name)
+    return missing
+
+
+def get_pixmap(name, size=None, keep_aspect=False):
+    """
+    คืน QPixmap ของไฟล์ใน source_image/image จาก cache กลาง
+    name: ชื่อไฟล์ เช่น 'plate.png'
+    size: (w, h) หรือ QSize ถ้าต้องการภาพที่ scale ไว้แล้ว
+    """
+    return _cache.get(name, size, keep_aspect)
+
+
+def preload_atlas():
+    """decode หน้า atlas ทั้งหมดครั้งเดียวตอนเปิดเกม (ถ้ามี atlas)"""
+    if _cache.atlas is None:
+        return 0
+    return _cache.atlas.preload()
+
+
+def cache_stats():
+    """ตัวนับ hit/miss ของ cache (ไว้ดูตอน debug ว่า decode ซ้ำหรือไม่)"""
+    return _cache.stats()
+
+
+def clear_cache():
+    _cache.clear()
+
+
+# ------------------- โหลดภาพพื้นหลังใหญ่ใน thread แยก -------------------
+PLACEHOLDER_COLOR = '#3b2a1e'
+
+
+class _ImageLoadTask(QtCore.QRunnable):
+    """decode ไฟล์เป็น QImage ใน worker thread (QPixmap ต้องสร้างบน UI thread เท่านั้น)"""
+
+    def __init__(self, loader, name, path):
+        super().__init__()
+        self.loader = loader
+        self.name = name
+        self.path = path
+
+    def run(self):
+        image = QtGui.QImage(self.path)
+        self.loader.loaded.emit(self.name, image)
+
+
+class BackgroundLoader(QtCore.QObject):
+    """
+    โหลดภาพขนาดใหญ่ (background, bg_kitchen, pause_bg, Howtoplay*) บน QThreadPool
+    ระหว่างรอจะส่ง placeholder ให้ก่อน แล้วค่อยสลับเป็นภาพจริงบน UI thread
+    """
+    loaded = QtCore.Signal(str, QtGui.QImage)
+
+    def __init__(self, cache, parent=None):
+        super().__init__(parent)
+        self.cache = cache
+        self.pending = {}
+        self.pool = QtCore.QThreadPool.globalInstance()
+        self._placeholder = None
+        # signal มาจาก worker thread → Qt ส่งต่อแบบ queued มาที่ UI thread
+        self.loaded.connect(self._deliver)
+
+    def placeholder(self):
+        if self._placeholder is None:
+            self._placeholder = QtGui.QPixmap(8, 8)
+            self._placeholder.fill(QtGui.QColor(PLACEHOLDER_COLOR))
+        return self._placeholder
+
+    def request(self, name, callback=None):
+        pix = self.cache.peek(name)
+        if pix is not None:
+            if callback is not None:
+                callback(pix)
+            return pix
+
+        if callback is not None:
+            callback(self.placeholder())
+
+        if name in self.pending:
+            if callback is not None:
+                self.pending[name].append(callback)
+            return None
+
+        self.pending[name] = [callback] if callback is not None else []
+        self.pool.start(_ImageLoadTask(self, name, os.path.join(IMAGE_PATH, name)))
+        return None
+
+    @QtCore.Slot(str, QtGui.QImage)
+    def _deliver(self, name, image):
+        pix = QtGui.QPixmap.fromImage(image)
+        self.cache.put(name, pix)
+        for callback in self.pending.pop(name, []):
+            try:
+                callback(pix)
+            except RuntimeError:
+                # widget ถูกลบไปก่อนภาพโหลดเสร็จ
+                pass
+
+
+_loader = None
+
+
+def _get_loader():
+    global _loader
+    if _loader is None:
+        _loader = BackgroundLoader(_cache)
+    return _loader
+
+
+def load_pixmap_async(name, callback):
+    """
+    ขอภาพแบบไม่บล็อก UI: callback จะถูกเรียกทันทีด้วย placeholder
+    และถูกเรียกอีกครั้งด้วยภาพจริงเมื่อ decode เสร็จ (ถ้าอยู่ใน cache แล้วจะได้ภาพจริงเลย)
+    """
+    return _get_loader().request(name, callback)
+
+
+def is_placeholder(pix):
+    """True ถ้า pix เป็น placeholder ที่ load_pixmap_async ส่งให้ระหว่างรอภาพจริง"""
+    loader = _loader
+    return loader is not None and loader._placeholder is not None \
+        and pix.cacheKey() == loader._placeholder.cacheKey()
+
+
+def prefetch(names):
+    """เริ่ม decode ภาพล่วงหน้าโดยยังไม่ต้องมี widget รอรับ"""
+    loader = _get_loader()
+    for name in names:
+        loader.request(name)
@@ -0,0 +1,153 @@
+"""
+สร้าง sprite atlas จากภาพเล็ก ๆ ใน source_image/image (ทำ offline ครั้งเดียว)
+
+    python wellDoneGameAtlas.py [--max-side 256] [--page-size 2048]
+
+ผลลัพธ์อยู่ที่ source_image/atlas/
+    sprites_0.png, sprites_1.png, ...   ภาพ atlas แต่ละหน้า
+    sprites.json                        ตำแหน่ง (rect) ของแต่ละ sprite
+wellDoneGameAsset จะอ่าน sprites.json ตอนรันเกม ถ้าไม่มีไฟล์นี้จะโหลดภาพแยกไฟล์เหมือนเดิม
+"""
+import os
+import sys
+import json
+import argparse
+
+IMAGE_PATH = os.path.join(os.path.dirname(__file__), 'source_image', 'image')
+ATLAS_PATH = os.path.join(os.path.dirname(__file__), 'source_image', 'atlas')
+INDEX_NAME = 'sprites.json'
+PAGE_NAME = 'sprites_{}.png'
+
+# ภาพที่ไม่เอาเข้า atlas: พื้นหลังขนาดใหญ่ และปุ่มที่ใช้ผ่าน QIcon(path)
+ATLAS_EXCLUDE = {
+    'Bg_base.png', 'Howtoplay1.png', 'Howtoplay2.png', 'Howtoplay3.png',
+    'background.png', 'bg_kitchen.png', 'bg_order.png', 'pause_bg.png',
+    'back_icon.png', 'home_icon.png', 'next_icon.png', 'continue_icon.png',
+    'quit_icon.png', 'restart_icon.png', 'pause_icon.png',
+    'order1.png', 'order2.png', 'order3.png',
+}
+
+MAX_SIDE = 256
+PAGE_SIZE = 2048
+PADDING = 2
+
+
+def atlas_sources(image_dir=IMAGE_PATH):
+    """รายชื่อไฟล์ที่จะรวมเข้า atlas (icons, จาน, order, station)"""
+    return sorted(
+        f for f in os.listdir(image_dir)
+        if f.lower().endswith('.png') and f not in ATLAS_EXCLUDE
+    )
+
+
+def fit_size(w, h, max_side=MAX_SIDE):
+    """ย่อขนาดให้ด้านยาวสุดไม่เกิน max_side (ไม่ขยาย)"""
+    longest = max(w, h)
+    if longest <= max_side:
+        return w, h
+    scale = max_side / float(longest)
+    return max(1, int(round(w * scale))), max(1, int(round(h * scale)))
+
+
+def pack_rects(sizes, page_size=PAGE_SIZE, padding=PADDING):
+    """
+    จัดวางสี่เหลี่ยมแบบ shelf (เรียงจากสูงไปต่ำ) ลงหลายหน้า
+    sizes: {name: (w, h)}
+    return: {name: (page, x, y, w, h)}
+    """
+    order = sorted(sizes, key=lambda n: (-sizes[n][1], -sizes[n][0], n))
+    placed = {}
+    page = 0
+    x = y = shelf_h = 0
+
+    for name in order:
+        w, h = sizes[name]
+        if w + padding > page_size or h + padding > page_size:
+            raise ValueError(f'sprite {name} ({w}x{h}) ใหญ่กว่าหน้า atlas {page_size}')
+
+        if x + w + padding > page_size:
+            # ขึ้น shelf ใหม่
+            x = 0
+            y += shelf_h
+            shelf_h = 0
+        if y + h + padding > page_size:
+            # ขึ้นหน้าใหม่
+            page += 1
+            x = y = shelf_h = 0
+
+        placed[name] = (page, x, y, w, h)
+        x += w + padding
+        shelf_h = max(shelf_h, h + padding)
+
+    return placed
+
+
+def build_atlas(image_dir=IMAGE_PATH, out_dir=ATLAS_PATH, max_side=MAX_SIDE, page_size=PAGE_SIZE):
+    from PySide6 import QtCore, QtGui
+
+    if QtGui.QGuiApplication.instance() is None:
+        app = QtGui.QGuiApplication(sys.argv[:1])  # noqa: F841  QPainter ต้องมี app
+
+    images = {}
+    sizes = {}
+    for name in atlas_sources(image_dir):
+        img = QtGui.QImage(os.path.join(image_dir, name))
+        if img.isNull():
+            print(f'⚠️ อ่านภาพไม่ได้: {name}')
+            continue
+        w, h = fit_size(img.width(), img.height(), max_side)
+        images[name] = (img, img.width(), img.height())
+        sizes[name] = (w, h)
+
+    placed = pack_rects(sizes, page_size)
+    page_count = max((p[0] for p in placed.values()), default=-1) + 1
+
+    pages = []
+    for i in range(page_count):
+        used_w = max(x + w for p, x, y, w, h in placed.values() if p == i)
+        used_h = max(y + h for p, x, y, w, h in placed.values() if p == i)
+        page_img = QtGui.QImage(used_w, used_h, QtGui.QImage.Format_ARGB32_Premultiplied)
+        page_img.fill(QtCore.Qt.transparent)
+        pages.append(page_img)
+
+    painters = [QtGui.QPainter(p) for p in pages]
+    for painter in painters:
+        painter.setRenderHint(QtGui.QPainter.SmoothPixmapTransform)
+
+    index = {'version': 1, 'pages': [], 'sprites': {}}
+    for name, (page, x, y, w, h) in sorted(placed.items()):
+        img, src_w, src_h = images[name]
+        painters[page].drawImage(QtCore.QRect(x, y, w, h), img)
+        index['sprites'][name] = {
+            'page': page, 'x': x, 'y': y, 'w': w, 'h': h,
+            'src_w': src_w, 'src_h': src_h,
+        }
+
+    for painter in painters:
+        painter.end()
+
+    os.makedirs(out_dir, exist_ok=True)
+    for i, page_img in enumerate(pages):
+        page_name = PAGE_NAME.format(i)
+        page_img.save(os.path.join(out_dir, page_name))
+        index['pages'].append(page_name)
+
+    with open(os.path.join(out_dir, INDEX_NAME), 'w', encoding='utf-8') as fh:
+        json.dump(index, fh, indent=1, sort_keys=True)
+
+    print(f'✅ สร้าง atlas {len(pages)} หน้า, {len(placed)} sprites → {out_dir}')
+    return index
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Pack small game sprites into atlas pages.')
+    parser.add_argument('--image-dir', default=IMAGE_PATH)
+    parser.add_argument('--out-dir', default=ATLAS_PATH)
+    parser.add_argument('--max-side', type=int, default=MAX_SIDE)
+    parser.add_argument('--page-size', type=int, default=PAGE_SIZE)
+    args = parser.parse_args(argv)
+    build_atlas(args.image_dir, args.out_dir, args.max_side, args.page_size)
+
+
+if __name__ == '__main__':
+    main()
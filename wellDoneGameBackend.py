@@ -0,0 +1,635 @@
+"""
+ส่วนที่เกมคุยกับโปรแกรมแม่ (Maya) รวมไว้ที่เดียว
+
+- spawn_served_object : สร้าง object ในฉากทุกครั้งที่เสิร์ฟถูก (เข้าคิวแล้วสร้างเป็น batch ตอนว่าง)
+- clear_scene         : ลบเฉพาะ node ที่เกมสร้างตอน restart (จดไว้ใน registry / object set)
+- main_window         : หน้าต่างหลักที่ใช้เป็น parent ของเกม
+
+MayaBackend ใช้ maya.cmds จริง (import ตอนสร้าง ไม่ใช่ตอน import module)
+MayaInstancerBackend เขียนจานเป็นจุดบน particle + instancer ชุดเดียว (จำนวน node คงที่ไม่ว่าจะเสิร์ฟกี่จาน)
+LocalBackend เป็นฉากในหน่วยความจำที่จำทุกคำสั่งไว้ ใช้เล่น/ทดสอบ/benchmark นอก Maya ได้ทันที
+
+    backend = get_backend()                  # Maya ถ้ามี ไม่งั้น local (หรือกำหนดด้วย WELLDONEGAME_BACKEND)
+    set_backend('maya_api')                  # เปลี่ยนได้ระหว่างเล่น: 'maya' (cmds), 'maya_api' (OpenMaya 2.0),
+                                             # 'maya_instancer' (จุดบน instancer), 'local', 'local_instancer'
+"""
+import os
+import time
+import collections
+
+try:
+    from . import wellDoneGameLog as wdlog
+except Exception:
+    import wellDoneGameLog as wdlog
+
+log = wdlog.get_logger('backend')
+
+# เมนู → ชนิด object ที่สร้างตอนเสิร์ฟ
+MENU_SHAPES = {
+    "tomato_soup": "sphere",
+    "lettuce_salad": "cube",
+    "tomato_lettuce_salad": "cylinder",
+    "lettuce_tomato_salad": "cylinder",
+    "delux_salad": "cone",
+}
+
+# เมนู → แถว (แนว Y)
+MENU_ROWS = {
+    "tomato_soup": 0,
+    "lettuce_salad": 1,
+    "tomato_lettuce_salad": 2,
+    "lettuce_tomato_salad": 2,
+    "delux_salad": 3,
+}
+
+# รูปทรง → คำสั่ง cmds ที่สร้าง mesh ต้นแบบ
+SHAPE_COMMANDS = {
+    "sphere": "polySphere",
+    "cube": "polyCube",
+    "cylinder": "polyCylinder",
+    "cone": "polyCone",
+}
+PROTOTYPE_PREFIX = "wellDoneGame_proto_"
+# ลำดับต้นแบบใน instancer: menuType ของแต่ละจุด = index ในลำดับนี้
+SHAPE_ORDER = ("sphere", "cube", "cylinder", "cone")
+MENU_TYPES = {menu: SHAPE_ORDER.index(shape) for menu, shape in MENU_SHAPES.items()}
+# โหมด instancer: จุดทั้งหมดอยู่บน particle เดียว ค่าต่อจุด (per-particle) ที่เก็บ
+INSTANCER_PARTICLE = "wellDoneGame_dishes"
+INSTANCER_NODE = "wellDoneGame_instancer"
+POINT_ATTRS = ("menuType", "row", "serveTime")
+INSTANCER_COLUMNS = 50      # จานต่อแถวก่อนขึ้นแถวถัดไป (แนว Z) แทนการเรียงยาวไม่สิ้นสุดในแนว X
+# object set ที่เก็บทุก node ที่เกมสร้าง (restart ลบเฉพาะสมาชิกของ set นี้)
+OWNED_SET = "wellDoneGame_nodes"
+
+ENV_BACKEND = "WELLDONEGAME_BACKEND"
+
+
+def has_maya():
+    try:
+        import maya.cmds  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _call_now(fn):
+    fn()
+
+
+def next_index(names, base_name):
+    """เลขถัดไปของ <base_name>_<n> จากชื่อที่มีอยู่แล้ว (ชื่อแบบ path/namespace ดูแค่ชื่อท้าย)"""
+    prefix = f"{base_name}_"
+    indices = []
+    for name in names:
+        name = name.rsplit("|", 1)[-1].rsplit(":", 1)[-1]
+        if name.startswith(prefix) and name[len(prefix):].isdigit():
+            indices.append(int(name[len(prefix):]))
+    return max(indices) + 1 if indices else 1
+
+
+def grid_position(menu_name, index, spacing, row_spacing):
+    """ตำแหน่งแบบตาราง: INSTANCER_COLUMNS จานต่อแถวเมนู แล้วถอยไปแนว Z (ขอบเขตแนว X คงที่)"""
+    depth, column = divmod(index - 1, INSTANCER_COLUMNS)
+    return (column * spacing, MENU_ROWS.get(menu_name, 0) * row_spacing, depth * spacing)
+
+
+# จานที่จองไว้รอสร้าง: เมนู, ชื่อ, ตำแหน่ง, เวลาที่เสิร์ฟ (วินาทีนับจากสร้าง backend)
+Spawn = collections.namedtuple("Spawn", "menu name position served_at")
+
+
+class DishCounter(object):
+    """
+    เลขถัดไปของจานแต่ละเมนู เก็บในหน่วยความจำ (ไม่ต้อง ls ทั้งฉากทุกครั้งที่เสิร์ฟ)
+    - seed() สแกนฉากครั้งเดียวด้วย scan() ได้ครบทุกเมนู
+    - take() เช็ค exists() ของชื่อที่จะใช้ (O(1)) ถ้ามีคนสร้าง/เปลี่ยนชื่อ node มาชนเลขนี้ จะสแกนใหม่
+    - ลบ node ด้วยมือไม่ทำให้ชื่อชน (เลขเดินหน้าต่อ ไม่ใช้เลขที่ว่างซ้ำ)
+    """
+    __slots__ = ("scan", "exists", "next", "seeds", "collisions")
+
+    def __init__(self, scan, exists):
+        self.scan = scan            # () → ชื่อ node ของทุกเมนูที่มีในฉาก
+        self.exists = exists        # ชื่อ → True ถ้ามี node นี้ในฉาก
+        self.next = None            # เมนู → เลขถัดไป (None = ยังไม่ seed)
+        self.seeds = 0
+        self.collisions = 0
+
+    def seed(self):
+        names = list(self.scan() or [])
+        self.next = {menu: next_index(names, menu) for menu in MENU_SHAPES}
+        self.seeds += 1
+        return self.next
+
+    def reset(self):
+        """ฉากเปลี่ยนทั้งฉาก (เช่น clear_scene) → seed ใหม่ตอนใช้ครั้งถัดไป"""
+        self.next = None
+
+    def take(self, menu_name):
+        """จองเลขถัดไปของเมนู → index"""
+        if self.next is None:
+            self.seed()
+        index = self.next.get(menu_name, 1)
+        if self.exists(f"{menu_name}_{index}"):
+            # ชื่อถูกใช้ไปแล้ว (สร้าง/rename ด้วยมือ) → สแกนฉากใหม่แล้วใช้เลขที่ว่างจริง
+            self.collisions += 1
+            log.info("🔁 ชื่อ %s_%s ถูกใช้แล้ว สแกนเลขจานใหม่", menu_name, index)
+            index = self.seed().get(menu_name, 1)
+        self.next[menu_name] = index + 1
+        return index
+
+    def stats(self):
+        return {"next": dict(self.next or {}), "seeds": self.seeds, "collisions": self.collisions}
+
+
+class NodeRegistry(object):
+    """ชื่อ node ที่เกมสร้าง แยกตามชนิด ('dish', 'prototype') ใช้ลบตอน restart และดูจำนวน"""
+    __slots__ = ("nodes",)
+
+    def __init__(self):
+        self.nodes = collections.defaultdict(set)
+
+    def add(self, kind, names):
+        self.nodes[kind].update(names)
+
+    def names(self):
+        return set().union(*self.nodes.values()) if self.nodes else set()
+
+    def clear(self):
+        self.nodes.clear()
+
+    def __len__(self):
+        return sum(len(names) for names in self.nodes.values())
+
+    def counts(self):
+        counts = {kind: len(names) for kind, names in self.nodes.items()}
+        counts["total"] = len(self)
+        return counts
+
+
+class Backend(object):
+    """
+    interface ที่เกมเรียก
+    spawn_served_object จองชื่อ/ตำแหน่งทันทีแล้วเข้าคิว ส่วนการเขียนลงฉากจริง (_create) ทำทีละ batch
+    ตอนโปรแกรมแม่ว่าง (defer) ปุ่มที่กดเสิร์ฟจึงกลับทันทีไม่ว่าจะสร้าง object ช้าแค่ไหน
+    """
+    name = "base"
+    FLUSH_BATCH = 64            # สร้างได้กี่ object ต่อการ flush 1 ครั้ง (ที่เหลือรอรอบว่างถัดไป)
+
+    def __init__(self, scan, exists, defer=None):
+        self.counter = DishCounter(scan, exists)
+        self.registry = NodeRegistry()
+        self.defer = defer or _call_now     # fn → เรียก fn ตอนว่าง
+        self.pending = collections.deque()  # Spawn ที่ยังไม่ได้สร้าง
+        self.started = time.monotonic()
+        self._flush_scheduled = False
+        self.flushed = 0
+        self.batches = 0
+
+    # ---------- ที่เกมเรียก ----------
+    def spawn_served_object(self, menu_name, spacing=3.0, row_spacing=3.0):
+        """จองชื่อ <เมนู>_<n> และตำแหน่งในแถวของเมนู แล้วรอสร้างตอนว่าง → คืนชื่อ node"""
+        if menu_name not in MENU_SHAPES:
+            self.warning(f"⚠️ ไม่มีเมนูชื่อ '{menu_name}' ในรายการ mapping.")
+            return None
+        index = self.counter.take(menu_name)
+        obj_name = f"{menu_name}_{index}"
+        position = self._position(menu_name, index, spacing, row_spacing)
+        self.pending.append(Spawn(menu_name, obj_name, position, time.monotonic() - self.started))
+        self._schedule_flush()
+        return obj_name
+
+    def clear_scene(self):
+        """ลบเฉพาะ node ที่เกมสร้าง (รวมคิวที่ยังไม่ได้สร้าง) → จำนวน node ที่ลบ"""
+        self.pending.clear()
+        count = self._clear()
+        self.registry.clear()
+        self.counter.reset()
+        return count
+
+    def flush(self, limit=None):
+        """สร้าง object ในคิว (ไม่เกิน limit ชิ้น) → จำนวนที่สร้าง"""
+        count = len(self.pending) if limit is None else min(limit, len(self.pending))
+        if not count:
+            return 0
+        batch = [self.pending.popleft() for _ in range(count)]
+        self._create(batch)
+        self.flushed += count
+        self.batches += 1
+        log.info("✅ Created %s served object(s) (%s waiting)", count, len(self.pending))
+        return count
+
+    def prepare(self):
+        """เรียกตอนเริ่มเกม: เตรียมของที่ต้องอ่านจากฉาก (ไม่ให้ไปช้าตอนเสิร์ฟจานแรก)"""
+        self.counter.seed()
+
+    def main_window(self):
+        return None
+
+    def warning(self, message):
+        log.warning(message)
+
+    def stats(self):
+        return {
+            "backend": self.name,
+            "dishes": self.counter.stats(),
+            "pending": len(self.pending),
+            "flushed": self.flushed,
+            "batches": self.batches,
+            "owned": self.registry.counts(),
+        }
+
+    # ---------- ตอนว่าง ----------
+    def _schedule_flush(self):
+        if self._flush_scheduled:
+            return
+        self._flush_scheduled = True
+        self.defer(self._flush_idle)
+
+    def _flush_idle(self):
+        self._flush_scheduled = False
+        self.flush(self.FLUSH_BATCH)
+        if self.pending:
+            self._schedule_flush()
+
+    # ---------- แต่ละ backend ----------
+    def _position(self, menu_name, index, spacing, row_spacing):
+        """ตำแหน่งของจานที่ index ในแถวของเมนู"""
+        return ((index - 1) * spacing, MENU_ROWS.get(menu_name, 0) * row_spacing, 0)
+
+    def _own(self, kind, names):
+        """จำว่า node เหล่านี้เป็นของเกม"""
+        self.registry.add(kind, names)
+
+    def _create(self, batch):
+        raise NotImplementedError
+
+    def _clear(self):
+        raise NotImplementedError
+
+
+class MayaBackend(Backend):
+    """
+    ฉาก Maya: mesh ต้นแบบ (ซ่อน) 1 ชิ้นต่อรูปทรง แต่ละจานเป็น instance ของต้นแบบ
+    (transform ใหม่ แต่ใช้ shape ร่วมกัน → node/หน่วยความจำ/viewport โตช้ากว่าสร้าง mesh ใหม่ทุกจาน)
+    สร้างตอน Maya ว่าง (maya.utils.executeDeferred) ทีละ batch ใน undo chunk เดียว
+    """
+    name = "maya"
+
+    def __init__(self):
+        import maya.cmds as cmds
+        import maya.utils
+        self.cmds = cmds
+        patterns = [f"{menu}_*" for menu in MENU_SHAPES]
+        super().__init__(lambda: cmds.ls(patterns), cmds.objExists, maya.utils.executeDeferred)
+        self.prototypes = {}    # รูปทรง → ชื่อ mesh ต้นแบบ
+
+    def _prototype(self, object_type):
+        cmds = self.cmds
+        proto = self.prototypes.get(object_type)
+        if proto is not None and cmds.objExists(proto):
+            return proto
+        # ต้นแบบจาก backend ก่อนหน้า (set_backend) หรือฉากที่เซฟไว้ → ใช้ต่อ ไม่สร้างซ้ำ
+        proto = self._find_owned(f"{PROTOTYPE_PREFIX}{object_type}")
+        if proto is not None:
+            self.registry.add("prototype", [proto])
+            self.prototypes[object_type] = proto
+            return proto
+        create = getattr(cmds, SHAPE_COMMANDS[object_type])
+        proto = create(name=f"{PROTOTYPE_PREFIX}{object_type}", constructionHistory=False)[0]
+        # ซ่อนที่ transform ของต้นแบบ (instance มี transform ของตัวเองจึงยังเห็น)
+        cmds.setAttr(f"{proto}.visibility", 0)
+        self._own("prototype", [proto])
+        self.prototypes[object_type] = proto
+        return proto
+
+    def _own(self, kind, names):
+        # ใส่ใน object set ด้วย: ตาม node ไปแม้ถูก rename และยังอยู่เมื่อเซฟ/เปิดฉากใหม่
+        super()._own(kind, names)
+        cmds = self.cmds
+        if not cmds.objExists(OWNED_SET):
+            cmds.sets(name=OWNED_SET, empty=True)
+        cmds.sets(names, add=OWNED_SET)
+
+    def owned_nodes(self):
+        """node ของเกมที่ยังอยู่ในฉากตอนนี้ (สมาชิกของ OWNED_SET)"""
+        cmds = self.cmds
+        if not cmds.objExists(OWNED_SET):
+            return []
+        return cmds.sets(OWNED_SET, query=True) or []
+
+    def _find_owned(self, name):
+        """node ของเกมใน OWNED_SET ที่ชื่อท้าย (ตัด path/namespace) ตรงกับ name หรือ None"""
+        for node in self.owned_nodes():
+            if node.rsplit("|", 1)[-1].rsplit(":", 1)[-1] == name:
+                return node
+        return None
+
+    def _create(self, batch):
+        cmds = self.cmds
+        cmds.undoInfo(openChunk=True, chunkName="wellDoneGame_serve")
+        try:
+            created = []
+            for spawn in batch:
+                proto = self._prototype(MENU_SHAPES[spawn.menu])
+                obj = cmds.instance(proto, name=spawn.name)[0]
+                # ถ้า Maya ยัง rename ให้ (กรณีหายาก) — บังคับ rename อีกครั้ง
+                if obj != spawn.name:
+                    obj = cmds.rename(obj, spawn.name)
+                cmds.setAttr(f"{obj}.visibility", 1)
+                cmds.xform(obj, translation=spawn.position, worldSpace=True)
+                created.append(obj)
+                log.debug("✅ Created %s (%s) at %s", obj, MENU_SHAPES[spawn.menu], spawn.position)
+            self._own("dish", created)
+        finally:
+            cmds.undoInfo(closeChunk=True)
+
+    def _clear(self):
+        """ลบสมาชิกของ OWNED_SET (และชื่อที่จำไว้ที่ยังอยู่) ใน cmds.delete ครั้งเดียว ของอื่นในฉากไม่ถูกแตะ"""
+        cmds = self.cmds
+        self.prototypes.clear()
+        nodes = set(self.owned_nodes())
+        nodes.update(cmds.ls(list(self.registry.names())) or [])
+        if cmds.objExists(OWNED_SET):
+            nodes.add(OWNED_SET)
+        if not nodes:
+            log.debug("⚠️ ไม่มี node ของเกมให้ลบ")
+            return 0
+        cmds.delete(list(nodes))
+        count = len(nodes) - (OWNED_SET in nodes)
+        log.info("✅ ลบ node ของเกมแล้ว (%s ชิ้น)", count)
+        return count
+
+    def main_window(self):
+        from PySide6 import QtWidgets
+        from shiboken6 import wrapInstance
+        import maya.OpenMayaUI as omui
+        ptr = omui.MQtUtil.mainWindow()
+        return wrapInstance(int(ptr), QtWidgets.QWidget) if ptr else None
+
+    def warning(self, message):
+        self.cmds.warning(message)
+
+    def stats(self):
+        return dict(super().stats(), prototypes=len(self.prototypes), owned_in_scene=len(self.owned_nodes()))
+
+
+class MayaApiBackend(MayaBackend):
+    """
+    เหมือน MayaBackend แต่สร้างจานทั้ง batch ด้วย maya.api.OpenMaya (API 2.0)
+    transform ทุกตัวสร้าง+ตั้งชื่อใน MDagModifier เดียว doIt() ครั้งเดียว แทน cmds 3-4 คำสั่งต่อจาน
+    (แต่ละคำสั่ง cmds ต้อง parse และลง undo queue แยกกัน)
+    จากนั้นผูก shape ของต้นแบบเป็น instance (MFnDagNode.addChild) และวางตำแหน่งด้วย MFnTransform
+    การสร้างทาง API ไม่เข้า undo queue ของ Maya (ลบได้ด้วย restart ตาม OWNED_SET เหมือนเดิม)
+    """
+    name = "maya_api"
+
+    def __init__(self):
+        super().__init__()
+        import maya.api.OpenMaya as om
+        self.om = om
+        self._shapes = {}       # ชื่อต้นแบบ → MObject ของ shape
+
+    def _prototype_shape(self, object_type):
+        om = self.om
+        proto = self._prototype(object_type)
+        shape = self._shapes.get(proto)
+        if shape is None or shape.isNull():
+            selection = om.MSelectionList()
+            selection.add(proto)
+            path = selection.getDagPath(0)
+            path.extendToShape()
+            shape = path.node()
+            self._shapes[proto] = shape
+        return shape
+
+    def _create(self, batch):
+        om = self.om
+        modifier = om.MDagModifier()
+        transforms = []
+        for spawn in batch:
+            node = modifier.createNode("transform")
+            modifier.renameNode(node, spawn.name)
+            transforms.append(node)
+        modifier.doIt()
+
+        created = []
+        for node, spawn in zip(transforms, batch):
+            shape = self._prototype_shape(MENU_SHAPES[spawn.menu])
+            om.MFnDagNode(node).addChild(shape, om.MFnDagNode.kNextPos, True)
+            om.MFnTransform(node).setTranslation(om.MVector(*spawn.position), om.MSpace.kTransform)
+            name = om.MFnDependencyNode(node).name()
+            if name != spawn.name:
+                log.debug("⚠️ Maya ตั้งชื่อ %s แทน %s", name, spawn.name)
+            created.append(name)
+        self._own("dish", created)
+
+    def _clear(self):
+        self._shapes.clear()
+        return super()._clear()
+
+
+class MayaInstancerBackend(MayaBackend):
+    """
+    โหมด instancer: ทุกจานเป็น "จุด" บน particle เดียว และ instancer เดียวใช้ต้นแบบ 4 รูปทรงตาม menuType ของจุด
+    node ในฉากจึงคงที่ (particle, instancer, ต้นแบบ 4 ชิ้น) ไม่ว่าจะเสิร์ฟกี่จาน
+    แต่ละจุดเก็บ menuType / row / serveTime เป็นค่าต่อจุด (per-particle) ไว้ใช้ต่อใน expression/render
+    ชื่อที่ spawn_served_object คืนเป็นชื่อเชิงตรรกะ <เมนู>_<n> (ไม่มี node ชื่อนี้)
+    """
+    name = "maya_instancer"
+
+    def __init__(self):
+        super().__init__()
+        import maya.mel as mel
+        self.mel = mel
+        self.particle = None    # ชื่อ particleShape
+        self.points = 0
+        # จานไม่ใช่ node: นับเลขต่อจากจุดที่มีอยู่แล้วแทนการ ls ชื่อ
+        self.counter.scan = self._point_names
+        self.counter.exists = lambda name: False
+
+    def _position(self, menu_name, index, spacing, row_spacing):
+        return grid_position(menu_name, index, spacing, row_spacing)
+
+    def _existing_particle(self):
+        """particleShape ของเกมที่มีอยู่ในฉาก (เช่นฉากที่เซฟไว้) หรือ None"""
+        cmds = self.cmds
+        if self.particle is not None and cmds.objExists(self.particle):
+            return self.particle
+        transform = self._find_owned(INSTANCER_PARTICLE)
+        if transform is None:
+            return None
+        self.particle = (cmds.listRelatives(transform, shapes=True, fullPath=True) or [None])[0]
+        return self.particle
+
+    def _particle_shape(self):
+        cmds = self.cmds
+        shape = self._existing_particle()
+        if shape is not None:
+            return shape
+        transform, shape = cmds.particle(name=INSTANCER_PARTICLE)
+        cmds.setAttr(f"{shape}.isDynamic", 0)       # จุดอยู่กับที่ ไม่โดน field/แรงโน้มถ่วง
+        for attr in POINT_ATTRS:
+            # ค่าต่อจุด + ค่าเริ่มต้น <attr>0 ที่ saveInitialState เก็บไว้ (จุดไม่หายตอนเลื่อน timeline)
+            cmds.addAttr(shape, longName=attr, dataType="doubleArray")
+            cmds.addAttr(shape, longName=f"{attr}0", dataType="doubleArray")
+        protos = [self._prototype(object_type) for object_type in SHAPE_ORDER]
+        instancer = cmds.particleInstancer(shape, addObject=True, object=protos, objectIndex="menuType",
+                                           name=INSTANCER_NODE)
+        self._own("instancer", [transform, instancer])
+        self.particle = shape
+        return shape
+
+    def _point_names(self):
+        """ชื่อเชิงตรรกะของจุดที่มีอยู่แล้ว ให้ DishCounter นับต่อ"""
+        shape = self._existing_particle()
+        if shape is None:
+            return []
+        menus = {}
+        for menu, menu_type in MENU_TYPES.items():
+            menus.setdefault(menu_type, menu)
+        counts = collections.Counter(int(v) for v in self.cmds.getAttr(f"{shape}.menuType0") or [])
+        return [f"{menus[t]}_{i}" for t, count in counts.items() if t in menus for i in range(1, count + 1)]
+
+    def _create(self, batch):
+        cmds = self.cmds
+        cmds.undoInfo(openChunk=True, chunkName="wellDoneGame_serve")
+        try:
+            shape = self._particle_shape()
+            values = {
+                "menuType": [MENU_TYPES[spawn.menu] for spawn in batch],
+                "row": [MENU_ROWS.get(spawn.menu, 0) for spawn in batch],
+                "serveTime": [round(spawn.served_at, 3) for spawn in batch],
+            }
+            # emit ครั้งเดียวทั้ง batch: -position ทุกจุด แล้ว -attribute ตามด้วย -floatValue ของทุกจุดตามลำดับ
+            args = [f'emit -object "{shape}"']
+            args.extend("-position %s %s %s" % tuple(spawn.position) for spawn in batch)
+            for attr in POINT_ATTRS:
+                args.append(f'-attribute "{attr}"')
+                args.extend(f"-floatValue {value}" for value in values[attr])
+            self.mel.eval(" ".join(args) + ";")
+            cmds.saveInitialState(shape)
+            self.points += len(batch)
+        finally:
+            cmds.undoInfo(closeChunk=True)
+
+    def _clear(self):
+        self.particle = None
+        self.points = 0
+        return super()._clear()
+
+    def stats(self):
+        return dict(super().stats(), points=self.points)
+
+
+class LocalBackend(Backend):
+    """
+    ฉากจำลองในหน่วยความจำ: ตั้งชื่อ/ตำแหน่ง/ต้นแบบแบบเดียวกับ MayaBackend และจำทุกคำสั่งใน calls
+    defer=None สร้างทันที (ทดสอบง่าย) หรือส่ง defer มาเพื่อจำลองการสร้างตอนว่าง
+    """
+    name = "local"
+
+    def __init__(self, defer=None):
+        self.nodes = {}         # ชื่อ → {'type', 'menu', 'position', 'instance_of'}
+        self.calls = []         # (ชื่อเมธอด, args)
+        self.prototypes = {}
+        super().__init__(lambda: list(self.nodes), self.nodes.__contains__, defer)
+
+    def spawn_served_object(self, menu_name, spacing=3.0, row_spacing=3.0):
+        self.calls.append(("spawn_served_object", (menu_name, spacing, row_spacing)))
+        return super().spawn_served_object(menu_name, spacing, row_spacing)
+
+    def _create(self, batch):
+        self.calls.append(("create", tuple(spawn.name for spawn in batch)))
+        for spawn in batch:
+            proto = self._prototype(MENU_SHAPES[spawn.menu])
+            self.nodes[spawn.name] = {"type": MENU_SHAPES[spawn.menu], "menu": spawn.menu,
+                                      "position": spawn.position, "instance_of": proto}
+        self._own("dish", [spawn.name for spawn in batch])
+
+    def _prototype(self, object_type):
+        proto = self.prototypes.get(object_type)
+        if proto is None:
+            proto = f"{PROTOTYPE_PREFIX}{object_type}"
+            self.nodes[proto] = {"type": object_type, "menu": None, "position": (0, 0, 0), "instance_of": None}
+            self.prototypes[object_type] = proto
+            self._own("prototype", [proto])
+        return proto
+
+    def _clear(self):
+        self.calls.append(("clear_scene", ()))
+        owned = [name for name in self.registry.names() if name in self.nodes]
+        for name in owned:
+            del self.nodes[name]
+        self.prototypes.clear()
+        return len(owned)
+
+    def main_window(self):
+        self.calls.append(("main_window", ()))
+        return None
+
+    def stats(self):
+        return dict(super().stats(), nodes=len(self.nodes), calls=len(self.calls),
+                    prototypes=len(self.prototypes))
+
+
+class LocalInstancerBackend(LocalBackend):
+    """LocalBackend ในโหมด instancer: จานเป็นจุดใน points ส่วน nodes มีแค่ particle, instancer และต้นแบบ"""
+    name = "local_instancer"
+
+    def __init__(self, defer=None):
+        self.points = []        # Spawn ที่เพิ่มเป็นจุดแล้ว
+        super().__init__(defer)
+        self.counter.scan = lambda: [spawn.name for spawn in self.points]
+        self.counter.exists = lambda name: False
+
+    def _position(self, menu_name, index, spacing, row_spacing):
+        return grid_position(menu_name, index, spacing, row_spacing)
+
+    def _create(self, batch):
+        self.calls.append(("emit", tuple(spawn.name for spawn in batch)))
+        if INSTANCER_NODE not in self.nodes:
+            protos = [self._prototype(object_type) for object_type in SHAPE_ORDER]
+            self.nodes[INSTANCER_PARTICLE] = {"type": "particle", "menu": None, "position": (0, 0, 0),
+                                              "instance_of": None}
+            self.nodes[INSTANCER_NODE] = {"type": "instancer", "menu": None, "position": (0, 0, 0),
+                                          "instance_of": tuple(protos)}
+            self._own("instancer", [INSTANCER_PARTICLE, INSTANCER_NODE])
+        self.points.extend(batch)
+
+    def _clear(self):
+        self.points.clear()
+        return super()._clear()
+
+    def stats(self):
+        return dict(super().stats(), points=len(self.points))
+
+
+BACKENDS = {
+    "maya": MayaBackend,
+    "maya_api": MayaApiBackend,
+    "maya_instancer": MayaInstancerBackend,
+    "local": LocalBackend,
+    "local_instancer": LocalInstancerBackend,
+}
+
+_backend = None
+
+
+def set_backend(backend):
+    """ใช้ backend นี้ (instance หรือชื่อใน BACKENDS) → คืน backend ที่ตั้งแล้ว"""
+    global _backend
+    if isinstance(backend, str):
+        backend = BACKENDS[backend]()
+    if _backend is not None and _backend is not backend:
+        # จานที่ยังรอในคิวของ backend เดิมต้องสร้างให้เสร็จก่อนเปลี่ยน (node เดิมยังอยู่ใน OWNED_SET)
+        _backend.flush()
+    _backend = backend
+    log.debug("🔌 backend: %s", backend.name)
+    return backend
+
+
+def get_backend():
+    """backend ปัจจุบัน (ครั้งแรก: ตาม WELLDONEGAME_BACKEND หรือ Maya ถ้า import ได้ ไม่งั้น local)"""
+    if _backend is None:
+        name = os.environ.get(ENV_BACKEND) or ("maya" if has_maya() else "local")
+        set_backend(name)
+    return _backend
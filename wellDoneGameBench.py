@@ -0,0 +1,426 @@
+"""
+benchmark ของเกม (รันนอก Maya ได้ด้วย Qt แบบ offscreen + LocalBackend)
+
+    python wellDoneGameBench.py background [--frames 200]
+    python wellDoneGameBench.py hot_paths [--sizes 0 50 200 500] [--out result.json] [--baseline base.json]
+    python wellDoneGameBench.py hot_paths --headless      # เฉพาะกติกาใน wdstate (ไม่ต้องมี Qt)
+    python wellDoneGameBench.py spawn [--counts 1 100 10000]   # ใน Maya: bench_spawn() เทียบ cmds กับ OpenMaya
+"""
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+
+try:
+    from . import wellDoneGameState as wdstate
+except Exception:
+    import wellDoneGameState as wdstate
+try:
+    from . import wellDoneGameRecipe as wdrecipe
+except Exception:
+    import wellDoneGameRecipe as wdrecipe
+try:
+    from . import wellDoneGameBackend as wdbackend
+except Exception:
+    import wellDoneGameBackend as wdbackend
+
+
+def _ensure_offscreen():
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+
+def _app():
+    _ensure_offscreen()
+    # นอก Maya ไม่ต้องมี module maya ปลอมแล้ว: ใช้ LocalBackend (จำคำสั่งไว้ใน backend.calls)
+    if not wdbackend.has_maya():
+        wdbackend.set_backend('local')
+    from PySide6 import QtWidgets
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv[:1])
+
+
+def _import_ui():
+    _app()
+    try:
+        from . import wellDoneGameUi as wdui
+    except ImportError:
+        import wellDoneGameUi as wdui
+    return wdui
+
+
+def make_game_page(seed=None):
+    """
+    GamePage จริงที่หยุด timer ของตัวเองไว้ (ผู้เรียกเดินเวลาเอง) ใช้กับ benchmark และบอท
+    คืน (wdui, page)
+    """
+    wdui = _import_ui()
+    page = wdui.GamePage(None)
+    page.resize(*wdstate.ARENA_SIZE)
+    page.show()
+    if seed is not None:
+        page.state.reset(seed=seed, remaining_time=wdstate.GAME_TIME)
+    page.game_clock.stop()
+    page.game_widget.loop.pause()
+    return wdui, page
+
+
+def _time_per_call(fn, repeat):
+    fn()  # warm up
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) * 1000.0 / repeat
+
+
+def bench_background_paint(frames=200, size=(1200, 675), image='bg_kitchen.png'):
+    """
+    เวลา paint ต่อ frame ของพื้นหลังเต็มจอ
+    before: QLabel + setScaledContents(True) (แบบเดิม)
+    after : BackgroundLabel ที่ scale ไว้ครั้งเดียวต่อขนาดหน้าต่าง
+    """
+    wdui = _import_ui()
+    from PySide6 import QtCore, QtGui, QtWidgets
+
+    pix = wdui.wdasset.get_pixmap(image)
+    target = QtGui.QPixmap(*size)
+
+    before = QtWidgets.QLabel()
+    before.setScaledContents(True)
+    before.setPixmap(pix)
+    before.resize(*size)
+
+    after = wdui.BackgroundLabel()
+    after.set_source(pix)
+    after.resize(*size)
+
+    return {
+        'image': image,
+        'size': list(size),
+        'frames': frames,
+        'scaled_contents_ms': _time_per_call(lambda: before.render(target), frames),
+        'cached_scale_ms': _time_per_call(lambda: after.render(target), frames),
+        'rescales': after.rescale_count,
+    }
+
+
+# ------------------- hot path ของการเล่น -------------------
+SCENE_SIZES = (0, 50, 200, 500)     # จำนวนวัตถุดิบบนพื้น (และจานบนพื้นเท่ากัน)
+FLOOR_SPOT = (600, 250)             # จุดที่เชฟวาง/หยิบของบนพื้น (ไกลเขียง/หม้อ/กองวัตถุดิบ)
+SERVE_SPOT = (1019, 206)            # จุดที่เชฟเสิร์ฟได้ (ไม่ใกล้ถังขยะ)
+FRAME_SPOT = (560, 200)             # จุดเริ่มเดินซ้ายขวาของ benchmark frame
+FRAME_SWING = 20                    # เดินกี่ tick แล้วกลับทิศ
+PLATE_IMAGES = (
+    ('lettuce_chopped',),
+    ('tomato_chopped', 'lettuce_chopped'),
+    ('tomato_chopped', 'lettuce_chopped', 'cucamber_chopped'),
+)
+NOISE_US = 2.0                      # ต่างจาก baseline น้อยกว่านี้ (µs) ไม่นับว่าช้าลง
+
+
+class _Samples(object):
+    __slots__ = ('values',)
+
+    def __init__(self):
+        self.values = []
+
+    def add(self, seconds):
+        self.values.append(seconds * 1e6)
+
+    def summary(self):
+        values = sorted(self.values)
+        if not values:
+            return None
+        n = len(values)
+        return {
+            'calls': n,
+            'mean_us': round(sum(values) / n, 3),
+            'p50_us': round(values[n // 2], 3),
+            'p95_us': round(values[min(n - 1, int(n * 0.95))], 3),
+            'max_us': round(values[-1], 3),
+        }
+
+
+def _timed(samples, fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    samples.add(time.perf_counter() - start)
+    return result
+
+
+def _populate(state, count, rng):
+    """วางวัตถุดิบ count ชิ้นและจาน count ใบแบบสุ่มทั่วฉาก (seed เดิม = ฉากเดิม)"""
+    names = sorted(wdrecipe.book.used_names)
+    for _ in range(count):
+        x = rng.randrange(0, state.width - wdstate.ITEM_SIZE)
+        y = rng.randrange(0, state.height - wdstate.ITEM_SIZE)
+        state.place('floor', state.new_item(rng.choice(names), x, y))
+    for _ in range(count):
+        x = rng.randrange(0, state.width - wdstate.PLATE_SIZE)
+        y = rng.randrange(0, state.height - wdstate.PLATE_SIZE)
+        items = rng.sample(names, rng.randint(0, 2))
+        state.place('plate', state.new_plate(items, x, y))
+    state.touch()
+
+
+def _order_plate(state):
+    """จานที่ตรงกับออเดอร์แรกพอดี (ให้ try_serve_plate ได้คะแนนทุกครั้ง)"""
+    menu = state.orders[0]
+    for key, name in wdrecipe.book.recipes.items():
+        if name == menu:
+            return state.new_plate(key)
+    return state.new_plate()
+
+
+def _move_chef(state, spot):
+    state.chef.x, state.chef.y = spot
+
+
+def _hot_path_ops(state, wdutil=None, page=None):
+    """
+    ชื่อ → ฟังก์ชันที่รับ (samples, i) ทำ 1 รอบ (setup ไม่ถูกจับเวลา)
+    มี wdutil/page = วัดผ่าน wrapper ของ view (กติกา + sync_view + toast) / ไม่มี = วัดเฉพาะกติกาใน wdstate
+    """
+    widget = page.game_widget if page is not None else None
+    rng = random.Random(1)
+    probes = [(rng.randrange(0, state.width), rng.randrange(0, state.height)) for _ in range(256)]
+
+    if widget is not None:
+        pick = lambda: wdutil.try_pick_item(widget)
+        drop = lambda: wdutil.drop_item(widget)
+        serve = lambda: wdutil.try_serve_plate(widget)
+        can_move = lambda x, y: wdutil._can_move_to(widget, x, y)
+    else:
+        pick = lambda: wdstate.try_pick_item(state)
+        drop = lambda: wdstate.drop_item(state)
+        serve = lambda: wdstate.try_serve_plate(state)
+        can_move = lambda x, y: wdstate.can_move_to(state, x, y)
+
+    def drop_item(samples, i):
+        # วางของใต้เท้า แล้วเก็บคืน (ไม่จับเวลา) ฉากจึงมีของเท่าเดิมทุกรอบ
+        _move_chef(state, FLOOR_SPOT)
+        state.chef.held_item = 'tomato'
+        _timed(samples, drop)
+        state.take(state.floor_items[-1])
+        state.touch()
+
+    def try_pick_item(samples, i):
+        _move_chef(state, FLOOR_SPOT)
+        state.chef.held_item = None
+        state.place('floor', state.new_item('tomato', FLOOR_SPOT[0] + 35, FLOOR_SPOT[1] + 123))
+        if widget is not None:
+            wdutil.sync_view(widget)
+        if not _timed(samples, pick):
+            raise RuntimeError('try_pick_item: ไม่ได้หยิบของ')
+
+    def try_serve_plate(samples, i):
+        _move_chef(state, SERVE_SPOT)
+        state.chef.held_item = None
+        state.chef.held_plate = _order_plate(state)
+        state.touch()
+        if widget is not None:
+            wdutil.sync_view(widget)
+        if not _timed(samples, serve):
+            raise RuntimeError('try_serve_plate: ไม่ได้เสิร์ฟ')
+
+    def can_move_to(samples, i):
+        _timed(samples, can_move, *probes[i % len(probes)])
+
+    def frame(samples, i):
+        # 1 frame ของ GameLoop (แทน GameWidget.update_position เดิม): เดิน 1 tick แล้ววาด
+        if i % FRAME_SWING == 0:
+            _move_chef(state, FRAME_SPOT)
+            right = (i // FRAME_SWING) % 2 == 0
+            wdstate.release_all(state)
+            wdstate.press_key(state, 'right' if right else 'left')
+        start = time.perf_counter()
+        wdstate.step(state)
+        if widget is not None:
+            wdutil.sync_view(widget)
+        samples.add(time.perf_counter() - start)
+
+    ops = {
+        'drop_item': drop_item,
+        'try_pick_item': try_pick_item,
+        'try_serve_plate': try_serve_plate,
+        '_can_move_to': can_move_to,
+        'frame': frame,
+    }
+    if widget is None:
+        return ops
+
+    label = wdutil.get_sprite_pool(widget).acquire(size=(wdstate.PLATE_SIZE, wdstate.PLATE_SIZE))
+
+    def update_plate_image(samples, i):
+        items = PLATE_IMAGES[i % len(PLATE_IMAGES)]
+        _timed(samples, wdutil.update_plate_image, widget, label, items)
+
+    def show_toast(samples, i):
+        # ข้อความซ้ำบ้างไม่ซ้ำบ้าง (ทั้งทางรวม ×N และทางเพิ่มเข้าคิว)
+        _timed(samples, page.show_toast, f'bench toast {i % 7}', 3000)
+
+    ops['update_plate_image'] = update_plate_image
+    ops['show_toast'] = show_toast
+    return ops
+
+
+def bench_hot_paths(repeat=200, sizes=SCENE_SIZES, headless=False, seed=1):
+    """
+    เวลาต่อครั้ง (µs) ของ hot path ตอนเล่น ในฉากที่มีของบนพื้น 0 ถึงหลายร้อยชิ้น
+    headless=True วัดเฉพาะกติกาใน wdstate (ไม่ต้องมี Qt) ไม่งั้นวัดผ่าน wdutil บน GamePage จริง
+    """
+    if headless:
+        wdutil = page = None
+        state = wdstate.GameState(seed=seed)
+    else:
+        wdui, page = make_game_page(seed=seed)
+        wdutil = wdui.wdutil
+        state = page.state
+        state.recorder = None
+        from PySide6 import QtCore, QtWidgets
+        app = QtWidgets.QApplication.instance()
+
+    results = {}
+    for size in sizes:
+        state.reset(seed=seed, remaining_time=wdstate.GAME_TIME)
+        _populate(state, size, random.Random(seed + size))
+        ops = _hot_path_ops(state, wdutil, page)
+        if page is not None:
+            wdutil.sync_view(page.game_widget)
+        row = {}
+        for name, op in ops.items():
+            samples = _Samples()
+            op(_Samples(), 0)   # warm up
+            for i in range(repeat):
+                op(samples, i)
+            if page is not None:
+                app.processEvents()
+                app.sendPostedEvents(None, QtCore.QEvent.DeferredDelete)
+            row[name] = samples.summary()
+        wdstate.release_all(state)
+        results[str(size)] = row
+
+    if page is not None:
+        page.close()
+        page.deleteLater()
+        app.sendPostedEvents(None, QtCore.QEvent.DeferredDelete)
+    return {
+        'benchmark': 'hot_paths',
+        'mode': 'headless' if headless else 'qt',
+        'repeat': repeat,
+        'seed': seed,
+        'python': platform.python_version(),
+        'qt_platform': None if headless else os.environ.get('QT_QPA_PLATFORM'),
+        'created': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'sizes': results,
+    }
+
+
+def compare(result, baseline, tolerance=0.25, noise_us=NOISE_US):
+    """เทียบ mean_us กับ baseline → list ของตัวที่ช้าลงเกิน tolerance (สัดส่วน)"""
+    regressions = []
+    for size, row in result.get('sizes', {}).items():
+        base_row = baseline.get('sizes', {}).get(size, {})
+        for name, stats in row.items():
+            base = base_row.get(name)
+            if not stats or not base:
+                continue
+            now, before = stats['mean_us'], base['mean_us']
+            stats['baseline_us'] = before
+            stats['ratio'] = round(now / before, 3) if before else None
+            if now > before * (1.0 + tolerance) and now - before > noise_us:
+                regressions.append({'size': size, 'op': name, 'baseline_us': before,
+                                    'mean_us': now, 'ratio': stats['ratio']})
+    return regressions
+
+
+# ------------------- สร้างจานที่เสิร์ฟในฉาก -------------------
+SPAWN_COUNTS = (1, 100, 10000)
+SPAWN_MENUS = ('tomato_soup', 'lettuce_salad', 'tomato_lettuce_salad', 'delux_salad')
+
+
+def bench_spawn(counts=SPAWN_COUNTS, backends=None):
+    """
+    เวลาสร้างจานที่เสิร์ฟ n จาน ของแต่ละ backend
+    (ใน Maya: 'maya' = cmds, 'maya_api' = OpenMaya 2.0, 'maya_instancer' = จุดบน instancer เดียว)
+    queue_ms = เวลาที่ปุ่มเสิร์ฟรอ (จองชื่อ+เข้าคิว), flush_ms = เวลาเขียนลงฉากทั้งหมด
+    ลบเฉพาะ node ของเกม (clear_scene) ก่อนและหลังแต่ละรอบ ฉากของผู้ใช้ไม่ถูกแตะ
+    """
+    if backends is None:
+        backends = (['maya', 'maya_api', 'maya_instancer'] if wdbackend.has_maya()
+                    else ['local', 'local_instancer'])
+    previous = wdbackend.get_backend()
+    results = {}
+    try:
+        for name in backends:
+            row = {}
+            for count in counts:
+                # defer ไว้ในรายการ (ไม่ให้สร้างระหว่างจับเวลาคิว) แล้ว flush ทั้งหมดทีเดียว
+                backend = wdbackend.set_backend(name)
+                backend.defer = lambda fn: None
+                backend.clear_scene()
+                start = time.perf_counter()
+                for i in range(count):
+                    backend.spawn_served_object(SPAWN_MENUS[i % len(SPAWN_MENUS)])
+                queued = time.perf_counter()
+                backend.flush()
+                done = time.perf_counter()
+                stats = backend.stats()
+                row[str(count)] = {
+                    'queue_ms': round((queued - start) * 1000.0, 3),
+                    'flush_ms': round((done - queued) * 1000.0, 3),
+                    'per_dish_us': round((done - start) * 1e6 / count, 3),
+                    'owned': stats['owned'],
+                }
+                backend.clear_scene()
+            results[name] = row
+    finally:
+        wdbackend.set_backend(previous)
+    return {'benchmark': 'spawn', 'counts': list(counts), 'backends': results,
+            'created': time.strftime('%Y-%m-%d %H:%M:%S')}
+
+
+BENCHMARKS = {
+    'background': lambda args: bench_background_paint(frames=args.frames),
+    'hot_paths': lambda args: bench_hot_paths(repeat=args.repeat, sizes=args.sizes,
+                                              headless=args.headless, seed=args.seed),
+    'spawn': lambda args: bench_spawn(counts=args.counts, backends=args.backends),
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Well Done game benchmarks.')
+    parser.add_argument('name', choices=sorted(BENCHMARKS))
+    parser.add_argument('--frames', type=int, default=200)
+    parser.add_argument('--repeat', type=int, default=200, help='calls per op per scene size (hot_paths)')
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(SCENE_SIZES),
+                        help='floor items / dropped plates per scene (hot_paths)')
+    parser.add_argument('--headless', action='store_true', help='time wdstate rules only, no Qt (hot_paths)')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--counts', type=int, nargs='+', default=list(SPAWN_COUNTS), help='dishes per run (spawn)')
+    parser.add_argument('--backends', nargs='+', choices=sorted(wdbackend.BACKENDS),
+                        help="backends to compare (spawn; default: every maya* backend in Maya, else local + local_instancer)")
+    parser.add_argument('--out', help='write the JSON result here (use it later as --baseline)')
+    parser.add_argument('--baseline', help='compare against a saved result; exit 1 on regressions')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='allowed slowdown vs baseline (0.25 = 25%%)')
+    args = parser.parse_args(argv)
+    result = BENCHMARKS[args.name](args)
+
+    status = 0
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        result['regressions'] = compare(result, baseline, args.tolerance)
+        status = 1 if result['regressions'] else 0
+
+    text = json.dumps(result, indent=2)
+    if args.out:
+        with open(args.out, 'w', encoding='utf-8') as f:
+            f.write(text)
+    print(text)
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
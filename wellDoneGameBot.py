@@ -0,0 +1,671 @@
+"""
+บอทเล่นเกมอัตโนมัติ สำหรับ soak test / load test
+
+บอทกดปุ่มผ่านทางเดียวกับคนเล่น (press/release ปุ่มชื่อตาม wdstate → handle_key_press ของ GameWidget)
+เดินหาเส้นทางด้วย A* บน lattice ก้าวละ CHEF_SPEED พิกเซล (ก้าวจริงของเชฟ) รอบกำแพงล่องหน
+แล้วทำเมนูตามออเดอร์แรกใน GamePage.orders: หยิบ → หั่น (Space) → ใส่จาน → เสิร์ฟ (F)
+
+    python wellDoneGameBot.py --games 3                 # headless (ไม่ใช้ Qt) เร็วหลายหมื่น tick/s
+    python wellDoneGameBot.py --qt --minutes 60 --out soak.json
+                                                        # GamePage จริงบน Qt offscreen เร่งเวลาเต็มที่
+"""
+import sys
+import json
+import time
+import heapq
+import argparse
+
+try:
+    from . import wellDoneGameState as wdstate
+except Exception:
+    import wellDoneGameState as wdstate
+try:
+    from . import wellDoneGameRecipe as wdrecipe
+except Exception:
+    import wellDoneGameRecipe as wdrecipe
+try:
+    from . import wellDoneGameLog as wdlog
+except Exception:
+    import wellDoneGameLog as wdlog
+
+log = wdlog.get_logger('bot')
+
+# ปุ่มเดินตามทิศ (dx, dy) ของก้าวบน lattice
+DIRECTION_KEYS = {
+    (-1, 0): ('left',), (1, 0): ('right',), (0, -1): ('up',), (0, 1): ('down',),
+    (-1, -1): ('left', 'up'), (1, -1): ('right', 'up'),
+    (-1, 1): ('left', 'down'), (1, 1): ('right', 'down'),
+}
+MAX_EXPANSIONS = 60000      # A* ยอมแพ้ถ้าขยาย node เกินนี้
+MAX_REPLANS = 3             # เชฟไม่อยู่ตรง node ที่คาด → วางเส้นทางใหม่ได้กี่ครั้ง
+WAIT_MARGIN = 2.0           # รองานหั่น/ต้มได้นานกว่าเวลาจริงกี่เท่า
+
+
+class BotStuck(Exception):
+    """ขั้นตอนของบอททำไม่สำเร็จ (ไปไม่ถึง, กดแล้วไม่เกิดอะไร, รอนานเกิน)"""
+
+
+# ------------------- หาเส้นทาง -------------------
+class Goal(object):
+    """ตำแหน่งที่ต้องไปให้ถึง: test(probe) ต้องเป็นจริง, center/radius ใช้ทำ heuristic ของ A*"""
+    __slots__ = ('name', 'center', 'radius', 'test')
+
+    def __init__(self, name, target, radius, test):
+        self.name = name
+        self.center = target.center()
+        self.radius = radius
+        self.test = test
+
+    def __repr__(self):
+        return f'Goal({self.name!r})'
+
+
+class Navigator(object):
+    """
+    A* บน lattice ของตำแหน่งเชฟ (มุมซ้ายบน) ที่ห่างกัน CHEF_SPEED พิกเซลโดยมีจุดเริ่มที่ตำแหน่งเชฟตอนนี้
+    ทุกก้าวบน lattice คือการกดปุ่มค้าง 1 tick พอดี (8 ทิศ ก้าวละ 1 tick) เชฟจึงเดินตามเส้นทางได้ตรงทุกพิกเซล
+    ใช้ collision grid กับขอบฉากชุดเดียวกับ move_chef
+    """
+    __slots__ = ('state', 'step', '_free', 'planned', 'expanded')
+
+    def __init__(self, state, step=wdstate.CHEF_SPEED):
+        self.state = state
+        self.step = step
+        self._free = {}         # (x, y) → ว่างไหม (กำแพงไม่ขยับ จำไว้ได้ตลอด)
+        self.planned = 0
+        self.expanded = 0
+
+    def is_free(self, x, y):
+        key = (x, y)
+        free = self._free.get(key)
+        if free is None:
+            state = self.state
+            chef = state.chef
+            free = (0 <= x <= state.width - chef.w and 0 <= y <= state.height - chef.h and
+                    state.collision.is_free(x, y, chef.w, chef.h))
+            self._free[key] = free
+        return free
+
+    def can_step(self, x, y, dx, dy):
+        """เหมือน CollisionGrid.slide: ขยับแกน x ก่อนแล้วค่อย y ทั้งสองช่วงต้องว่าง"""
+        nx, ny = x + dx, y + dy
+        if dx and not self.is_free(nx, y):
+            return False
+        return self.is_free(nx, ny)
+
+    def plan(self, goal, start=None):
+        """list ของตำแหน่งที่ต้องเดินผ่าน (ไม่รวมจุดเริ่ม) หรือ None ถ้าไปไม่ได้"""
+        chef = self.state.chef
+        start = start or (chef.x, chef.y)
+        probe = wdstate.Rect(0, 0, chef.w, chef.h)
+        half_w, half_h = chef.w / 2.0, chef.h / 2.0
+        gx, gy = goal.center
+        # เดินทแยง 1 tick ขยับ center ได้ไม่เกิน step*√2 → heuristic ไม่เกินจริง
+        reach = self.step * 1.4143
+
+        def heuristic(x, y):
+            d = ((x + half_w - gx) ** 2 + (y + half_h - gy) ** 2) ** 0.5
+            return max(0.0, d - goal.radius) / reach
+
+        def reached(x, y):
+            probe.x, probe.y = x, y
+            return goal.test(probe)
+
+        self.planned += 1
+        step = self.step
+        came_from = {start: None}
+        cost = {start: 0}
+        heap = [(heuristic(*start), 0, start)]
+        expanded = 0
+        while heap:
+            _, g, node = heapq.heappop(heap)
+            if g > cost[node]:
+                continue
+            if reached(*node):
+                path = []
+                while node != start:
+                    path.append(node)
+                    node = came_from[node]
+                path.reverse()
+                self.expanded += expanded
+                return path
+            expanded += 1
+            if expanded > MAX_EXPANSIONS:
+                break
+            x, y = node
+            for dx, dy in DIRECTION_KEYS:
+                if not self.can_step(x, y, dx * step, dy * step):
+                    continue
+                nxt = (x + dx * step, y + dy * step)
+                ng = g + 1
+                if ng < cost.get(nxt, ng + 1):
+                    cost[nxt] = ng
+                    came_from[nxt] = node
+                    heapq.heappush(heap, (ng + heuristic(*nxt), ng, nxt))
+        self.expanded += expanded
+        return None
+
+
+# ------------------- จุดหมายตามกติกาใน wdstate -------------------
+def _source_goal(state, name):
+    source = state.sources[name]
+
+    def test(probe):
+        found = state.nearest('source', probe, wdstate.PICK_RANGE)
+        return found is source
+    return Goal(f'source:{name}', source, wdstate.PICK_RANGE, test)
+
+
+def _board_goal(state):
+    # ใกล้เขียงพอทั้งวาง (STATION_RANGE), หั่น (NEAR_RANGE) และหยิบของบนเขียง (PICK_RANGE)
+    board = state.station('chopping_board')
+
+    def test(probe):
+        return wdstate.is_near_object(probe, board)
+    return Goal('chopping_board', board, wdstate.NEAR_RANGE, test)
+
+
+def _pot_goal(state):
+    # ใกล้หม้อพอวาง/ตัก แต่ไกลเขียงพอที่ drop_item จะไม่วางลงเขียงแทน
+    pot = state.station('pot')
+    board = state.station('chopping_board')
+
+    def test(probe):
+        return (wdstate.distance(probe, pot) <= wdstate.PICK_RANGE and
+                wdstate.distance(probe, board) >= wdstate.STATION_RANGE)
+    return Goal('pot', pot, wdstate.PICK_RANGE, test)
+
+
+def _plate_station_goal(state):
+    station = state.station('plate_station')
+
+    def test(probe):
+        return wdstate.is_near_object(probe, station)
+    return Goal('plate_station', station, wdstate.NEAR_RANGE, test)
+
+
+def _serve_goal(state):
+    serve = state.station('serve_station')
+    trash = state.station('trash_bin')
+
+    def test(probe):
+        return (wdstate.distance(probe, serve) <= wdstate.SERVE_RANGE and
+                wdstate.distance(probe, trash) > wdstate.TRASH_RANGE)
+    return Goal('serve_station', serve, wdstate.SERVE_RANGE, test)
+
+
+def _trash_goal(state):
+    trash = state.station('trash_bin')
+
+    def test(probe):
+        return wdstate.distance(probe, trash) <= wdstate.TRASH_RANGE
+    return Goal('trash_bin', trash, wdstate.TRASH_RANGE, test)
+
+
+def recipe_steps(menu):
+    """วัตถุดิบที่ต้องเตรียมของเมนู → list ของ (ชื่อกองวัตถุดิบ, ชื่อที่ต้องใส่จาน)"""
+    for key, name in wdrecipe.book.recipes.items():
+        if name == menu:
+            break
+    else:
+        return None
+    steps = []
+    for item in key:
+        if item.endswith('_chopped'):
+            steps.append((item[:-len('_chopped')], item))
+        else:
+            steps.append((item, item))
+    return steps
+
+
+# ------------------- บอท -------------------
+class Bot(object):
+    """
+    บอท 1 ตัวต่อเกม เรียก update() ทุก tick ก่อน wdstate.step()
+    press/release คือทางเข้าเดียวกับคีย์บอร์ด (เช่น wdutil.handle_key_press(game_widget, key))
+    orders คือฟังก์ชันที่คืนออเดอร์ตอนนี้ (GamePage.orders)
+    """
+
+    def __init__(self, state, press=None, release=None, orders=None):
+        self.state = state
+        self.press = press or (lambda key: wdstate.press_key(self.state, key))
+        self.release = release or (lambda key: wdstate.release_key(self.state, key))
+        self.orders = orders or (lambda: self.state.orders)
+        self.navigator = Navigator(state)
+        self.goals = {
+            'board': _board_goal(state),
+            'pot': _pot_goal(state),
+            'plate_station': _plate_station_goal(state),
+            'serve': _serve_goal(state),
+            'trash': _trash_goal(state),
+        }
+        for name in state.sources:
+            self.goals[name] = _source_goal(state, name)
+        self.held_keys = set()
+        self.stats = {'served': 0, 'wrong': 0, 'stuck': 0, 'replans': 0, 'presses': 0}
+        self.last_error = None
+        self._script = None
+
+    # ---------- ทุก tick ----------
+    def update(self):
+        if self.state.game_over:
+            self._release_moves()
+            self._script = None
+            return
+        if self._script is None:
+            self._script = self._play()
+        try:
+            next(self._script)
+        except StopIteration:
+            self._script = None
+        except BotStuck as e:
+            self.stats['stuck'] += 1
+            self.last_error = str(e)
+            log.debug('🤖 ติด: %s → เก็บกวาดแล้วเริ่มใหม่', e)
+            self._release_moves()
+            self._script = self._recover()
+
+    def reset(self):
+        """เรียกหลัง restart (state.reset สร้างเชฟใหม่ ปุ่มที่กดค้างถูกล้างแล้ว)"""
+        self.held_keys.clear()
+        self._script = None
+
+    # ---------- ปุ่ม ----------
+    def _set_moves(self, keys):
+        for key in self.held_keys - keys:
+            self.release(key)
+        for key in keys - self.held_keys:
+            self.press(key)
+        self.held_keys = set(keys)
+
+    def _release_moves(self):
+        self._set_moves(set())
+
+    def _tap(self, key, why):
+        """กดแล้วปล่อย 1 ปุ่ม (ต้องเกิดผล ไม่งั้น BotStuck)"""
+        self._release_moves()
+        self.stats['presses'] += 1
+        done = self.press(key)
+        self.release(key)
+        if not done:
+            raise BotStuck(f'{key}: {why}')
+        yield
+
+    # ---------- ขั้นตอนย่อย (generator: yield = รอ 1 tick) ----------
+    def _goto(self, name):
+        goal = self.goals[name]
+        chef = self.state.chef
+        for _ in range(MAX_REPLANS + 1):
+            path = self.navigator.plan(goal)
+            if path is None:
+                raise BotStuck(f'ไม่มีทางไป {name}')
+            for node in path:
+                step = self.navigator.step
+                direction = ((node[0] - chef.x) // step, (node[1] - chef.y) // step)
+                keys = DIRECTION_KEYS.get(direction)
+                if keys is None or (chef.x + direction[0] * step, chef.y + direction[1] * step) != node:
+                    break
+                self._set_moves(set(keys))
+                yield
+                if (chef.x, chef.y) != node:
+                    break
+            else:
+                self._release_moves()
+                return
+            self.stats['replans'] += 1
+        raise BotStuck(f'ไปไม่ถึง {name}')
+
+    def _wait(self, done, seconds, why):
+        for _ in range(int(seconds * WAIT_MARGIN / wdstate.TICK_SECONDS) + 1):
+            if done():
+                return
+            yield
+        raise BotStuck(f'รอนานเกิน: {why}')
+
+    def _fetch(self, source):
+        yield from self._goto(source)
+        yield from self._tap('f', f'หยิบ {source}')
+        if self.state.chef.held_item != source:
+            raise BotStuck(f'หยิบได้ {self.state.chef.held_item} แทน {source}')
+
+    def _chop(self, source, chopped):
+        state = self.state
+        yield from self._fetch(source)
+        yield from self._goto('board')
+        yield from self._tap('g', 'วางบนเขียง')
+        yield from self._tap('space', 'หั่น')
+        yield from self._wait(
+            lambda: any(i.name == chopped and not i.busy for i in state.board_items),
+            wdstate.CHOP_SECONDS, f'หั่น {source}')
+        yield from self._tap('f', f'หยิบ {chopped}')
+        if state.chef.held_item != chopped:
+            raise BotStuck(f'หยิบได้ {state.chef.held_item} แทน {chopped}')
+
+    def _cook_soup(self):
+        state = self.state
+        if not (state.soup_ready or state.cooking):
+            while not state.cooking:
+                yield from self._fetch('tomato')
+                yield from self._goto('pot')
+                yield from self._tap('g', 'ใส่หม้อ')
+        yield from self._wait(lambda: state.soup_ready, wdstate.COOK_SECONDS, 'ต้มซุป')
+
+    def _trash_held(self):
+        chef = self.state.chef
+        if chef.held_item or chef.held_plate is not None:
+            yield from self._goto('trash')
+            yield from self._tap('f', 'ทิ้งของ')
+
+    def _recover(self):
+        """ทิ้งของในมือ, เคลียร์เขียง/หม้อ/จานที่ station ให้พร้อมเริ่มเมนูใหม่"""
+        state = self.state
+        yield from self._trash_held()
+        while state.board_items:
+            yield from self._goto('board')
+            yield from self._wait(lambda: not all(i.busy for i in state.board_items),
+                                  wdstate.CHOP_SECONDS * len(state.board_items), 'เคลียร์เขียง')
+            yield from self._tap('f', 'หยิบของจากเขียง')
+            yield from self._trash_held()
+        if state.pot_items and not state.cooking:
+            while state.pot_items:
+                yield from self._goto('pot')
+                yield from self._tap('f', 'หยิบของจากหม้อ')
+                yield from self._trash_held()
+
+    def choose_order(self):
+        orders = self.orders()
+        return orders[0] if orders else None
+
+    def _play(self):
+        """ทำ 1 เมนูตามออเดอร์แรก ตั้งแต่ต้นจนเสิร์ฟ"""
+        state = self.state
+        yield from self._recover()
+        menu = self.choose_order()
+        steps = recipe_steps(menu) if menu else None
+        if not steps:
+            yield
+            return
+
+        # จานที่ station ต้องว่าง
+        if state.station_plate.items:
+            yield from self._goto('plate_station')
+            yield from self._tap('f', 'หยิบจานเก่า')
+            yield from self._trash_held()
+
+        soup = False
+        for source, name in steps:
+            if name == 'tomato_soup':
+                soup = True
+                continue
+            if source == name:
+                yield from self._fetch(source)
+            else:
+                yield from self._chop(source, name)
+            yield from self._goto('plate_station')
+            yield from self._tap('f', f'ใส่ {name} ลงจาน')
+
+        if soup:
+            yield from self._cook_soup()
+        yield from self._goto('plate_station')
+        yield from self._tap('f', 'หยิบจาน')
+        if soup:
+            yield from self._goto('pot')
+            yield from self._tap('f', 'ตักซุป')
+
+        yield from self._goto('serve')
+        meal = state.chef.held_plate.meal()
+        correct = meal is not None and meal in self.orders()
+        yield from self._tap('f', 'เสิร์ฟ')
+        self.stats['served' if correct else 'wrong'] += 1
+
+
+# ------------------- ตัวขับเกม -------------------
+class StateDriver(object):
+    """ขับ GameState ตรง ๆ (ไม่มี Qt) เร็วที่สุด ใช้ทดสอบกติกา/บอท"""
+
+    def __init__(self, seed=None):
+        self.state = wdstate.GameState(seed=seed)
+        self.bot = Bot(self.state)
+
+    def step(self):
+        wdstate.step(self.state)
+        # ไม่มี view คอย drain → ทิ้ง event เอง (ไม่ให้ list โต)
+        self.state.events.clear()
+
+    def clock(self):
+        wdstate.tick_clock(self.state)
+        self.state.events.clear()
+
+    def restart(self):
+        self.state.reset(remaining_time=wdstate.GAME_TIME)
+        self.bot.reset()
+
+    def metrics(self):
+        return {}
+
+    def close(self):
+        pass
+
+
+class _Timed(object):
+    """ห่อฟังก์ชันเพื่อจับเวลาต่อครั้ง (สะสมเป็นช่วง แล้ว take() ออกมา)"""
+
+    def __init__(self, fn):
+        self.fn = fn
+        self.calls = 0
+        self.total = 0.0
+        self.worst = 0.0
+
+    def __call__(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return self.fn(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            self.calls += 1
+            self.total += elapsed
+            self.worst = max(self.worst, elapsed)
+
+    def take(self):
+        result = {
+            'calls': self.calls,
+            'mean_ms': round(self.total * 1000.0 / self.calls, 4) if self.calls else None,
+            'max_ms': round(self.worst * 1000.0, 4),
+        }
+        self.calls = 0
+        self.total = self.worst = 0.0
+        return result
+
+
+class WidgetDriver(object):
+    """
+    ขับ GamePage จริง (Qt offscreen + backend ของ Maya หรือ LocalBackend) แต่เร่งเวลา
+    ปุ่มเข้าทาง wdutil.handle_key_press/handle_key_release, นาฬิกาเกมเข้าทาง GamePage._tick_game_clock,
+    หมดเวลาแล้วกด continue บน overlay (restart) เหมือนคน
+    """
+    HOT_PATHS = ('update_plate_image', 'spawn_served_object')
+
+    def __init__(self, seed=None, record=False):
+        try:
+            from . import wellDoneGameBench as wdbench
+        except ImportError:
+            import wellDoneGameBench as wdbench
+        wdui, self.page = wdbench.make_game_page(seed=seed)
+        from PySide6 import QtCore, QtWidgets
+        self.QtCore = QtCore
+        self.app = QtWidgets.QApplication.instance()
+        self.wdutil = wdui.wdutil
+
+        self.widget = self.page.game_widget
+        self.state = self.widget.state
+        if record:
+            self.widget.start_recording()
+        else:
+            # ตั้ง WELLDONEGAME_SESSIONS ไว้ก็ไม่บันทึกระหว่าง soak (ต้องขอด้วย --record)
+            self.widget.recorder = self.state.recorder = None
+
+        # จับเวลา hot path ที่เรียกผ่าน global ของ wdutil และ show_toast ของหน้าเกม
+        self.timed = {}
+        for name in self.HOT_PATHS:
+            self.timed[name] = _Timed(getattr(self.wdutil, name))
+            setattr(self.wdutil, name, self.timed[name])
+        self.timed['show_toast'] = _Timed(self.page.show_toast)
+        self.page.show_toast = self.timed['show_toast']
+
+        widget = self.widget
+        self.bot = Bot(self.state,
+                       press=lambda key: self.wdutil.handle_key_press(widget, key),
+                       release=lambda key: self.wdutil.handle_key_release(widget, key),
+                       orders=lambda: self.page.orders)
+
+    def _pause_timers(self):
+        # ให้ runner เป็นคนเดินเวลาเอง (ไม่ให้ GameLoop/นาฬิกาเกมเดินซ้อน)
+        self.page.game_clock.stop()
+        self.widget.loop.pause()
+
+    def step(self):
+        wdstate.step(self.state)
+        self.wdutil.sync_view(self.widget)
+        self.app.processEvents()
+        # deleteLater จะลบจริงก็ต่อเมื่อกลับเข้า event loop → สั่งลบตรงนี้ ไม่ให้นับเป็น leak
+        self.app.sendPostedEvents(None, self.QtCore.QEvent.DeferredDelete)
+
+    def clock(self):
+        self.page._tick_game_clock()
+
+    def restart(self):
+        self.page._overlay_continue_clicked()
+        self._pause_timers()
+        self.bot.reset()
+
+    def metrics(self):
+        QtCore = self.QtCore
+        timers = self.page.findChildren(QtCore.QTimer)
+        result = {
+            'objects': len(self.page.findChildren(QtCore.QObject)),
+            'widgets': len(self.widget.findChildren(QtCore.QObject)),
+            'timers': len(timers),
+            'active_timers': sum(1 for t in timers if t.isActive()),
+            'order_widgets': self.page.order_layout.count(),
+            'toasts': self.page.toast_layer.stats(),
+        }
+        pool = getattr(self.widget, 'sprite_pool', None)
+        if pool is not None:
+            result['sprite_pool'] = pool.stats()
+        result['hot_paths'] = {name: timed.take() for name, timed in self.timed.items()}
+        return result
+
+    def close(self):
+        for name in self.HOT_PATHS:
+            setattr(self.wdutil, name, self.timed[name].fn)
+        self.page.show_toast = self.timed['show_toast'].fn
+        self.page.close()
+        self.page.deleteLater()
+        self.app.sendPostedEvents(None, self.QtCore.QEvent.DeferredDelete)
+
+
+# ------------------- soak -------------------
+def soak(driver, games=1, seconds=None, report_every=50):
+    """
+    เล่นต่อเนื่องจนครบ games เกม (หรือครบ seconds วินาทีจริง) โดยเดินเวลาเร็วที่สุดเท่าที่เครื่องทำได้
+    ทุก report_every จานที่เสิร์ฟถูก เก็บ 1 ช่วง (ms ต่อ tick + metrics ของ driver) ไว้ดูว่าช้าลง/โตขึ้นไหม
+    """
+    state, bot = driver.state, driver.bot
+    ticks_per_second = 1.0 / wdstate.TICK_SECONDS
+    started = window_start = time.perf_counter()
+    window_ticks = 0
+    game_ticks = 0.0
+    total_ticks = 0
+    played = 0
+    scores = []
+    windows = []
+    next_report = report_every
+
+    def snapshot():
+        now = time.perf_counter()
+        window = {
+            'served': bot.stats['served'],
+            'ticks': total_ticks,
+            'ms_per_tick': round((now - window_start) * 1000.0 / max(1, window_ticks), 5),
+        }
+        window.update(driver.metrics())
+        windows.append(window)
+        return now
+
+    while played < games:
+        if seconds is not None and time.perf_counter() - started >= seconds:
+            break
+        bot.update()
+        driver.step()
+        total_ticks += 1
+        window_ticks += 1
+        game_ticks += 1
+        # นาฬิกาเกมเดินทุก 1 วินาทีของเวลาเกม (เหมือน QTimer 1000 ms)
+        if game_ticks >= ticks_per_second:
+            game_ticks -= ticks_per_second
+            driver.clock()
+        if state.game_over:
+            scores.append(state.score)
+            played += 1
+            if played < games:
+                driver.restart()
+        if report_every and bot.stats['served'] >= next_report:
+            next_report += report_every
+            window_start = snapshot()
+            window_ticks = 0
+
+    elapsed = time.perf_counter() - started
+    if window_ticks:
+        snapshot()
+    report = {
+        'games': played,
+        'scores': scores,
+        'ticks': total_ticks,
+        'seconds': round(elapsed, 3),
+        'ticks_per_second': int(total_ticks / elapsed) if elapsed else None,
+        'game_speedup': round(total_ticks * wdstate.TICK_SECONDS / elapsed, 1) if elapsed else None,
+        'bot': dict(bot.stats, last_error=bot.last_error,
+                    plans=bot.navigator.planned, expanded=bot.navigator.expanded),
+        'windows': windows,
+    }
+    if len(windows) >= 2:
+        first, last = windows[0], windows[-1]
+        report['growth'] = {
+            key: round(last[key] / first[key], 3) if first.get(key) else None
+            for key in ('ms_per_tick', 'objects', 'widgets', 'timers') if key in first
+        }
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Autoplay Well Done for soak/load testing.')
+    parser.add_argument('--qt', action='store_true', help='drive the real GamePage (offscreen Qt)')
+    parser.add_argument('--games', type=int, default=1)
+    parser.add_argument('--minutes', type=float, default=None, help='stop after this much wall time')
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--report-every', type=int, default=50, help='served dishes per report window')
+    parser.add_argument('--record', action='store_true', help='record the input session (--qt)')
+    parser.add_argument('--out', help='write the JSON report here')
+    args = parser.parse_args(argv)
+
+    if args.qt:
+        driver = WidgetDriver(seed=args.seed, record=args.record)
+    else:
+        driver = StateDriver(seed=args.seed)
+    games = args.games if args.minutes is None else sys.maxsize
+    seconds = args.minutes * 60.0 if args.minutes is not None else None
+    try:
+        report = soak(driver, games=games, seconds=seconds, report_every=args.report_every)
+    finally:
+        driver.close()
+
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.out:
+        with open(args.out, 'w', encoding='utf-8') as f:
+            f.write(text)
+    print(text)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,106 @@
+"""
+collision grid ของกำแพงในครัว (ไม่ใช้ Qt)
+
+กำแพงถูก rasterize ครั้งเดียวเป็น occupancy grid แล้วทำ summed-area table
+ถามว่า "สี่เหลี่ยมนี้ชนกำแพงไหม" ได้ใน O(1) ไม่ว่าจะมีกำแพงกี่ชิ้น
+
+    grid = CollisionGrid(WALL_ZONES)
+    grid.is_free(x, y, w, h)
+"""
+import math
+
+# ขนาดช่องใหญ่สุด (ถ้าพิกัดกำแพงหารลงตัวด้วยค่าที่ใหญ่กว่านี้ก็ยังใช้ค่านี้)
+MAX_CELL = 16
+
+
+def fit_cell(zones, max_cell=MAX_CELL):
+    """ขนาดช่องที่ใหญ่ที่สุดที่ขอบกำแพงทุกด้านตรงเส้น grid พอดี (grid จึงไม่ block เกินจริง)"""
+    cell = 0
+    for zone in zones:
+        for value in zone:
+            cell = math.gcd(cell, int(value))
+    cell = cell or 1
+    # ลดลงเป็นตัวหารที่ไม่เกิน max_cell
+    for size in range(min(cell, max_cell), 0, -1):
+        if cell % size == 0:
+            return size
+    return 1
+
+
+class CollisionGrid(object):
+    __slots__ = ('cell', 'cols', 'rows', 'zones', '_sat')
+
+    def __init__(self, zones, size=None, cell=None):
+        self.zones = [tuple(int(v) for v in zone) for zone in zones]
+        self.cell = cell or fit_cell(self.zones)
+        width = max([x + w for x, y, w, h in self.zones] + [size[0] if size else 0])
+        height = max([y + h for x, y, w, h in self.zones] + [size[1] if size else 0])
+        self.cols = -(-width // self.cell)
+        self.rows = -(-height // self.cell)
+        self._sat = self._build()
+
+    def _build(self):
+        cell, cols, rows = self.cell, self.cols, self.rows
+        occupied = [[0] * cols for _ in range(rows)]
+        for x, y, w, h in self.zones:
+            if w <= 0 or h <= 0:
+                continue
+            for j in range(y // cell, (y + h - 1) // cell + 1):
+                row = occupied[j]
+                for i in range(x // cell, (x + w - 1) // cell + 1):
+                    row[i] = 1
+
+        # summed-area table ขนาด (rows + 1) x (cols + 1)
+        sat = [[0] * (cols + 1)]
+        for j in range(rows):
+            prev = sat[j]
+            line = [0] * (cols + 1)
+            running = 0
+            row = occupied[j]
+            for i in range(cols):
+                running += row[i]
+                line[i + 1] = prev[i + 1] + running
+            sat.append(line)
+        return sat
+
+    def blocked_cells(self, i0, j0, i1, j1):
+        """จำนวนช่องที่เป็นกำแพงในช่วง [i0, i1] x [j0, j1] (รวมขอบ)"""
+        i0 = max(i0, 0)
+        j0 = max(j0, 0)
+        i1 = min(i1, self.cols - 1)
+        j1 = min(j1, self.rows - 1)
+        if i0 > i1 or j0 > j1:
+            return 0
+        sat = self._sat
+        return sat[j1 + 1][i1 + 1] - sat[j0][i1 + 1] - sat[j1 + 1][i0] + sat[j0][i0]
+
+    def is_free(self, x, y, w, h):
+        """True ถ้าสี่เหลี่ยม (x, y, w, h) ไม่ทับกำแพง (ขอบชนกันพอดีถือว่าไม่ทับ)"""
+        if w <= 0 or h <= 0:
+            return True
+        cell = self.cell
+        x, y = int(x), int(y)
+        return self.blocked_cells(x // cell, y // cell,
+                                  (x + int(w) - 1) // cell, (y + int(h) - 1) // cell) == 0
+
+    def slide(self, x, y, w, h, dx, dy):
+        """
+        ขยับทีละแกน (x ก่อนแล้ว y) ถ้าแกนไหนชนจะขยับเท่าที่ไปได้จนชิดกำแพง
+        จึงเดินเลียบกำแพงได้แทนการหยุดทั้งก้าว → คืนตำแหน่งใหม่ (x, y)
+        """
+        if dx:
+            x = self._advance(x, dx, lambda nx: self.is_free(nx, y, w, h))
+        if dy:
+            y = self._advance(y, dy, lambda ny: self.is_free(x, ny, w, h))
+        return x, y
+
+    @staticmethod
+    def _advance(pos, delta, free):
+        if free(pos + delta):
+            return pos + delta
+        step = 1 if delta > 0 else -1
+        # ถอยทีละพิกเซลจนเจอจุดที่ว่าง (ไม่เกิน |delta| ครั้ง, ครั้งละ O(1))
+        for moved in range(delta - step, 0, -step):
+            if free(pos + moved):
+                return pos + moved
+        return pos
@@ -0,0 +1,100 @@
+"""
+logger กลางของเกม (แทน print ที่เคยเรียกทุกครั้งที่กดปุ่ม)
+
+ใช้แบบ %-format เพื่อให้ข้อความที่ระดับไม่ถึงไม่ถูก format เลย:
+    log = wdlog.get_logger('util')
+    log.debug('วาง %s บนเขียง', item_name)
+
+โหมด (ตั้งผ่าน configure() หรือ environment variable WELLDONEGAME_LOG):
+    'quiet'   : ค่าเริ่มต้น เก็บเฉพาะ WARNING ขึ้นไป, debug/info แทบไม่มีต้นทุน
+    'buffer'  : เก็บทุกระดับไว้ใน ring buffer (ไม่พิมพ์ออก Script Editor) เรียก dump() เมื่อต้องการดู
+    'verbose' : พิมพ์ทุกระดับออก Script Editor เหมือน print เดิม
+"""
+import os
+import sys
+import logging
+import collections
+
+LOGGER_NAME = 'wellDoneGame'
+RING_SIZE = 1000
+FORMAT = '%(asctime)s %(levelname)s [%(name)s] %(message)s'
+
+MODES = {
+    # mode: (ระดับของ logger, ระดับที่พิมพ์ออก console)
+    'quiet': (logging.WARNING, logging.WARNING),
+    'buffer': (logging.DEBUG, logging.WARNING),
+    'verbose': (logging.DEBUG, logging.DEBUG),
+}
+
+
+class RingBufferHandler(logging.Handler):
+    """เก็บ LogRecord ล่าสุดไว้ในหน่วยความจำ (format ตอน dump เท่านั้น)"""
+
+    def __init__(self, capacity=RING_SIZE):
+        super().__init__(logging.DEBUG)
+        self.records = collections.deque(maxlen=capacity)
+
+    def emit(self, record):
+        self.records.append(record)
+
+    def lines(self, last=None):
+        records = list(self.records)
+        if last is not None:
+            records = records[-last:]
+        return [self.format(r) for r in records]
+
+    def clear(self):
+        self.records.clear()
+
+
+logger = logging.getLogger(LOGGER_NAME)
+# ไม่ส่งต่อให้ root logger ของ Maya (จะได้ไม่พิมพ์ซ้ำ)
+logger.propagate = False
+
+# module ถูก reload ได้ใน Maya → ใช้ handler เดิมถ้ามีอยู่แล้ว
+ring = None
+console = None
+for _handler in logger.handlers:
+    if type(_handler).__name__ == 'RingBufferHandler':
+        ring = _handler
+    elif isinstance(_handler, logging.StreamHandler):
+        console = _handler
+if ring is None:
+    ring = RingBufferHandler()
+    logger.addHandler(ring)
+if console is None:
+    console = logging.StreamHandler(sys.stdout)
+    logger.addHandler(console)
+for _handler in (ring, console):
+    _handler.setFormatter(logging.Formatter(FORMAT, '%H:%M:%S'))
+
+mode = None
+
+
+def configure(new_mode='quiet'):
+    """เปลี่ยนโหมดของ log: 'quiet', 'buffer' หรือ 'verbose'"""
+    global mode
+    if new_mode not in MODES:
+        raise ValueError(f"mode ต้องเป็นหนึ่งใน {sorted(MODES)}")
+    logger_level, console_level = MODES[new_mode]
+    logger.setLevel(logger_level)
+    console.setLevel(console_level)
+    mode = new_mode
+    return mode
+
+
+def get_logger(name=None):
+    return logger.getChild(name) if name else logger
+
+
+def dump(last=None, stream=None):
+    """พิมพ์ log ที่เก็บไว้ใน ring buffer (last = จำนวนบรรทัดล่าสุด)"""
+    lines = ring.lines(last)
+    stream = stream or sys.stdout
+    for line in lines:
+        stream.write(line + '\n')
+    return lines
+
+
+_env_mode = os.environ.get('WELLDONEGAME_LOG', 'quiet')
+configure(_env_mode if _env_mode in MODES else 'quiet')
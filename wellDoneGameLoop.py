@@ -0,0 +1,86 @@
+from PySide6 import QtCore
+
+try:
+    from . import wellDoneGameState as wdstate
+except Exception:
+    import wellDoneGameState as wdstate
+try:
+    from . import wellDoneGameUtil as wdutil
+except Exception:
+    import wellDoneGameUtil as wdutil
+
+# ความถี่ที่ขอให้ Qt ปลุก (ถ้า Maya ยุ่งจนปลุกช้า FixedStep จะไล่ tick ให้ทันเอง)
+FRAME_MS = 16
+
+
+class GameLoop(QtCore.QObject):
+    """
+    loop ของ GameWidget
+    - เดิน state ทีละ tick คงที่ตามเวลาจริง (wdstate.FixedStep) → ความเร็วเชฟไม่ขึ้นกับภาระของ Maya
+    - วาดเชฟที่ตำแหน่ง interpolate ระหว่าง tick ก่อนหน้ากับ tick ล่าสุด
+    - หยุด timer เองเมื่อไม่มีอะไรขยับ (wdstate.is_idle) และตื่นเมื่อกดปุ่ม (wake)
+    """
+
+    def __init__(self, game_widget, frame_ms=FRAME_MS):
+        super().__init__(game_widget)
+        self.game_widget = game_widget
+        self.clock = wdstate.FixedStep()
+        self.paused = False
+        self.frames = 0
+        self.steps = 0
+        self._prev = None
+
+        self.timer = QtCore.QTimer(self)
+        self.timer.setTimerType(QtCore.Qt.PreciseTimer)
+        self.timer.setInterval(frame_ms)
+        self.timer.timeout.connect(self._frame)
+
+    def is_running(self):
+        return self.timer.isActive()
+
+    def wake(self):
+        if self.paused or self.timer.isActive():
+            return
+        self.clock.reset()
+        self._prev = None
+        self.timer.start()
+
+    def pause(self):
+        self.paused = True
+        self.timer.stop()
+
+    def resume(self):
+        self.paused = False
+        self.wake()
+
+    def _frame(self):
+        state = self.game_widget.state
+        chef = state.chef
+        for _ in range(self.clock.advance()):
+            self._prev = (chef.x, chef.y)
+            wdstate.step(state, self.clock.step)
+            self.steps += 1
+        self.frames += 1
+
+        if wdstate.is_idle(state):
+            # วาดตำแหน่งจริงครั้งสุดท้ายแล้วหลับจนกว่าจะกดปุ่ม
+            wdutil.sync_view(self.game_widget)
+            self.timer.stop()
+            return
+        wdutil.sync_view(self.game_widget, self._interpolated(chef))
+
+    def _interpolated(self, chef):
+        if self._prev is None:
+            return None
+        alpha = self.clock.alpha()
+        prev_x, prev_y = self._prev
+        return (round(prev_x + (chef.x - prev_x) * alpha),
+                round(prev_y + (chef.y - prev_y) * alpha))
+
+    def stats(self):
+        return {
+            'running': self.timer.isActive(),
+            'paused': self.paused,
+            'frames': self.frames,
+            'steps': self.steps,
+        }
@@ -0,0 +1,86 @@
+from PySide6 import QtWidgets, QtCore
+
+# จำนวน label ที่สร้างเตรียมไว้ตั้งแต่แรก
+PREWARM = 16
+
+
+class SpritePool(object):
+    """
+    pool ของ QLabel สำหรับ sprite ชั่วคราว (วัตถุดิบ, จาน, ไอคอนที่เชฟถือ)
+    หยิบ/วางของแต่ละครั้งจะยืม label ที่สร้างไว้แล้วแทนการสร้าง QLabel ใหม่และ deleteLater ของเก่า
+    """
+
+    def __init__(self, parent, prewarm=PREWARM, factory=None):
+        self.parent = parent
+        # factory: ถ้า GameWidget วาดแบบ surface จะส่ง SpriteSurface.create มาแทน QLabel
+        self.factory = factory
+        self._free = []
+        self._in_use = set()
+        self.created = 0
+        self.acquired = 0
+        self.released = 0
+        self.high_water = 0
+        for _ in range(prewarm):
+            self._free.append(self._create())
+
+    def _create(self):
+        if self.factory is not None:
+            label = self.factory()
+        else:
+            label = QtWidgets.QLabel(self.parent)
+            label.setAttribute(QtCore.Qt.WA_TranslucentBackground)
+            label.setStyleSheet('background: transparent;')
+        label.setScaledContents(True)
+        label.hide()
+        self.created += 1
+        return label
+
+    def owns(self, label):
+        return id(label) in self._in_use
+
+    def acquire(self, pixmap=None, size=None, pos=None):
+        """ยืม label จาก pool (ตั้งภาพ/ขนาด/ตำแหน่งให้ แล้ว show)"""
+        label = self._free.pop() if self._free else self._create()
+        self._in_use.add(id(label))
+        self.acquired += 1
+        self.high_water = max(self.high_water, len(self._in_use))
+
+        label.ingredient_icons = []
+        if pixmap is not None:
+            label.setPixmap(pixmap)
+        if size is not None:
+            label.resize(*size)
+        if pos is not None:
+            label.move(pos)
+        label.raise_()
+        label.show()
+        return label
+
+    def release(self, label):
+        """คืน label เข้า pool (รวมถึงไอคอนวัตถุดิบที่ผูกกับจานนั้น)"""
+        if label is None or id(label) not in self._in_use:
+            return False
+
+        for icon in list(getattr(label, 'ingredient_icons', []) or []):
+            self.release(icon)
+        label.ingredient_icons = []
+
+        self._in_use.discard(id(label))
+        label.hide()
+        label.clear()
+        label.setProperty('item_name', None)
+        if hasattr(label, 'item_name'):
+            del label.item_name
+        self._free.append(label)
+        self.released += 1
+        return True
+
+    def stats(self):
+        return {
+            'size': self.created,
+            'free': len(self._free),
+            'in_use': len(self._in_use),
+            'high_water': self.high_water,
+            'acquired': self.acquired,
+            'released': self.released,
+        }
@@ -0,0 +1,131 @@
+"""
+สูตรอาหารที่คอมไพล์ครั้งเดียวจาก RECIPE_DICT (ไม่ใช้ Qt)
+
+- match(items)            : เมนูที่ตรงกับวัตถุดิบบนจานแบบนับจำนวน (multiset) พอดี
+- advance(state, item)    : ใส่วัตถุดิบเพิ่ม 1 ชิ้น → state ใหม่ของจาน (O(1) ต่อชิ้น)
+- reachable(state)        : เมนูที่ยังทำต่อได้จากของบนจานตอนนี้
+- complete(state)         : เมนูที่ของบนจานครบพอดี (None ถ้ายังไม่ครบ)
+
+state ของจานคือ sub-multiset ของสูตรใดสูตรหนึ่ง ถ้าใส่ของที่ไม่มีสูตรไหนใช้ต่อได้ จะเป็น DEAD
+"""
+import collections
+
+try:
+    from .recipe_data import RECIPE_DICT, SCORE_DICT  # type: ignore
+except Exception:
+    # Fallback recipe mapping: keys are frozensets of ingredient names (use chopped names where appropriate)
+    RECIPE_DICT = {
+        frozenset(['lettuce_chopped']): 'lettuce_salad',
+        frozenset(['tomato_chopped', 'lettuce_chopped']): 'tomato_lettuce_salad',
+        frozenset(['tomato_chopped', 'lettuce_chopped', 'cucamber_chopped']): 'delux_salad',
+        frozenset(['tomato_soup']): 'tomato_soup',
+    }
+    SCORE_DICT = {
+        'lettuce_salad': 5,
+        'tomato_lettuce_salad': 10,
+        'delux_salad': 15,
+        'tomato_soup': 20,
+    }
+
+DEAD = -1
+
+
+def clean_name(item):
+    return item.strip().lower()
+
+
+def multiset_key(items):
+    """ชื่อวัตถุดิบเรียงแล้ว (ซ้ำได้) ใช้เป็น key ของ multiset"""
+    return tuple(sorted(clean_name(item) for item in items))
+
+
+class RecipeBook(object):
+    """
+    สูตรทั้งหมดคอมไพล์เป็นตาราง transition ของ sub-multiset
+    key ของสูตรเป็น frozenset (1 ชิ้นต่อชนิด) หรือ tuple/list ที่มีชื่อซ้ำได้ (เช่น มะเขือเทศ 2 ชิ้น)
+    """
+    __slots__ = ('recipes', 'scores', 'used_names', '_keys', '_transitions', '_reachable', '_complete')
+
+    def __init__(self, recipe_dict, score_dict=None):
+        self.recipes = {}           # multiset key → เมนู
+        for key, name in recipe_dict.items():
+            self.recipes[multiset_key(key)] = name
+        self.scores = dict(score_dict or {})
+        self.used_names = frozenset(item for key in self.recipes for item in key)
+
+        self._keys = []             # state id → multiset key
+        self._transitions = {}      # (state id, วัตถุดิบ) → state id
+        self._reachable = []        # state id → frozenset ของเมนูที่ยังทำได้
+        self._complete = []         # state id → เมนูที่ครบพอดี
+        self._compile()
+
+    def _compile(self):
+        ids = {}
+        reachable = collections.defaultdict(set)
+
+        # ทุก sub-multiset ของทุกสูตรคือ state หนึ่ง
+        for recipe_key, name in self.recipes.items():
+            counts = collections.Counter(recipe_key)
+            names = sorted(counts)
+            subsets = [()]
+            for item in names:
+                subsets = [sub + (item,) * n for sub in subsets for n in range(counts[item] + 1)]
+            for sub in subsets:
+                sub = tuple(sorted(sub))
+                if sub not in ids:
+                    ids[sub] = len(self._keys)
+                    self._keys.append(sub)
+                reachable[sub].add(name)
+
+        for key in self._keys:
+            self._reachable.append(frozenset(reachable[key]))
+            self._complete.append(self.recipes.get(key))
+
+        # transition: เพิ่มวัตถุดิบ 1 ชิ้นแล้วยังเป็น sub-multiset ของบางสูตร
+        for key, state in ids.items():
+            for item in self.used_names:
+                nxt = ids.get(tuple(sorted(key + (item,))))
+                if nxt is not None:
+                    self._transitions[(state, item)] = nxt
+
+    # ---------- query ----------
+    @property
+    def start(self):
+        return 0 if self._keys else DEAD
+
+    def advance(self, state, item):
+        if state == DEAD:
+            return DEAD
+        return self._transitions.get((state, clean_name(item)), DEAD)
+
+    def state_of(self, items):
+        state = self.start
+        for item in items:
+            state = self.advance(state, item)
+        return state
+
+    def reachable(self, state):
+        return self._reachable[state] if state != DEAD else frozenset()
+
+    def complete(self, state):
+        return self._complete[state] if state != DEAD else None
+
+    def match(self, items):
+        return self.recipes.get(multiset_key(items))
+
+    def score(self, name):
+        return self.scores.get(name, 0)
+
+    def needs_chopping(self, item_name):
+        """True ถ้าสูตรใช้ชื่อ <item>_chopped แต่ไม่ใช้ <item> ดิบ"""
+        return item_name not in self.used_names and f'{item_name}_chopped' in self.used_names
+
+    def stats(self):
+        return {
+            'recipes': len(self.recipes),
+            'states': len(self._keys),
+            'transitions': len(self._transitions),
+        }
+
+
+book = RecipeBook(RECIPE_DICT, SCORE_DICT)
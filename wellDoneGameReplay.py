@@ -0,0 +1,206 @@
+"""
+บันทึก/เล่นซ้ำ session ของเกม (ไม่ใช้ Qt)
+
+Recorder เก็บทุก input ที่เข้า GameState (กดปุ่ม, ปล่อยปุ่ม, นาฬิกาเกม, pause, restart, ขนาดฉาก)
+พร้อม tick ที่เกิด และ seed ที่ใช้สุ่มออเดอร์ แล้วเซฟเป็นไฟล์ .wdsession (JSON บีบอัด gzip)
+replay() ป้อน input ชุดเดิมกลับเข้า state ใหม่เร็วที่สุดเท่าที่ทำได้ โดยไม่ต้องเปิดหน้าต่าง
+
+    python wellDoneGameReplay.py session.wdsession [--check]
+"""
+import sys
+import gzip
+import json
+import time
+import argparse
+
+try:
+    from . import wellDoneGameState as wdstate
+except Exception:
+    import wellDoneGameState as wdstate
+
+FORMAT_VERSION = 1
+EXTENSION = '.wdsession'
+
+# ชนิด event → รหัสสั้นในไฟล์
+CODES = {
+    'down': 'd',
+    'up': 'u',
+    'clock': 'c',
+    'pause': 'p',
+    'resume': 'r',
+    'reset': 'R',
+    'size': 's',
+    'release_all': 'a',
+}
+KINDS = {code: kind for kind, code in CODES.items()}
+
+
+class Recorder(object):
+    """บันทึก input ของ GameState ตั้งแต่ตอน attach (ควร attach ทันทีหลังสร้าง state)"""
+    __slots__ = ('header', 'events', '_last_tick', 'final')
+
+    def __init__(self, header=None, events=None, final=None):
+        self.header = header or {}
+        self.events = events or []      # [tick ที่ห่างจาก event ก่อน, รหัส, *args]
+        self._last_tick = 0
+        self.final = final
+
+    @classmethod
+    def attach(cls, state):
+        recorder = cls({
+            'version': FORMAT_VERSION,
+            'seed': state.seed,
+            'catalog': list(state.catalog),
+            'size': [state.width, state.height],
+            'remaining_time': state.remaining_time,
+            'recorded_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+        })
+        recorder._last_tick = state.ticks
+        state.recorder = recorder
+        return recorder
+
+    def record(self, tick, kind, *args):
+        # เก็บ tick เป็นระยะห่างจาก event ก่อน (ตัวเลขเล็ก ไฟล์จึงเล็ก)
+        self.events.append([tick - self._last_tick, CODES[kind]] + list(args))
+        # หลัง reset state.ticks เริ่มนับ 0 ใหม่
+        self._last_tick = 0 if kind == 'reset' else tick
+
+    def __len__(self):
+        return len(self.events)
+
+    def finish(self, state):
+        """เก็บผลสุดท้ายไว้ตรวจตอน replay"""
+        self.final = summary(state)
+        return self.final
+
+    # ---------- ไฟล์ ----------
+    def to_dict(self):
+        return {'header': self.header, 'events': self.events, 'final': self.final}
+
+    def save(self, path, state=None):
+        if state is not None:
+            self.finish(state)
+        data = json.dumps(self.to_dict(), separators=(',', ':'), ensure_ascii=False)
+        with gzip.open(path, 'wt', encoding='utf-8') as f:
+            f.write(data)
+        return path
+
+    @classmethod
+    def load(cls, path):
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            data = json.load(f)
+        version = data.get('header', {}).get('version')
+        if version != FORMAT_VERSION:
+            raise ValueError(f'ไม่รองรับ session version {version}')
+        return cls(data['header'], data['events'], data.get('final'))
+
+
+# ------------------- replay -------------------
+def _apply(state, kind, args):
+    if kind == 'down':
+        wdstate.press_key(state, args[0])
+    elif kind == 'up':
+        wdstate.release_key(state, args[0])
+    elif kind == 'clock':
+        wdstate.tick_clock(state)
+    elif kind == 'pause':
+        wdstate.pause(state)
+    elif kind == 'resume':
+        wdstate.resume(state)
+    elif kind == 'reset':
+        state.reset(seed=args[0], remaining_time=args[1])
+    elif kind == 'size':
+        wdstate.resize(state, args[0], args[1])
+    elif kind == 'release_all':
+        wdstate.release_all(state)
+    else:
+        raise ValueError(f'ไม่รู้จัก event: {kind}')
+
+
+def replay(session, state=None):
+    """เล่น session (Recorder หรือ path) ซ้ำบน GameState ใหม่ → state สุดท้าย"""
+    if not isinstance(session, Recorder):
+        session = Recorder.load(session)
+    header = session.header
+    if state is None:
+        state = wdstate.GameState(seed=header['seed'], catalog=header['catalog'],
+                                  size=tuple(header['size']),
+                                  remaining_time=header['remaining_time'])
+
+    for event in session.events:
+        delta, code, args = event[0], event[1], event[2:]
+        for _ in range(delta):
+            wdstate.step(state)
+        _apply(state, KINDS[code], args)
+        state.events.clear()
+
+    # เดินต่อจนถึง tick สุดท้ายตอนบันทึก
+    final = session.final or {}
+    for _ in range(max(0, final.get('ticks', state.ticks) - state.ticks)):
+        wdstate.step(state)
+    state.events.clear()
+    return state
+
+
+def summary(state):
+    """สถานะที่ใช้เทียบผล replay (ไม่รวม id ภายใน)"""
+    chef = state.chef
+    return {
+        'score': state.score,
+        'remaining_time': state.remaining_time,
+        'ticks': state.ticks,
+        'orders': list(state.orders),
+        'chef': [chef.x, chef.y],
+        'held_item': chef.held_item,
+        'held_plate': list(chef.held_plate.items) if chef.held_plate is not None else None,
+        'floor': sorted([i.name, i.x, i.y] for i in state.floor_items),
+        'board': [i.name for i in state.board_items],
+        'pot': [i.name for i in state.pot_items],
+        'soup_ready': state.soup_ready,
+        'station_plate': list(state.station_plate.items),
+        'plates': sorted([p.x, p.y] + sorted(p.items) for p in state.dropped_plates),
+        'game_over': state.game_over,
+    }
+
+
+def diff(expected, actual):
+    """key ที่ต่างกันระหว่าง summary สองชุด"""
+    return {
+        key: (expected.get(key), actual.get(key))
+        for key in sorted(set(expected) | set(actual))
+        if expected.get(key) != actual.get(key)
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Replay a recorded Well Done session headlessly.')
+    parser.add_argument('session')
+    parser.add_argument('--check', action='store_true', help='fail if the result differs from the recording')
+    args = parser.parse_args(argv)
+
+    session = Recorder.load(args.session)
+    start = time.perf_counter()
+    state = replay(session)
+    elapsed = time.perf_counter() - start
+    result = summary(state)
+
+    report = {
+        'session': args.session,
+        'events': len(session),
+        'ticks': state.ticks,
+        'seconds': round(elapsed, 4),
+        'ticks_per_second': int(state.ticks / elapsed) if elapsed else None,
+        'score': state.score,
+    }
+    mismatch = diff(session.final, result) if session.final else {}
+    report['match'] = not mismatch if session.final else None
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+
+    if args.check and mismatch:
+        print(json.dumps(mismatch, indent=2, ensure_ascii=False), file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
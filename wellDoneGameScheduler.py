@@ -0,0 +1,170 @@
+"""
+ตัวจัดงานที่ใช้เวลา (หั่น, ต้ม) ตามนาฬิกาเกม (ไม่ใช้ Qt)
+
+- งานของแต่ละ station เข้าคิวทำทีละงาน (เขียงหั่นทีละชิ้น, หม้อต้มทีละหม้อ)
+- งานที่กำลังทำอยู่เก็บใน heap เรียงตามเวลาเสร็จ → advance() ดูแค่หัว heap
+- pause/resume พร้อม overlay, cancel ตอน restart, progress() สำหรับวาดแถบ
+- take_started() คืนงานที่เพิ่งเริ่มทำจริง (ไม่ใช่ตอนเข้าคิว) ใช้แจ้งผู้เล่น
+
+    sched = Scheduler()
+    sched.schedule('chopping_board', 'chop', 3.0, target=item)
+    for job in sched.advance(dt):
+        ...
+"""
+import heapq
+import itertools
+import collections
+
+
+class Job(object):
+    __slots__ = ('id', 'station', 'kind', 'target', 'duration', 'start', 'due', 'cancelled')
+
+    def __init__(self, job_id, station, kind, duration, target=None):
+        self.id = job_id
+        self.station = station
+        self.kind = kind
+        self.target = target
+        self.duration = float(duration)
+        self.start = None       # เวลาที่เริ่มทำจริง (None = ยังรอคิว)
+        self.due = None
+        self.cancelled = False
+
+    def __repr__(self):
+        return f'Job({self.id}, {self.station!r}, {self.kind!r}, due={self.due})'
+
+
+class Scheduler(object):
+    __slots__ = ('time', 'paused', '_heap', '_queues', '_running', '_ids', '_started')
+
+    def __init__(self):
+        self.time = 0.0
+        self.paused = False
+        self._heap = []                                 # (due, id, job) ของงานที่กำลังทำ
+        self._queues = collections.defaultdict(collections.deque)   # station → งานที่รอคิว
+        self._running = {}                              # station → งานที่กำลังทำ
+        self._ids = itertools.count(1)
+        self._started = []                              # งานที่เริ่มทำแล้วแต่ยังไม่ถูก take_started()
+
+    # ---------- เพิ่ม/ยกเลิกงาน ----------
+    def schedule(self, station, kind, duration, target=None):
+        job = Job(next(self._ids), station, kind, duration, target)
+        if station in self._running:
+            self._queues[station].append(job)
+        else:
+            self._start(job, self.time)
+        return job
+
+    def _start(self, job, start):
+        job.start = start
+        job.due = start + job.duration
+        self._running[job.station] = job
+        heapq.heappush(self._heap, (job.due, job.id, job))
+        self._started.append(job)
+
+    def take_started(self):
+        """งานที่เริ่มทำตั้งแต่เรียกครั้งก่อน (เรียงตามเวลาเริ่ม) ข้ามงานที่ถูกยกเลิกไปแล้ว"""
+        started = [job for job in self._started if not job.cancelled]
+        self._started = []
+        return started
+
+    def cancel(self, job):
+        if job.cancelled:
+            return False
+        job.cancelled = True
+        if self._running.get(job.station) is job:
+            # งานถัดไปในคิวเริ่มทันที (ตัวเก่าใน heap ถูกข้ามตอน pop)
+            del self._running[job.station]
+            self._start_next(job.station, self.time)
+        else:
+            try:
+                self._queues[job.station].remove(job)
+            except ValueError:
+                pass
+        return True
+
+    def cancel_station(self, station):
+        jobs = list(self._queues.pop(station, ()))
+        running = self._running.pop(station, None)
+        if running is not None:
+            jobs.append(running)
+        for job in jobs:
+            job.cancelled = True
+        return len(jobs)
+
+    def cancel_all(self):
+        count = sum(len(q) for q in self._queues.values()) + len(self._running)
+        for job in itertools.chain(self._running.values(), *self._queues.values()):
+            job.cancelled = True
+        self._heap = []
+        self._queues.clear()
+        self._running.clear()
+        return count
+
+    # ---------- เวลา ----------
+    def pause(self):
+        self.paused = True
+
+    def resume(self):
+        self.paused = False
+
+    def advance(self, dt):
+        """เดินนาฬิกา dt วินาที → list ของงานที่เสร็จ (เรียงตามเวลาเสร็จ)"""
+        if self.paused:
+            return []
+        self.time += dt
+        done = []
+        heap = self._heap
+        while heap and heap[0][0] <= self.time:
+            due, _, job = heapq.heappop(heap)
+            if job.cancelled or self._running.get(job.station) is not job:
+                continue
+            del self._running[job.station]
+            done.append(job)
+            # งานถัดไปเริ่มต่อจากเวลาที่งานนี้เสร็จ (ไม่เสียเวลาถ้า dt ใหญ่)
+            self._start_next(job.station, due)
+        return done
+
+    def _start_next(self, station, start):
+        queue = self._queues.get(station)
+        while queue:
+            job = queue.popleft()
+            if not job.cancelled:
+                self._start(job, start)
+                return job
+        return None
+
+    def next_due(self):
+        """วินาทีจนถึงงานถัดไปที่จะเสร็จ (None ถ้าไม่มีงาน)"""
+        while self._heap and self._heap[0][2].cancelled:
+            heapq.heappop(self._heap)
+        if not self._heap:
+            return None
+        return max(0.0, self._heap[0][0] - self.time)
+
+    # ---------- สถานะ ----------
+    def pending(self):
+        return len(self._running) + sum(len(q) for q in self._queues.values())
+
+    def jobs(self, station=None):
+        stations = [station] if station is not None else list(self._running)
+        result = []
+        for name in stations:
+            if name in self._running:
+                result.append(self._running[name])
+            result.extend(self._queues.get(name, ()))
+        return result
+
+    def progress(self, job):
+        """0.0 - 1.0 ของงาน (งานที่รอคิวเป็น 0)"""
+        if job.start is None or job.cancelled:
+            return 0.0
+        if job.duration <= 0:
+            return 1.0
+        return min(1.0, max(0.0, (self.time - job.start) / job.duration))
+
+    def progress_by_station(self):
+        """station → (kind, progress, จำนวนงานที่รอคิว) ของงานที่กำลังทำ"""
+        return {
+            station: (job.kind, self.progress(job), len(self._queues.get(station, ())))
+            for station, job in self._running.items()
+        }
@@ -0,0 +1,109 @@
+"""
+spatial index แบบ uniform grid สำหรับหา object ที่ใกล้ที่สุด (ไม่ใช้ Qt)
+
+เก็บ object เป็นจุดที่ center() ของมัน แยกตามชนิด (kind) เช่น 'source', 'floor', 'board', 'plate'
+query หนึ่งครั้งดูเฉพาะช่อง grid ที่อยู่ในรัศมี ไม่ต้องไล่ทุก object ในฉาก
+
+    grid = SpatialGrid()
+    grid.insert(item, 'floor')
+    grid.nearest('floor', x, y, 80)
+"""
+import math
+
+CELL_SIZE = 64
+
+
+class SpatialGrid(object):
+    __slots__ = ('cell', '_cells', '_where')
+
+    def __init__(self, cell=CELL_SIZE):
+        self.cell = cell
+        self._cells = {}        # (kind, i, j) → [obj, ...]
+        self._where = {}        # obj → (kind, i, j)
+
+    def _key(self, kind, obj):
+        x, y = obj.center()
+        return (kind, int(x // self.cell), int(y // self.cell))
+
+    def __contains__(self, obj):
+        return obj in self._where
+
+    def __len__(self):
+        return len(self._where)
+
+    def clear(self):
+        self._cells.clear()
+        self._where.clear()
+
+    def insert(self, obj, kind):
+        if obj in self._where:
+            self.remove(obj)
+        key = self._key(kind, obj)
+        self._cells.setdefault(key, []).append(obj)
+        self._where[obj] = key
+
+    def remove(self, obj):
+        key = self._where.pop(obj, None)
+        if key is None:
+            return False
+        bucket = self._cells[key]
+        bucket.remove(obj)
+        if not bucket:
+            del self._cells[key]
+        return True
+
+    def update(self, obj):
+        """เรียกหลังเปลี่ยนตำแหน่ง object (ย้ายช่องเฉพาะเมื่อข้ามช่อง)"""
+        key = self._where.get(obj)
+        if key is None:
+            return False
+        new_key = self._key(key[0], obj)
+        if new_key != key:
+            self.remove(obj)
+            self._cells.setdefault(new_key, []).append(obj)
+            self._where[obj] = new_key
+        return True
+
+    def kind_of(self, obj):
+        key = self._where.get(obj)
+        return key[0] if key else None
+
+    def count(self, kind=None):
+        if kind is None:
+            return len(self._where)
+        return sum(1 for key in self._where.values() if key[0] == kind)
+
+    def _candidates(self, kind, x, y, radius):
+        cell = self.cell
+        cells = self._cells
+        i0, i1 = int((x - radius) // cell), int((x + radius) // cell)
+        j0, j1 = int((y - radius) // cell), int((y + radius) // cell)
+        for i in range(i0, i1 + 1):
+            for j in range(j0, j1 + 1):
+                bucket = cells.get((kind, i, j))
+                if bucket:
+                    yield from bucket
+
+    def within(self, kind, x, y, radius, accept=None):
+        """object ชนิด kind ทั้งหมดที่ center ห่างจาก (x, y) ไม่เกิน radius"""
+        found = []
+        for obj in self._candidates(kind, x, y, radius):
+            if accept is not None and not accept(obj):
+                continue
+            ox, oy = obj.center()
+            if math.hypot(ox - x, oy - y) <= radius:
+                found.append(obj)
+        return found
+
+    def nearest(self, kind, x, y, radius, accept=None):
+        """object ชนิด kind ที่ใกล้ (x, y) ที่สุดภายใน radius (None ถ้าไม่มี)"""
+        best = None
+        best_dist = radius
+        for obj in self._candidates(kind, x, y, radius):
+            if accept is not None and not accept(obj):
+                continue
+            ox, oy = obj.center()
+            dist = math.hypot(ox - x, oy - y)
+            if dist < best_dist or (best is None and dist <= radius):
+                best, best_dist = obj, dist
+        return best
@@ -0,0 +1,946 @@
+"""
+สถานะของเกมแบบไม่ต้องใช้ Qt (headless core)
+
+ทุกกฎของเกม (หยิบ, วาง, หั่น, ต้ม, ใส่จาน, เสิร์ฟ, ทิ้ง) ทำงานกับ GameState ในไฟล์นี้
+ส่วน GameWidget / wellDoneGameUtil เป็นแค่ "ภาพ" ที่วาดตาม state
+จึงจำลองเกมได้หลายพันรอบต่อวินาทีโดยไม่ต้องเปิดหน้าต่าง
+
+    state = GameState(seed=1)
+    press_key(state, 'right')
+    for _ in range(60):
+        step(state)
+"""
+import math
+import time
+import random
+
+try:
+    from . import wellDoneGameLog as wdlog
+except Exception:
+    import wellDoneGameLog as wdlog
+try:
+    from . import wellDoneGameSpatial as wdspatial
+except Exception:
+    import wellDoneGameSpatial as wdspatial
+try:
+    from . import wellDoneGameCollision as wdcollision
+except Exception:
+    import wellDoneGameCollision as wdcollision
+
+try:
+    from . import wellDoneGameScheduler as wdscheduler
+except Exception:
+    import wellDoneGameScheduler as wdscheduler
+try:
+    from . import wellDoneGameRecipe as wdrecipe
+except Exception:
+    import wellDoneGameRecipe as wdrecipe
+
+RECIPE_DICT = wdrecipe.RECIPE_DICT
+SCORE_DICT = wdrecipe.SCORE_DICT
+
+log = wdlog.get_logger('state')
+
+# ------------------- ค่าคงที่ของฉาก -------------------
+ARENA_SIZE = (1200, 675)
+CHEF_START = (200, 200)
+CHEF_SIZE = (111, 133)
+CHEF_SPEED = 9              # พิกเซลต่อ tick
+TICK_SECONDS = 0.016        # 1 tick คงที่ (เชฟเดิน 9 / 0.016 = 562.5 px/s ไม่ว่า Maya จะช้าแค่ไหน)
+MAX_FRAME_SECONDS = 0.25    # frame ที่ค้างนานกว่านี้จะไม่ไล่ step ตามทั้งหมด
+
+GAME_TIME = 300
+RESTART_TIME = 330
+ORDER_COUNT = 3
+DEFAULT_ORDERS = ('delux_salad', 'lettuce_salad', 'tomato_lettuce_salad', 'tomato_soup')
+
+CHOP_SECONDS = 3.0
+COOK_SECONDS = 4.0
+WRONG_DISH_PENALTY = -5
+
+ITEM_SIZE = 40
+PLATE_SIZE = 50
+
+PICK_RANGE = 80             # หยิบวัตถุดิบ
+STATION_RANGE = 120         # วางลงเขียง/หม้อ
+NEAR_RANGE = 60             # is_near_object
+TRASH_RANGE = 40            # is_near_trash
+SERVE_RANGE = 80            # จุดเสิร์ฟ
+PLATE_PICK_RANGE = 40       # หยิบจานจากพื้น
+
+# station: name → (x, y, w, h, image)  (ลำดับเดียวกับ GameWidget.create_game_objects)
+STATIONS = (
+    ('pot', (280, 145, 90, 106, 'pot.png')),
+    ('chopping_board', (427, 180, 70, 50, 'chopping_board.png')),
+    ('serve_station', (1060, 158, 160, 229, 'serve_station.png')),
+    ('plate_station', (1065, 353, 100, 85, 'plate_station.png')),
+    ('trash_bin', (958, 172, 85, 85, 'trash_bin.png')),
+    ('table', (150, 500, 1240, 715, 'table.png')),
+)
+
+# กองวัตถุดิบ (หยิบได้ไม่จำกัด)
+INGREDIENT_SOURCES = (
+    ('tomato', (845, 463, 77, 77, 'tomato.png')),
+    ('lettuce', (783, 448, 85, 125, 'lettuce.png')),
+    ('cucamber', (900, 462, 85, 75, 'cucamber.png')),
+)
+CHOPPABLE = frozenset(name for name, _ in INGREDIENT_SOURCES)
+
+# กำแพงล่องหน (x, y, w, h)
+WALL_ZONES = (
+    (725, 295, 15, 235),
+    (520, 120, 30, 130),
+    (1000, 460, 100, 65),
+    (790, 510, 200, 15),
+    (1130, 180, 80, 250),
+    (65, 290, 80, 110),
+    (195, 80, 355, 65),
+    (715, 80, 260, 65),
+    (195, 480, 355, 50),
+)
+
+# ปุ่มที่ core รู้จัก (GameWidget แปลง Qt key เป็นชื่อเหล่านี้)
+MOVE_KEYS = {
+    'left': (-1, 0),
+    'right': (1, 0),
+    'up': (0, -1),
+    'down': (0, 1),
+}
+
+
+# ------------------- object ในเกม -------------------
+class Rect(object):
+    __slots__ = ('x', 'y', 'w', 'h')
+
+    def __init__(self, x, y, w, h):
+        self.x = x
+        self.y = y
+        self.w = w
+        self.h = h
+
+    def center(self):
+        return (self.x + self.w / 2.0, self.y + self.h / 2.0)
+
+    def intersects(self, other):
+        return (self.x < other.x + other.w and other.x < self.x + self.w and
+                self.y < other.y + other.h and other.y < self.y + self.h)
+
+    def __repr__(self):
+        return f'{type(self).__name__}({self.x}, {self.y}, {self.w}, {self.h})'
+
+
+class Station(Rect):
+    __slots__ = ('name', 'image')
+
+    def __init__(self, name, x, y, w, h, image=None):
+        super().__init__(x, y, w, h)
+        self.name = name
+        self.image = image
+
+
+class Chef(Rect):
+    __slots__ = ('held_item', 'held_plate')
+
+    def __init__(self, x, y, w, h):
+        super().__init__(x, y, w, h)
+        self.held_item = None
+        self.held_plate = None
+
+
+class Item(Rect):
+    """วัตถุดิบที่วางอยู่ในฉาก (พื้น, เขียง, หม้อ)"""
+    __slots__ = ('id', 'name', 'busy')
+
+    def __init__(self, item_id, name, x, y, w=ITEM_SIZE, h=ITEM_SIZE):
+        super().__init__(x, y, w, h)
+        self.id = item_id
+        self.name = name
+        self.busy = False       # กำลังหั่นอยู่ (ที่รอคิวเขียงยังไม่ busy หยิบคืนได้)
+
+
+class Plate(Rect):
+    __slots__ = ('id', 'items', 'recipe')
+
+    def __init__(self, plate_id, items=None, x=0, y=0, w=PLATE_SIZE, h=PLATE_SIZE):
+        super().__init__(x, y, w, h)
+        self.id = plate_id
+        self.items = list(items or [])
+        self.recipe = wdrecipe.book.state_of(self.items)   # state ใน RecipeBook
+
+    def add(self, item_name):
+        self.items.append(item_name)
+        self.recipe = wdrecipe.book.advance(self.recipe, item_name)
+
+    def meal(self):
+        """เมนูที่ของบนจานครบพอดี (None ถ้ายังไม่ตรงสูตร)"""
+        return wdrecipe.book.complete(self.recipe)
+
+    def reachable(self):
+        """เมนูที่ยังทำต่อได้จากของบนจาน"""
+        return wdrecipe.book.reachable(self.recipe)
+
+
+class GameState(object):
+    __slots__ = (
+        'width', 'height', 'seed', 'rng', 'catalog',
+        'chef', 'stations', 'sources', 'walls', 'collision',
+        'floor_items', 'board_items', 'pot_items', 'soup_ready', 'cooking',
+        'station_plate', 'dropped_plates',
+        'orders', 'score', 'remaining_time', 'game_over',
+        'time', 'ticks', 'scheduler', 'pressed', 'events', 'revision', '_next_id',
+        'index', 'recorder',
+    )
+
+    def __init__(self, seed=None, catalog=None, size=ARENA_SIZE, remaining_time=GAME_TIME):
+        self.width, self.height = size
+        self.catalog = list(catalog or DEFAULT_ORDERS)
+        self.stations = {
+            name: Station(name, x, y, w, h, image) for name, (x, y, w, h, image) in STATIONS
+        }
+        self.sources = {
+            name: Station(name, x, y, w, h, image) for name, (x, y, w, h, image) in INGREDIENT_SOURCES
+        }
+        self.walls = [Rect(*zone) for zone in WALL_ZONES]
+        # กำแพงคอมไพล์เป็น grid ครั้งเดียว (ชนหรือไม่ตอบได้ O(1))
+        self.collision = wdcollision.CollisionGrid(WALL_ZONES, size)
+        self.index = wdspatial.SpatialGrid()
+        self.pressed = set()
+        self.events = []
+        self.revision = 0
+        self._next_id = 0
+        self.recorder = None    # wellDoneGameReplay.Recorder (บันทึก input ทุกอย่างที่เข้า state)
+        self.reset(seed=seed, remaining_time=remaining_time)
+
+    def reset(self, seed=None, remaining_time=GAME_TIME):
+        """เริ่มเกมใหม่ (ใช้ทั้งตอนสร้างและตอน restart)"""
+        self.seed = seed if seed is not None else random.randrange(2 ** 31)
+        self.record('reset', self.seed, remaining_time)
+        self.rng = random.Random(self.seed)
+        self.chef = Chef(CHEF_START[0], CHEF_START[1], CHEF_SIZE[0], CHEF_SIZE[1])
+        # station และกองวัตถุดิบอยู่กับที่ ใส่ index ครั้งเดียวต่อเกม
+        self.index.clear()
+        for station in self.stations.values():
+            self.index.insert(station, 'station')
+        for source in self.sources.values():
+            self.index.insert(source, 'source')
+        self.floor_items = []
+        self.board_items = []
+        self.pot_items = []
+        self.soup_ready = False
+        self.cooking = False
+        self.station_plate = self.new_plate()
+        self.dropped_plates = []
+        self.score = 0
+        self.remaining_time = remaining_time
+        self.game_over = False
+        self.time = 0.0
+        self.ticks = 0
+        # งานหั่น/ต้มที่ค้างจากเกมก่อนถูกยกเลิกทั้งหมด
+        self.scheduler = wdscheduler.Scheduler()
+        self.pressed.clear()
+        self.orders = [self.rng.choice(self.catalog) for _ in range(ORDER_COUNT)]
+        self.emit('score', self.score)
+        self.emit('orders')
+        self.touch()
+
+    # ---------- helper ----------
+    def record(self, kind, *args):
+        if self.recorder is not None:
+            self.recorder.record(self.ticks, kind, *args)
+
+    def new_id(self):
+        self._next_id += 1
+        return self._next_id
+
+    def new_item(self, name, x, y):
+        return Item(self.new_id(), name, int(x), int(y))
+
+    def new_plate(self, items=None, x=0, y=0):
+        return Plate(self.new_id(), items, int(x), int(y))
+
+    # ---------- ของที่วาง/หยิบได้ (อัปเดต spatial index ไปพร้อมกัน) ----------
+    def group(self, kind):
+        if kind == 'floor':
+            return self.floor_items
+        if kind == 'board':
+            return self.board_items
+        if kind == 'plate':
+            return self.dropped_plates
+        raise ValueError(f'ไม่รู้จักชนิด: {kind}')
+
+    def place(self, kind, obj):
+        self.group(kind).append(obj)
+        self.index.insert(obj, kind)
+
+    def take(self, obj):
+        kind = self.index.kind_of(obj)
+        if kind is None:
+            return False
+        self.group(kind).remove(obj)
+        self.index.remove(obj)
+        return True
+
+    def nearest(self, kind, target, radius, accept=None):
+        """object ชนิด kind ที่ใกล้ center ของ target ที่สุดภายใน radius"""
+        x, y = target.center()
+        return self.index.nearest(kind, x, y, radius, accept)
+
+    def touch(self):
+        """บอก view ว่ามีของในฉากเปลี่ยน (ไม่นับเชฟเดิน)"""
+        self.revision += 1
+
+    def emit(self, kind, *args):
+        self.events.append((kind,) + args)
+
+    def toast(self, message, duration=3000):
+        self.emit('toast', message, duration)
+
+    def drain_events(self):
+        events, self.events = self.events, []
+        return events
+
+    def station(self, name):
+        return self.stations.get(name)
+
+
+# ------------------- ระยะทาง -------------------
+def distance(a, b):
+    ax, ay = a.center()
+    bx, by = b.center()
+    return math.hypot(ax - bx, ay - by)
+
+
+def is_near_object(obj_a, obj_b, threshold=NEAR_RANGE, mode='center'):
+    """
+    ตรวจว่าวัตถุ obj_a อยู่ใกล้ obj_b หรือไม่
+
+    mode:
+        - 'center' : วัดระยะจากจุดศูนย์กลาง (เหมาะกับ station ทั่วไป)
+        - 'bounds' : วัดจากระยะขอบของ bounding box (เหมาะกับ trash_bin หรือ collision check)
+    """
+    if not (obj_a and obj_b):
+        return False
+
+    if mode == 'center':
+        dist = distance(obj_a, obj_b)
+    elif mode == 'bounds':
+        dx = max(obj_b.x - (obj_a.x + obj_a.w), obj_a.x - (obj_b.x + obj_b.w), 0)
+        dy = max(obj_b.y - (obj_a.y + obj_a.h), obj_a.y - (obj_b.y + obj_b.h), 0)
+        dist = math.hypot(dx, dy)
+    else:
+        raise ValueError("mode ต้องเป็น 'center' หรือ 'bounds'")
+
+    return dist < threshold
+
+
+def is_near_trash(state, threshold=TRASH_RANGE):
+    trash = state.station('trash_bin')
+    if trash is None:
+        return False
+    return distance(state.chef, trash) <= threshold
+
+
+# ------------------- สูตรอาหาร -------------------
+def needs_chopping(item_name):
+    """True ถ้าสูตรใช้ชื่อ <item>_chopped แต่ไม่ใช้ <item> ดิบ"""
+    return wdrecipe.book.needs_chopping(item_name)
+
+
+def match_recipe(items):
+    """คืนชื่อเมนูที่ตรงกับวัตถุดิบบนจานแบบนับจำนวน (None ถ้าไม่ตรงสูตรใด)"""
+    return wdrecipe.book.match(items)
+
+
+# ------------------- การหยิบของ -------------------
+def _not_busy(item):
+    return not item.busy
+
+
+def try_pick_item(state, threshold=PICK_RANGE):
+    chef = state.chef
+    if chef.held_item:
+        log.debug('เชฟถือของอยู่แล้ว 🧺')
+        return False
+
+    # 1️⃣ กองวัตถุดิบ (กองที่ใกล้ที่สุด)
+    source = state.nearest('source', chef, threshold)
+    if source is not None:
+        chef.held_item = source.name
+        state.toast(f'pick {source.name} ✅')
+        state.touch()
+        return True
+
+    # 2️⃣ ของบนพื้น แล้ว 3️⃣ ของบนเขียง
+    for kind in ('floor', 'board'):
+        item = state.nearest(kind, chef, threshold, _not_busy)
+        if item is not None:
+            if kind == 'board':
+                # หยิบของที่รอคิวหั่นคืน → ยกเลิกงานหั่นของชิ้นนั้น
+                job = _chop_job(state, item)
+                if job is not None:
+                    state.scheduler.cancel(job)
+            state.take(item)
+            chef.held_item = item.name
+            log.debug('✅ หยิบวัตถุดิบ: %s', item.name)
+            state.touch()
+            return True
+
+    # 4️⃣ หม้อ
+    pot = state.station('pot')
+    if pot is not None and distance(chef, pot) <= threshold:
+        if state.soup_ready:
+            # ถ้ามีซุปแล้ว ต้องถือจานถึงหยิบได้
+            if try_scoop_soup(state, threshold):
+                return True
+            log.debug('⚠️ ต้องถือจานก่อนถึงจะตักซุปได้!')
+        elif state.pot_items:
+            # เอาไอเทมล่าสุดออกจากหม้อ (ถ้ากำลังต้มอยู่ก็ยกเลิก)
+            item = state.pot_items.pop()
+            state.scheduler.cancel_station('pot')
+            state.cooking = False
+            _layout_pot(state)
+            chef.held_item = item.name
+            log.debug('🥄 หยิบ %s ออกจากหม้อ (ไม่ต้องใช้จาน)', item.name)
+            state.touch()
+            return True
+        else:
+            log.debug('🥣 หม้อยังไม่มีวัตถุดิบให้หยิบ!')
+
+    log.debug('ไม่มีวัตถุดิบใกล้ตัว')
+    return False
+
+
+def try_scoop_soup(state, threshold=PICK_RANGE):
+    'ตักซุปจากหม้อใส่จานที่ถืออยู่'
+    chef = state.chef
+    pot = state.station('pot')
+    if not state.soup_ready or chef.held_plate is None or chef.held_item:
+        return False
+    if pot is None or distance(chef, pot) > threshold:
+        return False
+    state.soup_ready = False
+    chef.held_plate.add('tomato_soup')
+    log.debug('🍲 ตักซุปใส่จาน: %s', chef.held_plate.items)
+    state.touch()
+    return True
+
+
+# ------------------- วางของ -------------------
+def drop_item(state):
+    'วางของจากมือเชฟลงบนเขียง, หม้อ หรือพื้น'
+    chef = state.chef
+    item_name = chef.held_item
+    if not item_name:
+        log.debug('❌ ไม่มีของในมือ')
+        return False
+
+    board = state.station('chopping_board')
+    pot = state.station('pot')
+
+    if board is not None and distance(chef, board) < STATION_RANGE:
+        # 🔪 วางเหนือเขียงเล็กน้อย
+        item = state.new_item(item_name, board.x + board.w // 2 - 20, board.y)
+        state.place('board', item)
+        log.debug('🔪 วาง %s บนเขียงที่ (%s, %s)', item_name, item.x, item.y)
+    elif pot is not None and distance(chef, pot) < STATION_RANGE:
+        # 🥘 ใส่ลงหม้อ แล้วลองต้ม
+        item = state.new_item(item_name, 0, 0)
+        state.pot_items.append(item)
+        _layout_pot(state)
+        log.debug('🥘 ใส่ %s ลงหม้อ', item_name)
+        try_cook_pot(state)
+    else:
+        # 📦 วางบนพื้นใต้เท้าเชฟ
+        item = state.new_item(item_name, chef.x + chef.w // 2 - 20, chef.y + chef.h - 10)
+        state.place('floor', item)
+        log.debug('📦 วาง %s บนพื้นที่ (%s, %s)', item_name, item.x, item.y)
+
+    chef.held_item = None
+    state.touch()
+    return True
+
+
+def _layout_pot(state):
+    # จัดตำแหน่งวัตถุดิบให้เรียงกันเหนือหม้อ
+    pot = state.station('pot')
+    for idx, item in enumerate(state.pot_items):
+        item.x = pot.x + idx * 30
+        item.y = pot.y - 35
+
+
+# ------------------- หั่น -------------------
+def process_space_action(state):
+    board = state.station('chopping_board')
+    if board is None or not is_near_object(state.chef, board):
+        return False
+
+    started = False
+    for item in state.board_items:
+        if item.busy or item.name not in CHOPPABLE or _chop_job(state, item) is not None:
+            continue
+        # เขียงหั่นทีละชิ้น: toast ขึ้นตอนเริ่มหั่นจริง (_start_chop) ไม่ใช่ตอนเข้าคิว
+        state.scheduler.schedule('chopping_board', 'chop', CHOP_SECONDS, item)
+        log.debug('📥 เข้าคิวหั่น: %s', item.name)
+        started = True
+    if started:
+        _announce_started(state)
+        state.touch()
+    return started
+
+
+def _chop_job(state, item):
+    """งานหั่นของ item ที่ยังไม่เสร็จ (กำลังหั่นหรือรอคิว) หรือ None"""
+    for job in state.scheduler.jobs('chopping_board'):
+        if job.target is item and not job.cancelled:
+            return job
+    return None
+
+
+def _start_chop(state, item):
+    item.busy = True
+    state.toast(f'chopping {item.name}... ⌛', 3000)
+    log.debug('⏳ เริ่มหั่นวัตถุดิบ: %s', item.name)
+
+
+def _finish_chop(state, item):
+    if state.index.kind_of(item) != 'board':
+        return
+    item.name = f'{item.name}_chopped'
+    item.busy = False
+    board = state.station('chopping_board')
+    item.x, item.y = board.x, board.y
+    state.index.update(item)
+    log.debug('✅ หั่นวัตถุดิบเสร็จ: %s', item.name)
+    state.touch()
+
+
+# ------------------- ต้ม -------------------
+def try_cook_pot(state):
+    """ตรวจว่าสามารถต้มในหม้อได้หรือไม่ - ถ้าได้จะตั้งเวลาทำซุป"""
+    if state.station('pot') is None or not state.pot_items:
+        return False
+    if state.soup_ready or state.cooking:
+        return False
+
+    # หาชื่อ base ของวัตถุดิบ (ตัด '_chopped') และนับ
+    bases = [i.name.replace('_chopped', '').replace('_icon', '') for i in state.pot_items]
+    chosen_base = None
+    if bases.count('tomato') >= 3:
+        chosen_base = 'tomato'
+    elif len(bases) >= 3:
+        # ถ้าไม่มีชนิดซ้ำ แต่ใส่ครบ 3 ชิ้น ให้เลือกชนิดแรก
+        chosen_base = bases[0]
+
+    # แปลงเป็นชื่อซุป (mapping สำหรับชื่อที่รองรับ)
+    soup_name = {'tomato': 'tomato_soup'}.get(chosen_base)
+    if not soup_name:
+        return False
+
+    state.cooking = True
+    state.scheduler.schedule('pot', 'cook', COOK_SECONDS, soup_name)
+    state.toast('⏳ Start cooking... (4 s)')
+    return True
+
+
+def _finish_cook(state, soup_name):
+    state.pot_items = []
+    state.cooking = False
+    state.soup_ready = True
+    log.debug('🍲 ต้มเสร็จแล้ว: %s', soup_name)
+    state.touch()
+
+
+# ------------------- ถังขยะ -------------------
+def try_throw_item_to_trash(state, threshold=PICK_RANGE):
+    """ถ้าอยู่ใกล้ trash_bin → ทิ้งของในมือ (หรือของที่พื้นใกล้ถัง)"""
+    trash = state.station('trash_bin')
+    if trash is None:
+        return False
+    if distance(state.chef, trash) > threshold:
+        return False
+
+    if state.chef.held_item:
+        log.debug('🗑️ ทิ้งของ: %s', state.chef.held_item)
+        state.chef.held_item = None
+        state.touch()
+        return True
+
+    tx, ty = trash.center()
+    near = state.index.within('floor', tx, ty, threshold)
+    for item in near:
+        state.take(item)
+    if near:
+        state.touch()
+    return bool(near)
+
+
+def throw_plate_to_trash(state):
+    'ทิ้งจานในถังขยะ'
+    if state.chef.held_plate is None or not is_near_trash(state):
+        return False
+    state.chef.held_plate = None
+    log.debug('🗑️ ทิ้งจานลงถังขยะแล้ว')
+    state.touch()
+    return True
+
+
+# ------------------- จาน -------------------
+def _add_to_plate(state, plate, item_name):
+    if needs_chopping(item_name):
+        log.debug('⚠️ ต้องหั่น "%s" ก่อนจึงจะใส่ในจานได้', item_name)
+        return False
+    plate.add(item_name)
+    if not plate.reachable():
+        log.debug('🍽️ ของบนจานไม่ตรงกับสูตรใดแล้ว: %s', plate.items)
+    state.touch()
+    return True
+
+
+def add_item_to_plate(state, item_name):
+    'เพิ่มวัตถุดิบลงในจานที่ plate_station'
+    station = state.station('plate_station')
+    if station is None or not is_near_object(state.chef, station):
+        log.debug('❌ ไม่ได้อยู่ใกล้จาน')
+        return False
+    if not _add_to_plate(state, state.station_plate, item_name):
+        return False
+    state.toast(f'put {item_name} into plate 🍽️')
+    return True
+
+
+def add_item_to_held_plate(state, item_name):
+    'เพิ่มวัตถุดิบลงในจานที่ถืออยู่'
+    if state.chef.held_plate is None:
+        log.debug('❌ ไม่มีจานในมือ')
+        return False
+    return _add_to_plate(state, state.chef.held_plate, item_name)
+
+
+def add_item_to_dropped_plate(state, plate, item_name):
+    'เพิ่มวัตถุดิบลงในจานที่วางบนพื้น'
+    return _add_to_plate(state, plate, item_name)
+
+
+def try_pickup_plate(state):
+    'ให้เชฟหยิบจานจาก station หรือจากพื้น (พร้อมของบนจาน)'
+    chef = state.chef
+    if chef.held_item:
+        log.debug('เชฟถือของอยู่แล้ว 🧺')
+        return False
+    if chef.held_plate is not None:
+        log.debug('⚠️ มีจานอยู่แล้ว')
+        return False
+
+    # 1️⃣ หยิบจานจาก plate_station (พร้อมของที่ใส่ไว้) แล้ววางจานใบใหม่แทน
+    station = state.station('plate_station')
+    if station is not None and is_near_object(chef, station):
+        chef.held_plate = state.station_plate
+        state.station_plate = state.new_plate()
+        state.touch()
+        return True
+
+    # 2️⃣ จานที่วางบนพื้น
+    plate = state.nearest('plate', chef, PLATE_PICK_RANGE)
+    if plate is not None:
+        state.take(plate)
+        chef.held_plate = plate
+        log.debug('✅ หยิบจานพร้อมของทั้งหมดจากพื้น: %s', plate.items)
+        state.touch()
+        return True
+
+    log.debug('❌ ไม่ได้อยู่ใกล้วัตถุดิบหรือจานใด ๆ')
+    return False
+
+
+def drop_plate(state):
+    'วางจานลงพื้น'
+    chef = state.chef
+    plate = chef.held_plate
+    if plate is None:
+        log.debug('❌ ไม่มีจานในมือ')
+        return False
+    plate.x = chef.x + 40
+    plate.y = chef.y + 40
+    state.place('plate', plate)
+    chef.held_plate = None
+    state.toast('drop 🧺')
+    state.touch()
+    return True
+
+
+def nearest_dropped_plate(state, threshold=NEAR_RANGE):
+    return state.nearest('plate', state.chef, threshold)
+
+
+# ------------------- เสิร์ฟ -------------------
+def check_and_score(state, plate):
+    meal_name = plate.meal()
+    if not meal_name:
+        log.debug('🍽️ เมนูไม่ตรงกับสูตรใด ๆ')
+        return 0
+
+    if meal_name in state.orders:
+        score = wdrecipe.book.score(meal_name)
+        state.toast(f'serve {meal_name} correct +{score} score ✅', 4000)
+        state.emit('served', meal_name)
+        serve_dish_to_order(state, meal_name)
+        return score
+
+    state.toast(f'serve {meal_name} Not according to order ❌ (-5)', 4000)
+    return WRONG_DISH_PENALTY
+
+
+def add_score(state, amount):
+    state.score = max(0, state.score + amount)
+    state.emit('score', state.score)
+
+
+def serve_dish_to_order(state, dish_name):
+    if dish_name not in state.orders:
+        return False
+    state.orders.remove(dish_name)
+    # เพิ่มออเดอร์ใหม่ให้ครบ 3
+    while len(state.orders) < ORDER_COUNT:
+        state.orders.append(state.rng.choice(state.catalog))
+    state.emit('orders')
+    return True
+
+
+def try_serve_plate(state, threshold=SERVE_RANGE):
+    serve = state.station('serve_station')
+    if serve is None:
+        return False
+    chef = state.chef
+    if distance(chef, serve) > threshold:
+        log.debug('ยังไม่ใกล้จุดเสิร์ฟ 🚫')
+        return False
+
+    # เสิร์ฟจากจานในมือ
+    if chef.held_plate is not None:
+        add_score(state, check_and_score(state, chef.held_plate))
+        chef.held_plate = None
+        state.touch()
+        return True
+
+    # เสิร์ฟจากจานบนพื้นที่อยู่ใกล้จุดเสิร์ฟ
+    plate = state.nearest('plate', serve, threshold)
+    if plate is not None:
+        state.take(plate)
+        add_score(state, check_and_score(state, plate))
+        state.touch()
+        return True
+
+    log.debug('❌ ไม่มีจานที่จะเสิร์ฟ')
+    return False
+
+
+# ------------------- ปุ่มกด -------------------
+def interact(state):
+    """ปุ่ม F = ใช้ทำหลายอย่าง (หยิบ, ใส่จาน, ทิ้ง, รับจาน, เสิร์ฟ)"""
+    chef = state.chef
+
+    # ----- 1️⃣ กรณีถือวัตถุดิบอยู่ -----
+    if chef.held_item:
+        item_name = chef.held_item
+        if is_near_trash(state):
+            return try_throw_item_to_trash(state)
+
+        station = state.station('plate_station')
+        if station is not None and is_near_object(chef, station):
+            placed = add_item_to_plate(state, item_name)
+        else:
+            plate = nearest_dropped_plate(state)
+            if plate is not None:
+                placed = add_item_to_dropped_plate(state, plate, item_name)
+            elif chef.held_plate is not None:
+                placed = add_item_to_held_plate(state, item_name)
+            else:
+                return drop_item(state)
+
+        if placed:
+            chef.held_item = None
+            state.touch()
+        return placed
+
+    # ----- 2️⃣ ถือจานอยู่ (ทิ้ง, เสิร์ฟ หรือตักซุป) -----
+    if chef.held_plate is not None:
+        if is_near_trash(state):
+            return throw_plate_to_trash(state)
+        return try_serve_plate(state) or try_scoop_soup(state)
+
+    # ----- 3️⃣ มือว่าง: หยิบจานก่อน แล้วค่อยหยิบวัตถุดิบ -----
+    return try_pickup_plate(state) or try_pick_item(state)
+
+
+def put_down(state):
+    """ปุ่ม G = วางของ/จานบนพื้น"""
+    if state.chef.held_plate is not None:
+        return drop_plate(state)
+    if state.chef.held_item:
+        return drop_item(state)
+    return False
+
+
+def press_key(state, key):
+    state.record('down', key)
+    state.pressed.add(key)
+    if state.game_over:
+        return False
+    if key == 'f':
+        return interact(state)
+    if key == 'g':
+        return put_down(state)
+    if key == 'space':
+        return process_space_action(state)
+    return False
+
+
+def release_key(state, key):
+    state.record('up', key)
+    state.pressed.discard(key)
+
+
+def release_all(state):
+    """ปล่อยทุกปุ่ม (เช่นตอน widget เสียโฟกัส)"""
+    state.record('release_all')
+    state.pressed.clear()
+
+
+def resize(state, width, height):
+    """เปลี่ยนขอบเขตที่เชฟเดินได้ (ขนาด GameWidget)"""
+    if (width, height) == (state.width, state.height):
+        return
+    state.record('size', width, height)
+    state.width, state.height = width, height
+
+
+# ------------------- การเดิน -------------------
+def can_move_to(state, new_x, new_y):
+    chef = state.chef
+    return state.collision.is_free(new_x, new_y, chef.w, chef.h)
+
+
+def move_chef(state, speed=CHEF_SPEED):
+    """เดินตามปุ่มลูกศรที่กดค้าง 1 tick (ชนกำแพงแล้วเลื่อนเลียบไปตามแกนที่ยังว่าง) → คืน True ถ้าเชฟขยับ"""
+    dx = dy = 0
+    for key in state.pressed:
+        step_dir = MOVE_KEYS.get(key)
+        if step_dir:
+            dx += step_dir[0] * speed
+            dy += step_dir[1] * speed
+    if dx == 0 and dy == 0:
+        return False
+
+    chef = state.chef
+    # ไม่ให้ออกนอกขอบฉาก
+    dx = max(0, min(chef.x + dx, state.width - chef.w)) - chef.x
+    dy = max(0, min(chef.y + dy, state.height - chef.h)) - chef.y
+    new_x, new_y = state.collision.slide(chef.x, chef.y, chef.w, chef.h, dx, dy)
+    if (new_x, new_y) == (chef.x, chef.y):
+        return False
+    chef.x, chef.y = new_x, new_y
+    return True
+
+
+# ------------------- เวลา -------------------
+_JOB_HANDLERS = {
+    'chop': _finish_chop,
+    'cook': _finish_cook,
+}
+
+# งานที่ต้องแจ้งตอนเริ่มทำจริง (งานที่รอคิวอยู่จะเริ่มตอนงานก่อนหน้าเสร็จ)
+_START_HANDLERS = {
+    'chop': _start_chop,
+}
+
+
+def _announce_started(state):
+    for job in state.scheduler.take_started():
+        handler = _START_HANDLERS.get(job.kind)
+        if handler is not None:
+            handler(state, job.target)
+
+
+def run_jobs(state, dt):
+    """เดินนาฬิกาของ scheduler แล้วจบงานที่ถึงเวลา → จำนวนงานที่เสร็จ"""
+    done = state.scheduler.advance(dt)
+    for job in done:
+        _JOB_HANDLERS[job.kind](state, job.target)
+    _announce_started(state)
+    return len(done)
+
+
+def station_progress(state):
+    """station → (kind, 0.0-1.0, จำนวนที่รอคิว) ของงานที่กำลังทำ ใช้วาดแถบความคืบหน้า"""
+    return state.scheduler.progress_by_station()
+
+
+def pause(state):
+    state.record('pause')
+    state.scheduler.pause()
+
+
+def resume(state):
+    state.record('resume')
+    state.scheduler.resume()
+
+
+def is_idle(state):
+    """True ถ้าไม่มีอะไรต้องเดินต่อ (ไม่ได้กดปุ่มเดินค้างและไม่มีงานที่รอเวลา)"""
+    if state.scheduler.pending() and not state.scheduler.paused:
+        return False
+    for key in state.pressed:
+        if key in MOVE_KEYS:
+            return False
+    return True
+
+
+class FixedStep(object):
+    """
+    แปลงเวลาจริง (monotonic clock) เป็นจำนวน tick คงที่ด้วย accumulator
+    เวลาที่เหลือไม่ถึง 1 tick ใช้ interpolate ตอนวาด (alpha)
+    """
+    __slots__ = ('step', 'max_frame', 'clock', 'last', 'accumulator')
+
+    def __init__(self, step=TICK_SECONDS, max_frame=MAX_FRAME_SECONDS, clock=time.monotonic):
+        self.step = step
+        self.max_frame = max_frame
+        self.clock = clock
+        self.reset()
+
+    def reset(self):
+        self.last = self.clock()
+        self.accumulator = 0.0
+
+    def advance(self):
+        """คืนจำนวน tick ที่ต้องเดินตั้งแต่ครั้งก่อน"""
+        now = self.clock()
+        frame = min(now - self.last, self.max_frame)
+        self.last = now
+        self.accumulator += frame
+        steps = int(self.accumulator // self.step)
+        self.accumulator -= steps * self.step
+        return steps
+
+    def alpha(self):
+        return self.accumulator / self.step
+
+
+def step(state, dt=TICK_SECONDS):
+    """เดินเกม 1 tick: ขยับเชฟตามปุ่มที่กดค้าง และทำงานที่ถึงเวลา → คืน True ถ้าเชฟขยับ"""
+    state.time += dt
+    state.ticks += 1
+    run_jobs(state, dt)
+    return move_chef(state)
+
+
+def tick_clock(state):
+    """ลดเวลาเกม 1 วินาที → คืน True ถ้าเวลาหมด"""
+    if state.game_over:
+        return True
+    state.record('clock')
+    state.remaining_time = max(0, state.remaining_time - 1)
+    if state.remaining_time <= 0:
+        state.game_over = True
+        state.emit('game_over', state.score)
+    return state.game_over
@@ -0,0 +1,223 @@
+from PySide6 import QtCore, QtGui
+
+
+class Sprite(object):
+    """
+    sprite ที่วาดบน SpriteSurface ของ GameWidget แทนการเป็น QLabel ลูกแต่ละตัว
+    มี method ชื่อเดียวกับ QLabel ที่ wellDoneGameUtil ใช้ (move, resize, geometry, setPixmap, ...)
+    โค้ดเดิมจึงเรียกใช้ได้เหมือนเดิม
+    """
+
+    def __init__(self, surface):
+        self._surface = surface
+        self._rect = QtCore.QRect(0, 0, 0, 0)
+        self._pixmap = QtGui.QPixmap()
+        self._scaled = None
+        self._visible = False
+        self._props = {}
+        self.scaled_contents = True
+        self.z = 0
+
+    # ---------- geometry ----------
+    def x(self):
+        return self._rect.x()
+
+    def y(self):
+        return self._rect.y()
+
+    def width(self):
+        return self._rect.width()
+
+    def height(self):
+        return self._rect.height()
+
+    def pos(self):
+        return self._rect.topLeft()
+
+    def size(self):
+        return self._rect.size()
+
+    def rect(self):
+        return QtCore.QRect(0, 0, self._rect.width(), self._rect.height())
+
+    def geometry(self):
+        return QtCore.QRect(self._rect)
+
+    def mapToParent(self, point):
+        return point + self._rect.topLeft()
+
+    def move(self, x, y=None):
+        if y is None:
+            x, y = x.x(), x.y()
+        x, y = int(x), int(y)
+        if x == self._rect.x() and y == self._rect.y():
+            return
+        old = QtCore.QRect(self._rect)
+        self._rect.moveTo(x, y)
+        self._changed(old)
+
+    def resize(self, w, h=None):
+        if h is None:
+            w, h = w.width(), w.height()
+        old = QtCore.QRect(self._rect)
+        self._rect.setSize(QtCore.QSize(int(w), int(h)))
+        self._scaled = None
+        self._changed(old)
+
+    def setGeometry(self, x, y=None, w=None, h=None):
+        if y is None:
+            x, y, w, h = x.x(), x.y(), x.width(), x.height()
+        old = QtCore.QRect(self._rect)
+        self._rect = QtCore.QRect(int(x), int(y), int(w), int(h))
+        self._scaled = None
+        self._changed(old)
+
+    # ---------- ภาพ ----------
+    def setPixmap(self, pixmap):
+        self._pixmap = pixmap if pixmap is not None else QtGui.QPixmap()
+        self._scaled = None
+        self.update()
+
+    def pixmap(self):
+        return self._pixmap
+
+    def clear(self):
+        self.setPixmap(QtGui.QPixmap())
+
+    def setScaledContents(self, value):
+        self.scaled_contents = bool(value)
+        self._scaled = None
+
+    def setStyleSheet(self, style):
+        pass
+
+    def setAttribute(self, attribute, on=True):
+        pass
+
+    def scaled_pixmap(self):
+        """ภาพที่ scale เท่าขนาด sprite แล้ว (scale ครั้งเดียวจนกว่าจะเปลี่ยนภาพ/ขนาด)"""
+        if self._scaled is None:
+            pix = self._pixmap
+            if self.scaled_contents and not pix.isNull() and pix.size() != self._rect.size() \
+                    and not self._rect.isEmpty():
+                pix = pix.scaled(self._rect.size(), QtCore.Qt.IgnoreAspectRatio,
+                                 QtCore.Qt.SmoothTransformation)
+            self._scaled = pix
+        return self._scaled
+
+    # ---------- การแสดงผล ----------
+    def show(self):
+        if not self._visible:
+            self._visible = True
+            self.update()
+
+    def hide(self):
+        if self._visible:
+            self._visible = False
+            self.update()
+
+    def isVisible(self):
+        return self._visible
+
+    def raise_(self):
+        self._surface.raise_sprite(self)
+
+    def lower(self):
+        self._surface.lower_sprite(self)
+
+    def update(self):
+        self._surface.invalidate(self._rect)
+
+    repaint = update
+
+    def deleteLater(self):
+        self._surface.remove(self)
+
+    def parent(self):
+        return self._surface.widget
+
+    # ---------- property ----------
+    def setProperty(self, name, value):
+        self._props[name] = value
+        return True
+
+    def property(self, name):
+        return self._props.get(name)
+
+    def _changed(self, old_rect):
+        if self._visible:
+            self._surface.invalidate(old_rect)
+            self._surface.invalidate(self._rect)
+
+
+class SpriteSurface(object):
+    """
+    รายการ sprite ทั้งฉากของ GameWidget เรียงตาม z-order
+    GameWidget.paintEvent วาดทั้งหมดในครั้งเดียว และ repaint เฉพาะบริเวณที่ sprite ขยับ
+    """
+
+    def __init__(self, widget):
+        self.widget = widget
+        self.sprites = []
+        self._order = None
+        self._top_z = 0
+        self._bottom_z = 0
+
+    def create(self, pixmap=None, geometry=None):
+        sprite = Sprite(self)
+        self._top_z += 1
+        sprite.z = self._top_z
+        if geometry is not None:
+            sprite.setGeometry(geometry)
+        if pixmap is not None:
+            sprite.setPixmap(pixmap)
+        self.sprites.append(sprite)
+        self._order = None
+        return sprite
+
+    def remove(self, sprite):
+        try:
+            self.sprites.remove(sprite)
+        except ValueError:
+            return
+        self._order = None
+        if sprite.isVisible():
+            self.invalidate(sprite.geometry())
+
+    def raise_sprite(self, sprite):
+        self._top_z += 1
+        sprite.z = self._top_z
+        self._order = None
+        sprite.update()
+
+    def lower_sprite(self, sprite):
+        self._bottom_z -= 1
+        sprite.z = self._bottom_z
+        self._order = None
+        sprite.update()
+
+    def invalidate(self, rect):
+        if not rect.isEmpty():
+            self.widget.update(rect)
+
+    def ordered(self):
+        if self._order is None:
+            self._order = sorted(self.sprites, key=lambda s: s.z)
+        return self._order
+
+    def paint(self, painter, clip_rect=None):
+        for sprite in self.ordered():
+            if not sprite._visible:
+                continue
+            rect = sprite._rect
+            if clip_rect is not None and not clip_rect.intersects(rect):
+                continue
+            pix = sprite.scaled_pixmap()
+            if not pix.isNull():
+                painter.drawPixmap(rect.topLeft(), pix)
+
+    def stats(self):
+        return {
+            'sprites': len(self.sprites),
+            'visible': sum(1 for s in self.sprites if s._visible),
+        }
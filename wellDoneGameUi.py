@@ -1,11 +1,8 @@
 from PySide6 import QtCore, QtGui, QtWidgets
-from shiboken6 import wrapInstance
-import maya.OpenMayaUI as omui
 import importlib
 import sys, os
 import time
-import random
-import maya.cmds as cmds
+import collections
 
 try:
     from . import wellDoneGameUtil as wdutil
@@ -15,6 +12,67 @@ try:
     importlib.reload(wdutil)
 except Exception:
     pass
+try:
+    from . import wellDoneGameAsset as wdasset
+except Exception:
+    import wellDoneGameAsset as wdasset
+try:
+    from . import wellDoneGameSurface as wdsurface
+except Exception:
+    import wellDoneGameSurface as wdsurface
+try:
+    from . import wellDoneGameLog as wdlog
+except Exception:
+    import wellDoneGameLog as wdlog
+try:
+    from . import wellDoneGameState as wdstate
+except Exception:
+    import wellDoneGameState as wdstate
+try:
+    from . import wellDoneGameLoop as wdloop
+except Exception:
+    import wellDoneGameLoop as wdloop
+try:
+    from . import wellDoneGameReplay as wdreplay
+except Exception:
+    import wellDoneGameReplay as wdreplay
+try:
+    from . import wellDoneGameBackend as wdbackend
+except Exception:
+    import wellDoneGameBackend as wdbackend
+
+log = wdlog.get_logger('ui')
+
+# ตรวจไฟล์ภาพที่เกมอ้างถึงครั้งเดียวตอนโหลด module
+wdasset.validate_manifest()
+
+# โหมดวาดฉากของ GameWidget
+#   "widgets" : sprite ทุกตัวเป็น QLabel ลูก (แบบเดิม)
+#   "surface" : วาดทั้งฉากใน paintEvent เดียวจากรายการ sprite (เร็วกว่าเมื่อมีของบนพื้นเยอะ)
+RENDER_MODE = "widgets"
+
+# ภาพพื้นหลังขนาดใหญ่ที่ decode ใน thread แยก
+BACKGROUND_IMAGES = (
+    "background.png", "bg_kitchen.png", "pause_bg.png", "Bg_base.png",
+    "Howtoplay1.png", "Howtoplay2.png", "Howtoplay3.png",
+)
+
+# Qt key → ชื่อปุ่มที่ wellDoneGameState ใช้
+KEY_NAMES = {
+    QtCore.Qt.Key_Left: "left",
+    QtCore.Qt.Key_Right: "right",
+    QtCore.Qt.Key_Up: "up",
+    QtCore.Qt.Key_Down: "down",
+    QtCore.Qt.Key_F: "f",
+    QtCore.Qt.Key_G: "g",
+    QtCore.Qt.Key_Space: "space",
+}
+
+# ถ้าตั้ง WELLDONEGAME_SESSIONS เป็นโฟลเดอร์ จะเซฟ session (.wdsession) ทุกครั้งที่หมดเวลา
+SESSION_DIR = os.environ.get("WELLDONEGAME_SESSIONS")
+# บันทึก input เฉพาะเมื่อจะเซฟ (SESSION_DIR) หรือเปิดเองด้วย WELLDONEGAME_RECORD=1
+# (ไม่งั้น recorder โตไปตลอด session ของ Maya โดยไม่มีใครใช้)
+RECORD_SESSIONS = bool(SESSION_DIR) or os.environ.get("WELLDONEGAME_RECORD") == "1"
 
 SOURCE_PATH = os.path.join(os.path.dirname(__file__), "source_image", "image")
 FONT_PATH = os.path.join(os.path.dirname(__file__), "source_fonts", "SHOWG.ttf")
@@ -22,15 +80,54 @@ FONT_PATH = os.path.join(os.path.dirname(__file__), "source_fonts", "SHOWG.ttf")
 if os.path.exists(FONT_PATH):
     font_id = QtGui.QFontDatabase.addApplicationFont(FONT_PATH)
     if font_id == -1:
-        print("⚠️ ไม่สามารถโหลดฟอนต์ได้:", FONT_PATH)
+        log.warning("⚠️ ไม่สามารถโหลดฟอนต์ได้: %s", FONT_PATH)
         custom_font_family = None
     else:
         Showcard_Gothic = QtGui.QFontDatabase.applicationFontFamilies(font_id)[0]
-        print(f"✅ Loaded custom font: {Showcard_Gothic}")
+        log.info("✅ Loaded custom font: %s", Showcard_Gothic)
 else:
-    print("⚠️ ไม่พบไฟล์ฟอนต์:", FONT_PATH)
+    log.warning("⚠️ ไม่พบไฟล์ฟอนต์: %s", FONT_PATH)
     Showcard_Gothic = None
 
+class BackgroundLabel(QtWidgets.QLabel):
+    """
+    QLabel สำหรับภาพพื้นหลังเต็มหน้าจอ
+    แทน setScaledContents(True): scale ภาพต้นฉบับครั้งเดียวต่อขนาด widget แล้วเก็บไว้ใช้ซ้ำ
+    จนกว่าจะมี resizeEvent ครั้งถัดไป
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setScaledContents(False)
+        self._source = None
+        self._scaled_size = None
+        self.rescale_count = 0
+
+    def has_source(self):
+        return self._source is not None and not self._source.isNull()
+
+    def set_source(self, pix):
+        self._source = pix
+        self._scaled_size = None
+        self._rescale()
+
+    def resizeEvent(self, event):
+        self._rescale()
+        super().resizeEvent(event)
+
+    def _rescale(self):
+        if not self.has_source():
+            return
+        size = self.size()
+        if size.isEmpty() or size == self._scaled_size:
+            return
+        self._scaled_size = QtCore.QSize(size)
+        self.setPixmap(self._source.scaled(
+            size, QtCore.Qt.IgnoreAspectRatio, QtCore.Qt.SmoothTransformation
+        ))
+        self.rescale_count += 1
+
+
 class GameMenu(QtWidgets.QWidget):
     def __init__(self, stacked_widget, parent=None):
         super().__init__(parent)
@@ -39,9 +136,8 @@ class GameMenu(QtWidgets.QWidget):
         self.layout = QtWidgets.QVBoxLayout(self)
         self.layout.setContentsMargins(0, 0, 0, 0)
 
-        self.bg = QtWidgets.QLabel(self)
-        self.bg.setPixmap(QtGui.QPixmap(f"{SOURCE_PATH}/background.png"))
-        self.bg.setScaledContents(True)
+        self.bg = BackgroundLabel(self)
+        wdasset.load_pixmap_async("background.png", self.bg.set_source)
         self.bg.lower()
 
         self.menuLayout = QtWidgets.QVBoxLayout()
@@ -121,11 +217,13 @@ class GameMenu(QtWidgets.QWidget):
 
     def start_new_game(self):
         try:
-            game_page = self.stacked_widget.widget(2)  # ดึง GamePage ออกมา
-            if game_page is not None and hasattr(game_page, "restart_game"):
-                game_page.restart_game()
+            # GamePage สร้างแบบ lazy: ถ้ายังไม่เคยสร้าง หน้าใหม่ก็เป็นเกมใหม่อยู่แล้ว
+            if getattr(self.stacked_widget, "is_built", lambda i: True)(2):
+                game_page = self.stacked_widget.widget(2)  # ดึง GamePage ออกมา
+                if game_page is not None and hasattr(game_page, "restart_game"):
+                    game_page.restart_game()
         except Exception as e:
-            print("❌ Error restarting game:", e)
+            log.warning("❌ Error restarting game: %s", e)
 
         try:
             self.stacked_widget.setCurrentIndex(2)
@@ -133,7 +231,7 @@ class GameMenu(QtWidgets.QWidget):
             pass
 
     def resizeEvent(self, event):
-        if self.bg and self.bg.pixmap():
+        if self.bg and self.bg.has_source():
             self.bg.setGeometry(self.rect()) 
         super().resizeEvent(event)
 
@@ -151,17 +249,13 @@ class HowToPlayPage1(QtWidgets.QWidget):
         self.stacked_widget = stacked_widget
 
         # ==== พื้นหลัง ====
-        self.bg_base = QtWidgets.QLabel(self)
-        bg_base_path = os.path.join(SOURCE_PATH, "Bg_base.png")
-        if os.path.exists(bg_base_path):
-            self.bg_base.setPixmap(QtGui.QPixmap(bg_base_path))
-        self.bg_base.setScaledContents(True)
-
-        self.bg = QtWidgets.QLabel(self)
-        bg_path = os.path.join(SOURCE_PATH, "Howtoplay1.png")
-        if os.path.exists(bg_path):
-            self.bg.setPixmap(QtGui.QPixmap(bg_path))
-        self.bg.setScaledContents(True)
+        self.bg_base = BackgroundLabel(self)
+        if wdasset.has_asset("Bg_base.png"):
+            wdasset.load_pixmap_async("Bg_base.png", self.bg_base.set_source)
+
+        self.bg = BackgroundLabel(self)
+        if wdasset.has_asset("Howtoplay1.png"):
+            wdasset.load_pixmap_async("Howtoplay1.png", self.bg.set_source)
 
         # ==== ปุ่ม ====
         back_icon_path = os.path.join(SOURCE_PATH, "back_icon.png")
@@ -200,17 +294,13 @@ class HowToPlayPage2(QtWidgets.QWidget):
         self.stacked_widget = stacked_widget
 
         # ==== พื้นหลัง ====
-        self.bg_base = QtWidgets.QLabel(self)
-        bg_base_path = os.path.join(SOURCE_PATH, "Bg_base.png")
-        if os.path.exists(bg_base_path):
-            self.bg_base.setPixmap(QtGui.QPixmap(bg_base_path))
-        self.bg_base.setScaledContents(True)
-
-        self.bg = QtWidgets.QLabel(self)
-        bg_path = os.path.join(SOURCE_PATH, "Howtoplay2.png")
-        if os.path.exists(bg_path):
-            self.bg.setPixmap(QtGui.QPixmap(bg_path))
-        self.bg.setScaledContents(True)
+        self.bg_base = BackgroundLabel(self)
+        if wdasset.has_asset("Bg_base.png"):
+            wdasset.load_pixmap_async("Bg_base.png", self.bg_base.set_source)
+
+        self.bg = BackgroundLabel(self)
+        if wdasset.has_asset("Howtoplay2.png"):
+            wdasset.load_pixmap_async("Howtoplay2.png", self.bg.set_source)
 
         # ==== ปุ่ม ====
         back_icon_path = os.path.join(SOURCE_PATH, "back_icon.png")
@@ -250,17 +340,13 @@ class HowToPlayPage3(QtWidgets.QWidget):
         self.stacked_widget = stacked_widget
 
         # ==== พื้นหลัง ====
-        self.bg_base = QtWidgets.QLabel(self)
-        bg_base_path = os.path.join(SOURCE_PATH, "Bg_base.png")
-        if os.path.exists(bg_base_path):
-            self.bg_base.setPixmap(QtGui.QPixmap(bg_base_path))
-        self.bg_base.setScaledContents(True)
-
-        self.bg = QtWidgets.QLabel(self)
-        bg_path = os.path.join(SOURCE_PATH, "Howtoplay3.png")
-        if os.path.exists(bg_path):
-            self.bg.setPixmap(QtGui.QPixmap(bg_path))
-        self.bg.setScaledContents(True)
+        self.bg_base = BackgroundLabel(self)
+        if wdasset.has_asset("Bg_base.png"):
+            wdasset.load_pixmap_async("Bg_base.png", self.bg_base.set_source)
+
+        self.bg = BackgroundLabel(self)
+        if wdasset.has_asset("Howtoplay3.png"):
+            wdasset.load_pixmap_async("Howtoplay3.png", self.bg.set_source)
 
         # ==== ปุ่ม ====
         back_icon_path = os.path.join(SOURCE_PATH, "back_icon.png")
@@ -311,33 +397,47 @@ class ImageButton(QtWidgets.QPushButton):
         """)
 
 class GameWidget(QtWidgets.QWidget):
-    def __init__(self):
+    def __init__(self, render_mode=None):
         super().__init__()
         self.setFocusPolicy(QtCore.Qt.StrongFocus)
         self.setStyleSheet("background-color: #8BC34A;")  # สีพื้นสนาม
         self.objects = []
         self.game_page = None  # เพิ่มตัวแปรสำหรับเก็บ reference ไปยัง GamePage
 
+        # สถานะเกมทั้งหมด (ไม่ขึ้นกับ Qt) widget นี้เป็นแค่ภาพของ state
+        self.state = wdstate.GameState(catalog=wdasset.order_catalog())
+        self.view_revision = None
+        # บันทึกทุก input ที่เข้า state ตั้งแต่เริ่ม (เล่นซ้ำด้วย wellDoneGameReplay ได้) ถ้าเปิดไว้
+        self.recorder = None
+        if RECORD_SESSIONS:
+            self.start_recording()
+
+        # โหมด surface: sprite เป็น object ธรรมดาที่วาดใน paintEvent แทน QLabel ลูก
+        self.render_mode = render_mode or RENDER_MODE
+        if self.render_mode == "surface":
+            self.surface = wdsurface.SpriteSurface(self)
+            self.sprite_factory = self.surface.create
+        else:
+            self.surface = None
+            self.sprite_factory = None
+
 
         # สร้างวัตถุในฉาก
         self.create_game_objects()
 
-        # ตัวละคร (เชฟ)
-        self.has_item = False
-        self.current_item = None
+        # sprite ที่ผูกกับ object ใน state (id → QLabel)
+        self.item_sprites = {}
+        self.plate_sprites = {}
         self.held_icon = None
+        self.held_plate = None
+        self.soup_icon = None
+        self.progress_bars = {}  # station → QProgressBar ของงานหั่น/ต้ม
 
-        self.placed_items = []
-        self.chopping_board_icons = []
-
-        self.pot_icons = []  # เก็บ QLabel ของวัตถุดิบบน pot
-        self.pot_contents = [] # ข้อมูลวัตถุดิบ
+        # pool ของ QLabel ชั่วคราว (วัตถุดิบ/จาน/ไอคอนที่ถือ) สร้างเตรียมไว้ล่วงหน้า
+        self.sprite_pool = wdutil.get_sprite_pool(self)
 
-        self.obstacles = []
-        wdutil._create_invisible_walls(self)
-
-        self.chef = QtWidgets.QLabel(self)
-        chef_pixmap = QtGui.QPixmap(f"{SOURCE_PATH}/chef.png")
+        self.chef = self.new_label()
+        chef_pixmap = wdasset.get_pixmap("chef.png")
 
         # ให้รองรับ transparency และไม่ขึ้นสีพื้น
         self.chef.setAttribute(QtCore.Qt.WA_TranslucentBackground)
@@ -345,189 +445,104 @@ class GameWidget(QtWidgets.QWidget):
 
         self.chef.setPixmap(chef_pixmap)
         self.chef.setScaledContents(True)
-        self.chef.resize(111.875, 133.33)
-        self.chef.move(200, 200)
-        self.chef.raise_
-        self.chef_speed = 9
+        self.chef.resize(*wdstate.CHEF_SIZE)
+        self.chef.move(*wdstate.CHEF_START)
+        self.chef.raise_()
 
 
-        # ตัวจับเวลาเดินอัตโนมัติ
-        self.timer = QtCore.QTimer(self)
-        self.timer.timeout.connect(self.update_position)
-        self.timer.start(16)
-        self.pressed_keys = set()
+        # loop แบบ fixed step (หลับเองเมื่อไม่มีอะไรขยับ ตื่นเมื่อกดปุ่ม)
+        self.loop = wdloop.GameLoop(self)
+
+    def new_label(self):
+        """สร้าง QLabel ลูก หรือ Sprite บน surface ตามโหมดการวาด"""
+        if self.surface is not None:
+            sprite = self.surface.create()
+            sprite.show()
+            return sprite
+        return QtWidgets.QLabel(self)
+
+    def paintEvent(self, event):
+        if self.surface is None:
+            super().paintEvent(event)
+            return
+        painter = QtGui.QPainter(self)
+        self.surface.paint(painter, event.rect())
+        painter.end()
+
+    def resizeEvent(self, event):
+        # ขอบเขตที่เชฟเดินได้ = ขนาด widget
+        wdstate.resize(self.state, self.width(), self.height())
+        super().resizeEvent(event)
 
     def create_image_object(self, x, y, w, h, image_name):
         """สร้าง QLabel ที่มีภาพ"""
-        obj = QtWidgets.QLabel(self)
+        obj = self.new_label()
         obj.setGeometry(x, y, w, h)
         obj.setStyleSheet("background: transparent;")
-        pix = QtGui.QPixmap(f"{SOURCE_PATH}/{image_name}")
+        pix = wdasset.get_pixmap(image_name, (w, h))
         obj.setPixmap(pix)
         obj.setScaledContents(True)
         self.objects.append(obj)
         return obj
 
     def create_game_objects(self):
-        # เตา (stove)
-        self.pot = self.create_image_object(280, 145, 90, 106, "pot.png")
-        self.pot_icons = []
-        self.pot_contents = []
-
-        self.chopping_board = self.create_image_object(427, 180, 70, 50, "chopping_board.png")
-        self.chopping_board_icons = []
-
-        # จุดเสิร์ฟ (serve)
-        self.serve_station = self.create_image_object(1060, 158, 160, 229, "serve_station.png")
-        self.plate_station = self.create_image_object(1065, 353, 100, 85, "plate_station.png")
-        self.trash_bin = self.create_image_object(958, 172, 85, 85, "trash_bin.png")
-
-        # โต๊ะ (table)
-        self.create_image_object(150, 500, 1240, 715, "table.png")
+        # station (เตา, เขียง, จุดเสิร์ฟ, จาน, ถังขยะ, โต๊ะ) ตามตำแหน่งใน state
+        for name, station in self.state.stations.items():
+            label = self.create_image_object(station.x, station.y, station.w, station.h, station.image)
+            setattr(self, name, label)
 
         # วัตถุดิบ (ingredients)
         self.ingredients = []  # ✅ เก็บรายการวัตถุดิบ
-
-        tomato = self.create_image_object(845, 463, 77, 77, "tomato.png")
-        lettuce = self.create_image_object(783, 448, 85, 125, "lettuce.png")
-        cucamber = self.create_image_object(900, 462, 85, 75, "cucamber.png")
-
-        # ใส่ใน list เพื่อใช้ตรวจชน
-        self.ingredients = [
-            {"name": "tomato", "widget": tomato},
-            {"name": "lettuce", "widget": lettuce},
-            {"name": "cucamber", "widget": cucamber},
-        ]
+        for name, source in self.state.sources.items():
+            widget = self.create_image_object(source.x, source.y, source.w, source.h, source.image)
+            self.ingredients.append({"name": name, "widget": widget})
 
 
     def keyPressEvent(self, event):
-        key = event.key()
-        self.pressed_keys.add(key)
-
-        # 🎯 ปุ่ม F = ใช้ทำหลายอย่าง (หยิบ, ใส่จาน, ทิ้ง, รับจาน)
-        if key == QtCore.Qt.Key_F:
-
-            # ----- 1️⃣ กรณีถืออะไรอยู่ -----
-            if self.has_item:
-                # ถ้าอยู่ใกล้ถังขยะ → ทิ้งของ
-                if wdutil.is_near_trash(self):
-                    wdutil.try_throw_item_to_trash(self)
-
-                # ถ้าอยู่ใกล้จาน → ใส่วัตถุดิบลงจาน
-                # ถ้าอยู่ใกล้ plate station → ใส่ลงจานที่ station
-                elif hasattr(self, "plate_station") and wdutil.is_near_object(self.chef, self.plate_station):
-                    wdutil.add_item_to_plate(self, self.current_item)
-                    # ล้างของในมือ
-                    self.has_item = False
-                    self.current_item = None
-                    if getattr(self, "held_icon", None):
-                        self.held_icon.deleteLater()
-                        self.held_icon = None
-
-                elif getattr(self, "dropped_plates", None) and any(
-                    wdutil.is_near_object(self.chef, plate_dict.get("label"))
-                    for plate_dict in self.dropped_plates
-                    if plate_dict.get("label") is not None
-                ):
-                    # หา plate ที่อยู่ใกล้ที่สุดและใส่ของลงไปบนจานที่พื้น
-                    for plate_dict in list(self.dropped_plates):
-                        plate_label = plate_dict.get("label")
-                        if plate_label and wdutil.is_near_object(self.chef, plate_label):
-                            wdutil.add_item_to_dropped_plate(self, plate_dict, self.current_item)
-                            self.update()
-                            QtWidgets.QApplication.processEvents()
-                            break
-
-                    # ล้างของในมือ
-                    self.has_item = False
-                    self.current_item = None
-                    if getattr(self, "held_icon", None):
-                        self.held_icon.deleteLater()
-                        self.held_icon = None
-
-                # ถ้าเราถือจานอยู่และถือวัตถุดิบด้วย → ใส่ลงในจานที่ถือ
-                elif getattr(self, "has_plate", False):
-                    wdutil.add_item_to_held_plate(self, self.current_item)
-                    # ล้างของในมือ
-                    self.has_item = False
-                    self.current_item = None
-                    if getattr(self, "held_icon", None):
-                        self.held_icon.deleteLater()
-                        self.held_icon = None
-
-                # ถ้าไม่เข้าเงื่อนไขอื่น ๆ → วางของ (drop)
-                else:
-                    wdutil.drop_item(self)
-
-            # ----- 2️⃣ ถ้าไม่มีวัตถุดิบ แต่ถือจานอยู่ -----
-            elif getattr(self, "has_plate", False):
-                # ถ้าอยู่ใกล้ถังขยะ → ทิ้งจาน
-                if wdutil.is_near_trash(self):
-                    wdutil.throw_plate_to_trash(self)
-                # ถ้าอยู่ใกล้จุดเสิร์ฟ → เสิร์ฟจาน
-                elif wdutil.try_serve_plate(self):
-                    # เสิร์ฟเสร็จแล้ว ฟังก์ชันจะจัดการ state ให้
-                    return
-                else:
-                    pass  # ยังไม่วาง (ใช้ปุ่ม G วางแทน)
-
-            # ----- 3️⃣ ถ้าไม่มีของในมือเลย -----
-            else:
-                # พยายามหยิบจานก่อน (เพราะจานมี priority สูงกว่า item)
-                if wdutil.try_pickup_plate(self):
-                    return
-                # ถ้าไม่เจอจาน → พยายามหยิบวัตถุดิบแทน
-                wdutil.try_pick_item(self)
-
-        # 🎯 ปุ่ม G = วางของ/จานบนพื้น
-        elif key == QtCore.Qt.Key_G:
-            if getattr(self, "has_plate", False):
-                wdutil.drop_plate(self)
-            elif self.has_item:
-                wdutil.drop_item(self)
-
-        # 🔪 ปุ่ม Space = ใช้ทำ action เช่น หั่นของ
-        elif key == QtCore.Qt.Key_Space:
-            print("space bar preesed")
-            wdutil.process_space_action(self)
-
-    def keyReleaseEvent(self, event):
-        key = event.key()
-        if key in self.pressed_keys:
-            self.pressed_keys.remove(key)
-
-    def update_position(self):
-        dx = dy = 0
-        if QtCore.Qt.Key_Left in self.pressed_keys:
-            dx -= self.chef_speed
-        if QtCore.Qt.Key_Right in self.pressed_keys:
-            dx += self.chef_speed
-        if QtCore.Qt.Key_Up in self.pressed_keys:
-            dy -= self.chef_speed
-        if QtCore.Qt.Key_Down in self.pressed_keys:
-            dy += self.chef_speed
-
-        if dx == 0 and dy == 0:
+        key = KEY_NAMES.get(event.key())
+        if key is None:
+            super().keyPressEvent(event)
             return
-
-        new_x = max(0, min(self.chef.x() + dx, self.width() - self.chef.width()))
-        new_y = max(0, min(self.chef.y() + dy, self.height() - self.chef.height()))
-
-        can_move = wdutil._can_move_to(self, new_x, new_y)
-
-        if not can_move:
+        if event.isAutoRepeat():
+            # กดค้าง: ปุ่มยังอยู่ใน state.pressed อยู่แล้ว ไม่ต้องส่ง (และบันทึก) down/up ซ้ำ ~30 ครั้ง/วินาที
             return
+        # 🎯 F = หยิบ/ใส่จาน/ทิ้ง/เสิร์ฟ, G = วางบนพื้น, Space = หั่น (กฎอยู่ใน wdstate.press_key)
+        wdutil.handle_key_press(self, key)
+        self.loop.wake()
 
-        self.chef.move(new_x, new_y)
-
-        if getattr(self, "held_icon", None):
-            icon_x = new_x + (self.chef.width() - self.held_icon.width()) // 2
-            icon_y = new_y - self.held_icon.height() - 5
-            self.held_icon.move(icon_x, icon_y)
-
-        if getattr(self, "has_plate", False) and hasattr(self, "held_plate"):
-            wdutil.update_plate_position(self, self.chef, self.held_plate)
-
+    def keyReleaseEvent(self, event):
+        key = KEY_NAMES.get(event.key())
+        if key is not None and not event.isAutoRepeat():
+            wdutil.handle_key_release(self, key)
+
+    def start_recording(self):
+        """เริ่ม recorder ใหม่จาก state ปัจจุบัน (ทิ้ง input ที่บันทึกก่อนหน้า)"""
+        self.recorder = wdreplay.Recorder.attach(self.state)
+        return self.recorder
+
+    def save_session(self, path=None):
+        """เซฟ input ที่บันทึกไว้เป็นไฟล์ .wdsession (ไม่ระบุ path = เซฟลง SESSION_DIR ถ้าตั้งไว้)"""
+        if self.recorder is None:
+            return None
+        if path is None:
+            if not SESSION_DIR:
+                return None
+            os.makedirs(SESSION_DIR, exist_ok=True)
+            path = os.path.join(SESSION_DIR, time.strftime("session_%Y%m%d_%H%M%S") + wdreplay.EXTENSION)
+        try:
+            self.recorder.save(path, self.state)
+        except Exception as e:
+            log.warning("❌ เซฟ session ไม่ได้: %s", e)
+            return None
+        log.info("💾 เซฟ session: %s (%s events)", path, len(self.recorder))
+        # เซฟแล้วเริ่มบันทึกชุดใหม่ ไม่เก็บ input เดิมไว้ในหน่วยความจำต่อ
+        self.start_recording()
+        return path
+
+    def focusOutEvent(self, event):
+        # เสียโฟกัสระหว่างกดค้างจะไม่ได้ keyRelease → ปล่อยทุกปุ่ม ไม่ให้เชฟเดินค้าง
+        wdstate.release_all(self.state)
+        super().focusOutEvent(event)
 
 class Overlay(QtWidgets.QWidget):
     def __init__(self, parent=None):
@@ -541,18 +556,9 @@ class Overlay(QtWidgets.QWidget):
         # 🔹 พื้นหลัง pause_bg.png
         # -----------------------------
         self.bg_label = QtWidgets.QLabel(self)
-        bg_path = os.path.join(SOURCE_PATH, "pause_bg.png")
-        pix = QtGui.QPixmap(bg_path)
-        scaled_pix = pix.scaled(600, 500, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
-        self.bg_label.setPixmap(scaled_pix)
         self.bg_label.setScaledContents(False)
         self.bg_label.setAlignment(QtCore.Qt.AlignCenter)
-
-        parent_w, parent_h = 1200, 675
-        pix_w, pix_h = scaled_pix.width(), scaled_pix.height()
-        x = (parent_w - pix_w) // 2
-        y = (parent_h - pix_h) // 2
-        self.bg_label.setGeometry(x, y, pix_w, pix_h)
+        wdasset.load_pixmap_async("pause_bg.png", self._set_bg_pixmap)
 
         # -----------------------------
         # 🔹 ข้อความ
@@ -589,6 +595,20 @@ class Overlay(QtWidgets.QWidget):
         self.is_game_over = False
         self.restart_btn = None  # จะสร้างตอน Game Over เท่านั้น
 
+    def _set_bg_pixmap(self, pix):
+        # ถูกเรียกครั้งแรกด้วย placeholder และอีกครั้งเมื่อ pause_bg.png decode เสร็จ
+        if wdasset.is_placeholder(pix):
+            # placeholder 8x8 ขยายเป็น 500x500 จะเป็นบล็อกสีน้ำตาล → รอภาพจริง
+            return
+        scaled_pix = pix.scaled(600, 500, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
+        self.bg_label.setPixmap(scaled_pix)
+
+        parent_w, parent_h = 1200, 675
+        pix_w, pix_h = scaled_pix.width(), scaled_pix.height()
+        x = (parent_w - pix_w) // 2
+        y = (parent_h - pix_h) // 2
+        self.bg_label.setGeometry(x, y, pix_w, pix_h)
+
     # -----------------------------
     # 🔸 โหมด Pause
     # -----------------------------
@@ -633,7 +653,7 @@ class Overlay(QtWidgets.QWidget):
                 if hasattr(parent, "_overlay_continue_clicked"):
                     self.restart_btn.clicked.connect(parent._overlay_continue_clicked)
             except Exception as e:
-                print("⚠️ Cannot connect restart button:", e)
+                log.warning("⚠️ Cannot connect restart button: %s", e)
 
 class GamePage(QtWidgets.QWidget):
     """แทน MainWindow เดิม แต่เป็น QWidget"""
@@ -644,13 +664,12 @@ class GamePage(QtWidgets.QWidget):
         layout = QtWidgets.QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
 
-        self.bg_label = QtWidgets.QLabel(self)
-        self.bg_label.setScaledContents(True)  # ให้ขยายเต็มพื้นที่ widget
-        self.bg_pixmap = QtGui.QPixmap(f"{SOURCE_PATH}/bg_kitchen.png")
-        self.bg_label.setPixmap(self.bg_pixmap)
+        # scale ภาพครั้งเดียวต่อขนาดหน้าต่าง (เชฟขยับทุก 16 ms จะได้ไม่ต้อง scale ซ้ำ)
+        self.bg_label = BackgroundLabel(self)
+        self.bg_pixmap = None
+        wdasset.load_pixmap_async("bg_kitchen.png", self._set_bg_pixmap)
         self.bg_label.lower()
 
-        self.bg_label.setScaledContents(True)
         self.bg_label.setGeometry(0, 0, 1200, 675)
 
         self.game_widget = GameWidget()
@@ -658,7 +677,13 @@ class GamePage(QtWidgets.QWidget):
         
         # เชื่อมต่อ GameWidget กับ GamePage เพื่อให้สามารถแสดง toast และอัปเดต orders/score ได้
         self.game_widget.game_page = self
-        print("✅ GameWidget เชื่อมต่อกับ GamePage แล้ว")
+        log.debug("✅ GameWidget เชื่อมต่อกับ GamePage แล้ว")
+
+        # อ่านเลขจานที่เสิร์ฟไว้แล้วในฉากครั้งเดียวตอนเริ่มเกม (ตอนเสิร์ฟไม่ต้องสแกนฉาก)
+        try:
+            wdbackend.get_backend().prepare()
+        except Exception as e:
+            log.warning("❌ เตรียม backend ไม่ได้: %s", e)
         
         self.game_widget.setFocus()
 
@@ -696,7 +721,7 @@ class GamePage(QtWidgets.QWidget):
             }
         """)
 
-        self.remaining_time = 300
+        self.current_score = 0
         self.time_label = QtWidgets.QLabel(str(self.remaining_time), self)
         self.time_label.setGeometry(1105, 600, 80, 80)
         self.time_label.setAlignment(QtCore.Qt.AlignCenter)
@@ -719,31 +744,18 @@ class GamePage(QtWidgets.QWidget):
         self.order_container = QtWidgets.QWidget(self)
         self.order_container.setGeometry(0, 0, 300, 130)
 
-        bg_path = os.path.join(os.path.dirname(__file__), "source_image", "image", "bg_order.png")
-        self.order_bg = QtWidgets.QLabel(self.order_container)
+        self.order_bg = BackgroundLabel(self.order_container)
         self.order_bg.setGeometry(0, 0, 300, 130)
-        self.order_bg.setScaledContents(True)
-        if os.path.exists(bg_path):
-            self.order_bg.setPixmap(QtGui.QPixmap(bg_path))
+        if wdasset.has_asset("bg_order.png"):
+            self.order_bg.set_source(wdasset.get_pixmap("bg_order.png"))
 
         self.order_layout = QtWidgets.QHBoxLayout(self.order_container)
         self.order_layout.setContentsMargins(20, 0, 0, 0)
         self.order_layout.setSpacing(2)
 
-        # โหลด order จาก recipe dict
-        try:
-            files = os.listdir(os.path.join(os.path.dirname(__file__), "source_image", "image"))
-            combos = [f[len("order_"):-4] for f in files if f.startswith("order_") and f.lower().endswith('.png')]
-        except Exception:
-            combos = []
-        if not combos:
-            combos = ["tomato_soup", "delux_salad", "lettuce_salad","tomato_lettuce_salad"]
-
-        self.orders = [random.choice(combos) for _ in range(3)]
+        # ออเดอร์อยู่ใน state (สุ่มจาก order_*.png ใน manifest)
         self._refresh_orders_images()
 
-        self.game_widget.current_orders = self.orders
-
         # ปุ่ม Pause
         self.pause_icon_path = os.path.join(SOURCE_PATH, "pause_icon.png")
         self.pause_btn = ImageButton(self.pause_icon_path, size=(180, 80), parent=self)
@@ -761,7 +773,27 @@ class GamePage(QtWidgets.QWidget):
         self.overlay.continue_btn.clicked.connect(self._overlay_continue_clicked)
         self.overlay.quit_btn.clicked.connect(self.back_to_menu)
 
-        
+        # ชั้น toast เดียวสำหรับทุกข้อความ (แทนการสร้าง QLabel + animation ทุกครั้ง)
+        self.toast_layer = ToastLayer(self)
+        self.toast_layer.setGeometry(0, 0, 1200, 675)
+
+
+    def _set_bg_pixmap(self, pix):
+        self.bg_pixmap = pix
+        self.bg_label.set_source(pix)
+
+    @property
+    def state(self):
+        return self.game_widget.state
+
+    @property
+    def orders(self):
+        return self.state.orders
+
+    @property
+    def remaining_time(self):
+        return self.state.remaining_time
+
     def _refresh_orders_images(self):
         # ลบภาพเก่าทั้งหมดก่อน
         while self.order_layout.count():
@@ -773,31 +805,19 @@ class GamePage(QtWidgets.QWidget):
         # วาดภาพใหม่ทั้งหมด
         for order in self.orders:
             lbl = QtWidgets.QLabel()
-            path = os.path.join(os.path.dirname(__file__), "source_image", "image", f"order_{order}.png")
-            if os.path.exists(path):
-                pix = QtGui.QPixmap(path)
-            lbl.setPixmap(pix.scaled(80, 80, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation))
+            if wdasset.has_asset(f"order_{order}.png"):
+                lbl.setPixmap(wdasset.get_pixmap(f"order_{order}.png", (80, 80), keep_aspect=True))
             self.order_layout.addWidget(lbl)
 
     def serve_dish_to_order(self, dish_name: str):
-        if dish_name in self.orders:
-            self.orders.remove(dish_name)
-            # เพิ่มออเดอร์ใหม่ให้ครบ 3
-            try:
-                files = os.listdir(os.path.join(os.path.dirname(__file__), "source_image", "image"))
-                combos = [f[len("order_"):-4] for f in files if f.startswith("order_") and f.lower().endswith('.png')]
-            except Exception:
-                combos = ["tomato_soup", "delux_salad", "lettuce_salad","tomato_lettuce_salad"]
-
-            while len(self.orders) < 3:
-                self.orders.append(random.choice(combos))
-
-            self._refresh_orders_images()
+        if wdstate.serve_dish_to_order(self.state, dish_name):
+            wdutil.flush_events(self.game_widget)
 
 
     def resizeEvent(self, event):
         self.bg_label.setGeometry(0, 0, self.width(), self.height())
         self.overlay.setGeometry(0, 0, self.width(), self.height())
+        self.toast_layer.setGeometry(0, 0, self.width(), self.height())
         self.pause_btn.move(self.width() - 170, 0)
         super().resizeEvent(event)
 
@@ -816,7 +836,8 @@ class GamePage(QtWidgets.QWidget):
         except Exception:
             pass
         try:
-            self.game_widget.timer.stop()
+            self.game_widget.loop.pause()
+            wdstate.pause(self.state)
         except Exception:
             pass
         # Set overlay to paused mode and show
@@ -834,35 +855,31 @@ class GamePage(QtWidgets.QWidget):
         except Exception:
             pass
         try:
-            self.game_widget.timer.start(16)
+            wdstate.resume(self.state)
+            self.game_widget.loop.resume()
         except Exception:
             pass
 
     def _tick_game_clock(self):
-        self.remaining_time -= 1
-        if self.remaining_time < 0:
-            self.remaining_time = 0
+        game_over = wdstate.tick_clock(self.state)
 
         # แสดงตัวเลขตรง ๆ ไม่มี 'Time:'
         self.time_label.setText(str(self.remaining_time))
 
-        if self.remaining_time <= 0:
+        if game_over:
             # time up -> show overlay and stop timers
             try:
                 self.game_clock.stop()
             except Exception:
                 pass
             try:
-                self.game_widget.timer.stop()
+                self.game_widget.loop.pause()
             except Exception:
                 pass
+            self.game_widget.save_session()
             # show game-over overlay with final score
             try:
-                score = int(self.score_label.text())
-            except Exception:
-                score = 0
-            try:
-                self.overlay.set_game_over(score)
+                self.overlay.set_game_over(self.state.score)
             except Exception:
                 pass
             self.overlay.show()
@@ -882,109 +899,19 @@ class GamePage(QtWidgets.QWidget):
 
     def restart_game(self):
         """Reset game state to allow a fresh playthrough."""
-        # reset time and score
-        self.remaining_time = 330
-        self.time_label.setText(f"{self.remaining_time}")
-        self.score_label.setText("0")
-
-        # clear items from the game widget
+        # reset state (เวลา, คะแนน, ของในฉาก, ออเดอร์, งานหั่น/ต้มที่ค้าง) แล้ววาดใหม่ทั้งฉาก
         gw = self.game_widget
-        try:
-            for lbl in list(getattr(gw, 'placed_items', [])):
-                try:
-                    lbl.deleteLater()
-                except Exception:
-                    pass
-            gw.placed_items = []
-        except Exception:
-            gw.placed_items = []
-
-        try:
-            for lbl in list(getattr(gw, 'pot_icons', [])):
-                try:
-                    lbl.deleteLater()
-                except Exception:
-                    pass
-            gw.pot_icons = []
-            gw.pot_contents = []
-        except Exception:
-            gw.pot_icons = []
-            gw.pot_contents = []
-
-        try:
-            for lbl in list(getattr(gw, 'chopping_board_icons', [])):
-                try:
-                    lbl.deleteLater()
-                except Exception:
-                    pass
-            gw.chopping_board_icons = []
-        except Exception:
-            gw.chopping_board_icons = []
-
-        try:
-            for pd in list(getattr(gw, 'dropped_plates', [])):
-                try:
-                    lab = pd.get('label')
-                    if lab:
-                        lab.deleteLater()
-                except Exception:
-                    pass
-            gw.dropped_plates = []
-        except Exception:
-            gw.dropped_plates = []
-
-        try:
-            if getattr(gw, 'held_plate', None):
-                gw.held_plate.deleteLater()
-            gw.held_plate = None
-        except Exception:
-            gw.held_plate = None
-
-        try:
-            if getattr(gw, 'held_icon', None):
-                gw.held_icon.deleteLater()
-            gw.held_icon = None
-        except Exception:
-            gw.held_icon = None
-
-        gw.has_item = False
-        gw.current_item = None
-        gw.has_plate = False
-        gw.plate_items = []
-        gw.station_plate_items = []
-        gw.pot_icons = []
+        self.state.reset(remaining_time=wdstate.RESTART_TIME)
+        if gw.recorder is not None:
+            # เกมใหม่ = session ใหม่ (input ของเกมก่อนไม่ติดมา)
+            gw.start_recording()
+        self.time_label.setText(f"{self.remaining_time}")
+        wdutil.sync_view(gw)
 
         try:
-            poly_objs = cmds.ls(type="mesh", long=True)
-            if poly_objs:
-                transforms = list(set(cmds.listRelatives(poly_objs, parent=True, fullPath=True) or []))
-                if transforms:
-                    cmds.delete(transforms)
-                    print(f"✅ ลบ polygon ทั้งหมดแล้ว ({len(transforms)} ชิ้น)")
-                else:
-                    print("⚠️ ไม่มี transform ที่เกี่ยวข้องกับ mesh ให้ลบ")
-            else:
-                print("⚠️ ไม่พบ polygon objects ใน scene")
+            wdbackend.get_backend().clear_scene()
         except Exception as e:
-            print("❌ Error while deleting polygons:", e)
-
-        # regenerate orders
-        try:
-            files = os.listdir(os.path.join(os.path.dirname(__file__), "source_image", "image"))
-            # orders are represented by files named order_<name>.png
-            combos = [f[len("order_"):-4] for f in files if f.startswith("order_") and f.lower().endswith('.png')]
-        except Exception:
-            combos = []
-        if not combos:
-            combos = ["tomato_soup", "delux_salad", "lettuce_salad","tomato_lettuce_salad"]
-        import random
-        self.orders = [random.choice(combos) for _ in range(3)]
-        # Refresh order images in the UI and sync gamestate
-        self._refresh_orders_images()
-        try:
-            self.game_widget.current_orders = self.orders
-        except Exception:
-            pass
+            log.warning("❌ Error while deleting polygons: %s", e)
 
         # hide overlay and restart timers
         try:
@@ -1000,7 +927,7 @@ class GamePage(QtWidgets.QWidget):
         except Exception:
             pass
         try:
-            self.game_widget.timer.start(16)
+            self.game_widget.loop.resume()
         except Exception:
             pass
 
@@ -1021,76 +948,232 @@ class GamePage(QtWidgets.QWidget):
         y_offset: vertical offset relative to chef (negative to show above)
         """
         try:
-            print(f"🔄 กำลังสร้าง toast: {message}")
-            
-            # create label with white border for better visibility
-            lbl = QtWidgets.QLabel(self)
-            lbl.setText(message)
-            lbl.setWordWrap(True)
-            lbl.setAlignment(QtCore.Qt.AlignCenter)
-            lbl.setStyleSheet(f"""
-                QLabel {{
-                    font-family: '{Showcard_Gothic}';
-                    background-color: rgba(0,0,0,200);
-                    color: #ffffff;
-                    border: 2px solid white;
-                    border-radius: 8px;
-                    padding: 8px 12px;
-                    font: bold 16px 'Arial';
-                }}
-            """)
-            lbl.setAttribute(QtCore.Qt.WA_TranslucentBackground)
-            lbl.adjustSize()
-
             # position above chef if possible
             try:
                 chef = self.game_widget.chef
-                x = chef.x() + (chef.width() - lbl.width()) // 2
+                x = chef.x() + chef.width() // 2
                 y = chef.y() + y_offset
-                print(f"✅ ตำแหน่ง toast: ({x}, {y})")
             except Exception as e:
-                print(f"⚠️ ไม่สามารถหาตำแหน่งเชฟ: {e}")
-                x = (self.width() - lbl.width()) // 2
+                log.warning("⚠️ ไม่สามารถหาตำแหน่งเชฟ: %s", e)
+                x = self.width() // 2
                 y = 50
 
-            # Ensure label stays within window bounds and on top
-            x = max(10, min(x, self.width() - lbl.width() - 10))
-            y = max(10, y)
-            lbl.move(x, y)
-            lbl.raise_()
-            lbl.show()
-
-            # Create opacity animation
-            effect = QtWidgets.QGraphicsOpacityEffect(lbl)
-            lbl.setGraphicsEffect(effect)
-            
-            fade_anim = QtCore.QPropertyAnimation(effect, b"opacity")
-            fade_anim.setStartValue(1.0)
-            fade_anim.setEndValue(0.0)
-            fade_anim.setDuration(duration)
-
-            # Create movement animation
-            move_anim = QtCore.QPropertyAnimation(lbl, b"pos")
-            move_anim.setStartValue(lbl.pos())
-            move_anim.setEndValue(QtCore.QPoint(x, y - 40))  # Move up more
-            move_anim.setDuration(duration)
-
-            # Create animation group
-            group = QtCore.QParallelAnimationGroup(lbl)
-            group.addAnimation(fade_anim)
-            group.addAnimation(move_anim)
-
-            # Keep reference and start
-            lbl._anim_group = group
-            group.start(QtCore.QAbstractAnimation.DeleteWhenStopped)
-
-            # Delete label after animation plus small delay
-            QtCore.QTimer.singleShot(duration + 100, lbl.deleteLater)
-            
-            print(f"✅ สร้าง toast สำเร็จ")
-            
+            self.toast_layer.push(message, duration, QtCore.QPoint(x, y))
         except Exception as e:
-            print(f"❌ ไม่สามารถสร้าง toast ได้: {e}")
+            log.warning("❌ ไม่สามารถสร้าง toast ได้: %s", e)
+
+
+class _Toast(object):
+    __slots__ = ("text", "count", "duration", "anchor", "start", "size")
+
+    def __init__(self, text, duration, anchor):
+        self.text = text
+        self.count = 1
+        self.duration = duration
+        self.anchor = anchor
+        self.start = None  # เริ่มนับเวลาเมื่อได้ขึ้นจอจริง
+        self.size = None
+
+
+class ToastLayer(QtWidgets.QWidget):
+    """
+    ชั้นแสดง toast ทั้งหมดของ GamePage ใน widget เดียว (วาดใน paintEvent ครั้งเดียว)
+    - ข้อความเดียวกันที่มาติด ๆ กันจะรวมเป็นอันเดียว (แสดง ×2, ×3, ...)
+    - แสดงพร้อมกันได้ไม่เกิน MAX_VISIBLE อันที่เหลือรอคิว (คิวมีขนาดจำกัด)
+    - คิวเต็ม → ทิ้งอันที่รอนานที่สุดที่ยังไม่ขึ้นจอ (อันที่กำลังแสดงอยู่ได้จางหายจนจบเสมอ)
+    """
+    MAX_VISIBLE = 3
+    QUEUE_LIMIT = 12
+    MERGE_WINDOW_MS = 800
+    FRAME_MS = 33
+    RISE_PX = 40
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setAttribute(QtCore.Qt.WA_TransparentForMouseEvents)
+        self.setAttribute(QtCore.Qt.WA_NoSystemBackground)
+
+        self.toasts = collections.deque()
+        self.merged = 0
+        self.dropped = 0
+
+        self.font = QtGui.QFont("Arial")
+        self.font.setPixelSize(16)
+        self.font.setBold(True)
+        self.metrics = QtGui.QFontMetrics(self.font)
+
+        self.timer = QtCore.QTimer(self)
+        self.timer.setInterval(self.FRAME_MS)
+        self.timer.timeout.connect(self._tick)
+        self.clock = QtCore.QElapsedTimer()
+        self.clock.start()
+
+    def _label(self, toast):
+        return toast.text if toast.count == 1 else f"{toast.text}  ×{toast.count}"
+
+    def _measure(self, toast):
+        rect = self.metrics.boundingRect(self._label(toast))
+        toast.size = QtCore.QSize(rect.width() + 28, rect.height() + 20)
+
+    def push(self, message, duration=3000, anchor=None):
+        now = self.clock.elapsed()
+        for toast in self.toasts:
+            if toast.text == message and (toast.start is None or now - toast.start <= self.MERGE_WINDOW_MS):
+                toast.count += 1
+                toast.duration = max(toast.duration, duration)
+                if toast.start is not None:
+                    toast.start = now
+                toast.anchor = anchor or toast.anchor
+                self._measure(toast)
+                self.merged += 1
+                self.update()
+                return toast
+
+        toast = _Toast(message, duration, anchor or QtCore.QPoint(self.width() // 2, 50))
+        self._measure(toast)
+        self.toasts.append(toast)
+        self._promote(now)
+        self._trim()
+        self.raise_()
+        if not self.timer.isActive():
+            self.timer.start()
+        self.update()
+        return toast
+
+    def _promote(self, now):
+        for i, toast in enumerate(self.toasts):
+            if i >= self.MAX_VISIBLE:
+                break
+            if toast.start is None:
+                toast.start = now
+
+    def _trim(self):
+        while len(self.toasts) > self.QUEUE_LIMIT:
+            waiting = next((t for t in self.toasts if t.start is None), None)
+            if waiting is None:
+                break
+            self.toasts.remove(waiting)
+            self.dropped += 1
+
+    def _tick(self):
+        now = self.clock.elapsed()
+        for toast in [t for t in self.toasts if t.start is not None and now - t.start >= t.duration]:
+            self.toasts.remove(toast)
+        self._promote(now)
+        if not self.toasts:
+            self.timer.stop()
+        self.update()
+
+    def paintEvent(self, event):
+        if not self.toasts:
+            return
+        now = self.clock.elapsed()
+        painter = QtGui.QPainter(self)
+        painter.setRenderHint(QtGui.QPainter.Antialiasing)
+        painter.setFont(self.font)
+        pen = QtGui.QPen(QtGui.QColor("white"), 2)
+        fill = QtGui.QColor(0, 0, 0, 200)
+
+        stack_y = None
+        for i, toast in enumerate(self.toasts):
+            if i >= self.MAX_VISIBLE or toast.start is None:
+                break
+            progress = min(1.0, (now - toast.start) / float(max(1, toast.duration)))
+            w, h = toast.size.width(), toast.size.height()
+
+            x = toast.anchor.x() - w // 2
+            y = toast.anchor.y() - int(self.RISE_PX * progress)
+            # toast ที่ซ้อนกันเลื่อนขึ้นไปเรื่อย ๆ ไม่ให้ทับกัน
+            if stack_y is not None:
+                y = min(y, stack_y - h - 4)
+            x = max(10, min(x, self.width() - w - 10))
+            y = max(10, y)
+            stack_y = y
+
+            painter.setOpacity(1.0 - progress)
+            rect = QtCore.QRectF(x, y, w, h)
+            painter.setPen(pen)
+            painter.setBrush(fill)
+            painter.drawRoundedRect(rect, 8, 8)
+            painter.drawText(rect, QtCore.Qt.AlignCenter, self._label(toast))
+        painter.end()
+
+    def stats(self):
+        return {
+            "queued": len(self.toasts),
+            "visible": min(len(self.toasts), self.MAX_VISIBLE),
+            "merged": self.merged,
+            "dropped": self.dropped,
+        }
+
+
+class LazyStackedWidget(QtWidgets.QStackedWidget):
+    """
+    QStackedWidget ที่สร้างหน้าจริงตอนถูกเปิดครั้งแรก (ใช้ placeholder แทนจนกว่าจะถูกเรียก)
+    หน้าที่ลงทะเบียนเป็น disposable จะถูกลบทิ้งเมื่อผู้เล่นเปลี่ยนไปหน้าอื่น
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._factories = []
+        self._disposable = set()
+        self._built = set()
+        self._swapping = False
+        self.currentChanged.connect(self._on_current_changed)
+
+    def register_page(self, factory, disposable=False):
+        index = self.addWidget(QtWidgets.QWidget())
+        self._factories.append(factory)
+        if disposable:
+            self._disposable.add(index)
+        return index
+
+    def is_built(self, index):
+        return index in self._built
+
+    def page(self, index):
+        """คืนหน้าที่ index (สร้างจาก factory ถ้ายังไม่มี)"""
+        if index not in self._built and 0 <= index < len(self._factories):
+            self._replace(index, self._factories[index](self))
+            self._built.add(index)
+        return self.widget(index)
+
+    def setCurrentIndex(self, index):
+        self.page(index)
+        super().setCurrentIndex(index)
+
+    def _replace(self, index, new_widget):
+        old = self.widget(index)
+        was_current = self.currentIndex() == index
+        self._swapping = True
+        try:
+            self.removeWidget(old)
+            self.insertWidget(index, new_widget)
+            if was_current:
+                super().setCurrentIndex(index)
+        finally:
+            self._swapping = False
+        old.deleteLater()
+
+    def _on_current_changed(self, index):
+        if self._swapping:
+            return
+        # ลบหน้าที่ใช้ครั้งเดียว (เช่น How to play) เมื่อออกจากหน้านั้น
+        for other in list(self._built):
+            if other != index and other in self._disposable:
+                self._built.discard(other)
+                self._replace(other, QtWidgets.QWidget())
+
+
+# หน้าในเกมตามลำดับ index ของ stacked widget: (factory, ลบทิ้งเมื่อออกจากหน้า)
+PAGE_FACTORIES = [
+    (lambda stacked: GameMenu(stacked), False),        # 0
+    (lambda stacked: HowToPlayPage1(stacked), True),   # 1
+    (lambda stacked: GamePage(stacked), False),        # 2
+    (lambda stacked: HowToPlayPage2(stacked), True),   # 3
+    (lambda stacked: HowToPlayPage3(stacked), True),   # 4
+]
+
 
 class WellDoneGame(QtWidgets.QMainWindow):
     def __init__(self, parent=None):
@@ -1098,20 +1181,28 @@ class WellDoneGame(QtWidgets.QMainWindow):
         self.setWindowTitle("Well Done! 🧑‍🍳")
         self.resize(1200, 675)  
 
-        self.stacked = QtWidgets.QStackedWidget()
-        self.page1 = GameMenu(self.stacked)
-        self.page2 = HowToPlayPage1(self.stacked)
-        self.page3 = GamePage(self.stacked)
-        self.page4 = HowToPlayPage2(self.stacked)
-        self.page5 = HowToPlayPage3(self.stacked)
-
-        self.stacked.addWidget(self.page1)
-        self.stacked.addWidget(self.page2)
-        self.stacked.addWidget(self.page3)
-        self.stacked.addWidget(self.page4)
-        self.stacked.addWidget(self.page5)
+        # เวลาเริ่มต้น (run() จะตั้งค่าใหม่ให้ตรงกับตอนกดเปิดเกม) ใช้วัดเวลาจนถึง paint แรก
+        self.startup_t0 = time.perf_counter()
+        self.first_paint_ms = None
+
+        # เริ่ม decode พื้นหลังใหญ่ใน thread แยก แล้ว decode sprite atlas ระหว่างรอ
+        wdasset.prefetch(BACKGROUND_IMAGES)
+        wdasset.preload_atlas()
+
+        # สร้างเฉพาะเมนูหลักก่อน หน้าอื่น (รวมถึง GamePage ที่มี timer) สร้างตอนถูกเปิด
+        self.stacked = LazyStackedWidget()
+        for factory, disposable in PAGE_FACTORIES:
+            self.stacked.register_page(factory, disposable=disposable)
+        self.stacked.setCurrentIndex(0)
+        self.page1 = self.stacked.widget(0)
         self.setCentralWidget(self.stacked)
 
+    def paintEvent(self, event):
+        if self.first_paint_ms is None:
+            self.first_paint_ms = (time.perf_counter() - self.startup_t0) * 1000.0
+            log.info("⏱️ run() → first paint: %.1f ms", self.first_paint_ms)
+        super().paintEvent(event)
+
 
 def run():
     global ui
@@ -1121,6 +1212,10 @@ def run():
     except:
         pass
 
-    ptr = wrapInstance(int(omui.MQtUtil.mainWindow()), QtWidgets.QWidget)
-    ui = WellDoneGame(parent=ptr)
-    ui.show()
\ No newline at end of file
+    t0 = time.perf_counter()
+    # ใน Maya เป็นลูกของหน้าต่าง Maya, นอก Maya (LocalBackend) เป็นหน้าต่างเดี่ยว
+    parent = wdbackend.get_backend().main_window()
+    ui = WellDoneGame(parent=parent)
+    ui.startup_t0 = t0
+    ui.show()
+    return ui
\ No newline at end of file